@@ -25,6 +25,11 @@ def run_with_error_handling():
             if 'DISPLAY' not in os.environ:
                 os.environ['DISPLAY'] = ':0'
 
+        if sys.argv[1:2] == ['ctl']:
+            # Talk to the running instance without loading the GUI
+            from gitfitdev.control import main as ctl_main
+            sys.exit(ctl_main(sys.argv[2:]))
+
         from gitfitdev.app import main
         main()
     except Exception as e:
@@ -41,6 +46,15 @@ def run_with_error_handling():
             f.write(f"Traceback:\n")
             f.write(traceback.format_exc())
 
+            # Main-loop stalls recorded before the crash
+            try:
+                from gitfitdev.watchdog import recent_reports
+                for report in recent_reports(3):
+                    f.write("\n" + "=" * 60 + "\n")
+                    f.write(report)
+            except Exception:
+                pass
+
         # On macOS, also try to show a dialog
         if platform.system() == 'Darwin':
             try:
@@ -1,10 +1,12 @@
-# Try PyQt5 version first, fallback to tkinter if needed
-try:
-    from .app_pyqt import main
-    print("Running PyQt5 version with full video support...")
-except ImportError:
-    print("PyQt5 not available, using tkinter version...")
-    from .app import main
+import sys
+
+# The control client must not pay for the GUI imports
+if sys.argv[1:2] == ["ctl"]:
+    from .control import main as ctl_main
+    sys.exit(ctl_main(sys.argv[2:]))
+
+# The Tk app; the PyQt5 version is started with `python -m gitfitdev.app_pyqt`
+from .app import main
 
 if __name__ == "__main__":
     main()
@@ -5,12 +5,16 @@ import time as _time
 import subprocess
 import platform
 import random
-import math
 import atexit
 import socket
 from datetime import datetime, timedelta, time
 import logging
 
+# Start of the time-to-tray measurement (logged, and read by bench.py's startup benchmark)
+_STARTED_AT = _time.perf_counter()
+STARTUP_PROBE_ENV = "GITFITDEV_STARTUP_PROBE"
+STARTUP_BUCKETS = (250, 500, 1000, 1500, 2000, 3000, 5000, 10000)
+
 # Set up logging
 log_dir = os.path.expanduser('~/.gitfitdev')
 if not os.path.exists(log_dir):
@@ -42,8 +46,38 @@ if sys.platform.startswith("win"):
     ERROR_ALREADY_EXISTS = 183
 
 
+try:
+    import tkinter as tk
+    from tkinter import messagebox
+except Exception as e:
+    print("Tkinter is required. Please install the Tk package for your OS.")
+    raise
+
+
+def _import_tray_deps():
+    global pystray, Image, ImageDraw, ImageTk
+    try:
+        import pystray
+        from PIL import Image, ImageDraw, ImageTk
+    except Exception:
+        pystray = None
+        Image = None
+        ImageDraw = None
+        ImageTk = None
+
+
+_import_tray_deps()
+
+
 # --- Bootstrap optional dependencies (pystray, Pillow) ---
 def _ensure_deps():
+    """Try once to pip-install missing tray dependencies (source installs only).
+
+    Runs from main(), never on import; a failed attempt is remembered so
+    later launches do not wait for pip again.
+    """
+    if pystray is not None or getattr(sys, 'frozen', False):
+        return
     need = []
     try:
         import pystray  # noqa: F401
@@ -57,43 +91,36 @@ def _ensure_deps():
     if not need:
         return
 
+    marker = os.path.join(log_dir, "deps_install_attempted")
+    if os.path.exists(marker):
+        return
     try:
+        with open(marker, "w") as f:
+            f.write(" ".join(need))
         print("Installing missing packages:", need)
         subprocess.check_call([sys.executable, "-m", "pip", "install", "--user", *need])
+        _import_tray_deps()
     except Exception as e:
         print("Auto-install failed:", e)
-        # Continue; import will fail and we exit gracefully later
+        # Continue; the app runs without a tray icon
 
 
-_ensure_deps()
-
-try:
-    import tkinter as tk
-    from tkinter import messagebox
-except Exception as e:
-    print("Tkinter is required. Please install the Tk package for your OS.")
-    raise
-
-try:
-    import pystray
-    from PIL import Image, ImageDraw, ImageTk
-except Exception:
-    pystray = None
-    Image = None
-    ImageDraw = None
-    ImageTk = None
-
-from .config import load_settings, save_settings, Settings
+# Only what the tray and the scheduler need is imported here. The phrase
+# model (tiny_lm and the exercise catalog), control channel, status outputs,
+# stall watchdog and version check start after the tray icon is up
+# (_start_deferred_services); windows import their modules when first opened.
+from .config import get_settings_store, load_settings, save_settings, Settings, SettingsWriter
 from .branding import APP_NAME
-from .tiny_lm import TinyPhraseLM
 from .themes import get_theme, THEMES
-from .toast import ToastNotification
-from .trigger_utils import calculate_next_trigger_time
-from .body_map import get_body_map, get_daily_report
-from .body_map_window import BodyMapWindow
+from .break_calendar import get_break_calendar
+from .clock import get_clock
+from .core import ActiveWindowChanged, BreakDue, PreWarning, ScheduleChanged, SchedulingEngine
+from .events import TrackerChanged, get_event_bus, get_tk_batcher
+from .metrics import get_metrics
+from .monitors import get_monitors, get_topology, primary_monitor
+from .tracing import get_tracer, locked, span, traced
+from .prefetch import BreakPrefetcher, FIRE_TO_MAPPED, FIRE_TO_MAPPED_BUDGET_MS, body_snapshot, funny_esc_message, message_emoji
 from .translations import get_translation, get_available_languages, get_language_display_name
-from .version_checker import VersionChecker
-from .disclaimer_text import get_disclaimer_text
 from .version import __version__, __github_repo__, __github_api_releases__
 
 
@@ -171,6 +198,7 @@ class DisclaimerDialog:
         scrollbar.config(command=self.text_widget.yview)
 
         # Insert disclaimer text
+        from .disclaimer_text import get_disclaimer_text
         disclaimer_text = get_disclaimer_text(self.language)
 
         self.text_widget.config(state=tk.NORMAL)
@@ -248,7 +276,7 @@ class DisclaimerDialog:
 
 
 # --- Icon generation ---
-def _dumbbell_icon(size: int = 64) -> Image.Image:
+def _dumbbell_icon(size: int = 64) -> "Image.Image":
     img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
     d = ImageDraw.Draw(img)
     # Simple dumbbell: two squares + bar
@@ -263,9 +291,434 @@ def _dumbbell_icon(size: int = 64) -> Image.Image:
     return img
 
 
+# --- Overlay window pool ---
+class OverlayShell:
+    """One monitor's break window holding every widget an overlay can show.
+
+    Built withdrawn once; each break fills it in with configure() and packs
+    only the sections that apply, instead of creating and destroying dozens
+    of widgets per break.
+    """
+
+    MAX_MUSCLE_ROWS = 5
+
+    def __init__(self, pool: "OverlayPool", rect, theme_id: str):
+        self.rect = tuple(rect)
+        self.theme_id = theme_id
+        self.theme = theme = get_theme(theme_id)
+        bg = theme.background
+        x, y, width, height = self.rect
+
+        win = tk.Toplevel(pool.root)
+        win.withdraw()
+        win.title(APP_NAME)
+        win.attributes("-topmost", True)
+        win.overrideredirect(True)
+        win.geometry(f"{width}x{height}+{x}+{y}")
+        win.configure(bg=bg)
+        self.win = win
+        self.screen_width = width  # This monitor, not the whole (possibly multi-head) X screen
+
+        self.container = tk.Frame(win, bg=bg)
+        self.container.pack(expand=True)
+        container = self.container
+
+        # Title (structured) or the whole message (legacy)
+        self.title = tk.Label(container, fg=theme.text_primary, bg=bg)
+
+        # Single activity (for short breaks or user preference) with a border
+        self.single_border = tk.Frame(container, bg=theme.accent,
+                                      highlightbackground=theme.accent,
+                                      highlightthickness=2, bd=2)
+        single_frame = tk.Frame(self.single_border, bg=bg)
+        single_frame.pack(padx=20, pady=15)
+        self.single_text = tk.Label(single_frame, font=("Segoe UI", 24),
+                                    fg=theme.text_primary, bg=bg,
+                                    wraplength=int(self.screen_width * 0.6))
+        self.single_text.pack()
+
+        # Dual activity (for longer breaks with "both" preference)
+        self.stretch_border, self.stretch_header, self.stretch_text = self._activity_section(theme.accent)
+        self.exercise_border, self.exercise_header, self.exercise_text = self._activity_section(theme.accent_secondary)
+
+        self.motivation = tk.Label(container, font=("Segoe UI", 18, "italic"),
+                                   fg=theme.text_secondary, bg=bg,
+                                   wraplength=int(self.screen_width * 0.7))
+
+        # Body map: progress title and the most worked muscles as mini bars
+        self.body_frame = tk.Frame(container, bg=bg)
+        self.body_title = tk.Label(self.body_frame, font=("Segoe UI", 16, "bold"),
+                                   fg=theme.accent, bg=bg)
+        self.body_title.pack()
+        self.muscle_display = tk.Frame(self.body_frame, bg=bg)
+        self.muscle_rows = []
+        for _ in range(self.MAX_MUSCLE_ROWS):
+            row = tk.Frame(self.muscle_display, bg=bg)
+            name_label = tk.Label(row, font=("Segoe UI", 11), fg=theme.text_secondary,
+                                  bg=bg, width=15, anchor='e')
+            name_label.pack(side=tk.LEFT, padx=(0, 5))
+            bar_label = tk.Label(row, font=("Segoe UI", 11), fg=theme.accent_secondary,
+                                 bg=bg, anchor='w')
+            bar_label.pack(side=tk.LEFT)
+            self.muscle_rows.append((row, name_label, bar_label))
+        self.rec_label = tk.Label(container, font=("Segoe UI", 12, "italic"),
+                                  fg=theme.accent, bg=bg,
+                                  wraplength=int(self.screen_width * 0.7))
+
+        self.emoji_label = tk.Label(container, font=("Segoe UI Emoji", 72),
+                                    fg=theme.text_primary, bg=bg)
+        self.count_label = tk.Label(container, textvariable=pool.count_var, bg=bg)
+
+        # Progress bar: a fixed outer frame and an inner bar that shrinks
+        self.progress_container = tk.Frame(container, bg=bg)
+        bar_width = min(600, int(self.screen_width * 0.5))
+        progress_outer = tk.Frame(self.progress_container, bg=Overlay._darken_color(bg),
+                                  height=30, width=bar_width)
+        progress_outer.pack()
+        progress_outer.pack_propagate(False)
+        self.progress_width = bar_width - 2
+        self.progress_bar = tk.Frame(progress_outer, height=28, width=self.progress_width)
+        self.progress_bar.place(x=1, y=1)
+
+        self.sub_msg = tk.Label(container, textvariable=pool.sub_msg_var, font=("Segoe UI", 18),
+                                fg=theme.text_secondary, bg=bg)
+
+        # Funny ESC instruction at the bottom
+        self.esc_frame = tk.Frame(container, bg=bg)
+        self.esc_label = tk.Label(self.esc_frame, font=("Segoe UI", 14, "italic"),
+                                  fg=theme.text_secondary, bg=bg,
+                                  wraplength=int(self.screen_width * 0.6))
+        self.esc_label.pack(pady=10)
+
+        # Reminder message on input (but don't lock input); ESC is bound globally by the pool
+        win.bind("<Button-1>", pool._on_user_input, add="+")
+        win.bind("<Key>", pool._on_user_input, add="+")  # Any key press
+        win.bind("<Map>", pool._on_map, add="+")
+
+    def _activity_section(self, color: str):
+        """A bordered header + text section; returns (border, header, text)."""
+        bg = self.theme.background
+        border = tk.Frame(self.container, bg=color, highlightbackground=color,
+                          highlightthickness=2, bd=2)
+        frame = tk.Frame(border, bg=bg)
+        frame.pack(padx=15, pady=10)
+        header = tk.Label(frame, font=("Segoe UI", 24, "bold"), fg=color, bg=bg)
+        header.pack()
+        text = tk.Label(frame, font=("Segoe UI", 20), fg=self.theme.text_primary, bg=bg,
+                        wraplength=int(self.screen_width * 0.6))
+        text.pack(pady=(5, 0))
+        return border, header, text
+
+    def exists(self) -> bool:
+        try:
+            return bool(self.win.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def destroy(self):
+        try:
+            self.win.destroy()
+        except tk.TclError:
+            pass
+
+    def show(self, overlay: "Overlay", esc_message: str):
+        """Fill in the overlay's content and put the window on screen."""
+        message = overlay.message_dict
+        for child in self.container.pack_slaves():
+            child.pack_forget()
+
+        if overlay.is_structured:
+            self.title.configure(text=message['title'], font=("Segoe UI", 32, "bold"), wraplength=0)
+            self.title.pack(pady=(20, 30))
+            if 'single_activity' in message:
+                self.single_text.configure(text=message['single_activity'])
+                self.single_border.pack(pady=20, padx=40)
+            else:
+                self.stretch_header.configure(text=message['stretch_header'])
+                self.stretch_text.configure(text=message['stretch_text'])
+                self.exercise_header.configure(text=message['exercise_header'])
+                self.exercise_text.configure(text=message['exercise_text'])
+                self.stretch_border.pack(pady=10, padx=40)
+                self.exercise_border.pack(pady=10, padx=40)
+            self.motivation.configure(text=message['motivation'])
+            self.motivation.pack(pady=(15, 20))
+        else:
+            # Legacy single message display
+            self.title.configure(text=message['title'], font=("Segoe UI", 28, "bold"),
+                                 wraplength=int(self.screen_width * 0.8))
+            self.title.pack(pady=20)
+
+        body = overlay.body
+        if body is not None:
+            self.body_title.configure(text=body.progress_text)
+            self.muscle_display.pack_forget()
+            for row, _, _ in self.muscle_rows:
+                row.pack_forget()
+            for (row, name_label, bar_label), (name, count) in zip(self.muscle_rows, body.top_muscles):
+                name_label.configure(text=f"{name}:")
+                # Visual bar (using characters)
+                bar_label.configure(text=f"{'■' * min(count * 2, 20)} ({count}x)")
+                row.pack()
+            if body.top_muscles:
+                self.muscle_display.pack(pady=5)
+            self.body_frame.pack(pady=(10, 5))
+            if body.recommendation:
+                self.rec_label.configure(text=body.recommendation)
+                self.rec_label.pack(pady=(0, 10))
+
+        self.emoji_label.configure(text=overlay.exercise_emoji)
+        self.emoji_label.pack(pady=10)
+
+        color = overlay._get_current_activity_color()
+        count_font = ("Segoe UI", 48, "bold") if overlay.flash_mode else ("Segoe UI", 72, "bold")
+        self.count_label.configure(font=count_font, fg=color)
+        self.count_label.pack(pady=10)
+        if not overlay.flash_mode:
+            self.progress_bar.configure(bg=color, width=self.progress_width)
+            self.progress_container.pack(pady=(10, 20))
+        self.sub_msg.pack(pady=10)
+        self.esc_label.configure(text=esc_message)
+        self.esc_frame.pack(pady=30)
+
+        self.win.deiconify()
+        self.win.attributes("-topmost", True)
+        self.win.lift()
+        # Make window focusable for ESC to work
+        self.win.focus_set()
+        self.win.focus_force()
+
+    def update_countdown(self, overlay: "Overlay"):
+        """Recolour the countdown and shrink the progress bar; the text follows count_var."""
+        color = overlay._get_current_activity_color()
+        self.count_label.configure(fg=color)
+        if not overlay.flash_mode:
+            width = max(1, int(self.progress_width * overlay.remaining / overlay.seconds))
+            self.progress_bar.configure(width=width, bg=color)
+
+    def hide(self):
+        try:
+            self.win.withdraw()
+        except tk.TclError:
+            pass
+
+
+class ImageOverlayShell:
+    """One monitor's break window showing a Pillow-rendered frame.
+
+    The static content is drawn off the Tk thread by overlay_render; the window
+    holds one full-screen image and, on top of it, the small countdown strip
+    that is repainted every tick.
+    """
+
+    FRAME_POLL_MS = 10
+
+    def __init__(self, pool: "OverlayPool", rect, theme_id: str):
+        from .overlay_render import get_frame_renderer
+
+        self.rect = tuple(rect)
+        self.theme_id = theme_id
+        self.renderer = get_frame_renderer()
+        bg = get_theme(theme_id).background
+        x, y, width, height = self.rect
+
+        win = tk.Toplevel(pool.root)
+        win.withdraw()
+        win.title(APP_NAME)
+        win.attributes("-topmost", True)
+        win.overrideredirect(True)
+        win.geometry(f"{width}x{height}+{x}+{y}")
+        win.configure(bg=bg)
+        self.win = win
+
+        self.frame_label = tk.Label(win, bd=0, highlightthickness=0, bg=bg)
+        self.frame_label.place(x=0, y=0, relwidth=1, relheight=1)
+        self.strip_label = tk.Label(win, bd=0, highlightthickness=0, bg=bg)
+        self._overlay = None
+        self._spec = None
+        self._frame = None
+        self._photo = None
+        self._strip_photo = None
+
+        win.bind("<Button-1>", pool._on_user_input, add="+")
+        win.bind("<Key>", pool._on_user_input, add="+")
+        win.bind("<Map>", pool._on_map, add="+")
+
+    def exists(self) -> bool:
+        try:
+            return bool(self.win.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def destroy(self):
+        self._overlay = None
+        try:
+            self.win.destroy()
+        except tk.TclError:
+            pass
+
+    def show(self, overlay: "Overlay", esc_message: str):
+        """Request the frame for this break and put the window on screen."""
+        from .overlay_render import FrameSpec
+
+        self._overlay = overlay
+        self._spec = FrameSpec.from_content(overlay.message_dict if overlay.is_structured else overlay.message_dict['title'],
+                                            overlay.body, overlay.exercise_emoji, esc_message,
+                                            self.theme_id, overlay.flash_mode)
+        self._frame = None
+        self.strip_label.place_forget()
+        self.frame_label.configure(image="")
+        self._photo = self._strip_photo = None
+        self._wait_for_frame(self.renderer.submit(self._spec, self.rect[2:]), self._spec)
+
+        self.win.deiconify()
+        self.win.attributes("-topmost", True)
+        self.win.lift()
+        # Make window focusable for ESC to work
+        self.win.focus_set()
+        self.win.focus_force()
+
+    def _wait_for_frame(self, future, spec):
+        if spec is not self._spec or self._overlay is None:
+            return  # The break ended or another one took the window
+        if not future.done():
+            self.win.after(self.FRAME_POLL_MS, lambda: self._wait_for_frame(future, spec))
+            return
+        try:
+            frame = future.result()
+        except Exception as e:
+            logging.error(f"[Overlay] Frame render failed: {e}")
+            return
+        self._frame = frame
+        self._photo = ImageTk.PhotoImage(frame.image)
+        self.frame_label.configure(image=self._photo)
+        left, top, right, bottom = frame.countdown_box
+        self._strip_photo = ImageTk.PhotoImage("RGB", (right - left, bottom - top))
+        self.strip_label.configure(image=self._strip_photo)
+        self.strip_label.place(x=left, y=top)
+        self.update_countdown(self._overlay)
+
+    def update_countdown(self, overlay: "Overlay"):
+        """Repaint the countdown strip; only this small image changes per tick."""
+        from .overlay_render import render_countdown
+
+        if self._frame is None:
+            return  # Drawn as soon as the frame arrives
+        strip = render_countdown(self._frame, self._spec, overlay.count_var.get(),
+                                 overlay.remaining / overlay.seconds,
+                                 overlay._get_current_activity_color(), overlay.sub_msg_var.get())
+        self._strip_photo.paste(strip)
+
+    def hide(self):
+        self._overlay = None
+        try:
+            self.win.withdraw()
+        except tk.TclError:
+            pass
+
+
+def image_overlay_available() -> bool:
+    """Whether the Pillow overlay renderer can be used."""
+    from .overlay_render import available
+
+    return ImageTk is not None and available()
+
+
+class OverlayPool:
+    """Break overlay windows kept withdrawn between breaks.
+
+    One shell per monitor, created on first use (or ahead of time by
+    prepare()) and reused by every break. Shells are rebuilt when the theme
+    changes; when the monitor layout changes, shells for monitors that are
+    gone are destroyed and new monitors get new shells.
+    """
+
+    def __init__(self, root: tk.Tk):
+        self.root = root
+        self.shells: list = []
+        self.active = None  # The Overlay currently using the windows
+        self._theme_id = None
+        self._shell_class = OverlayShell
+        self.count_var = tk.StringVar(root)
+        self.sub_msg_var = tk.StringVar(root)
+
+        # Emergency exit works even if the overlay doesn't have focus
+        for sequence in ("<Escape>", "<Control-c>", "<Control-q>", "<Alt-F4>"):
+            root.bind_all(sequence, self._on_escape, add="+")
+
+    def prepare(self, monitors, theme_id: str, renderer: str = "widgets") -> list:
+        """Make sure there is a shell for each monitor, built for the theme and renderer."""
+        shell_class = OverlayShell
+        if renderer == "image":
+            if image_overlay_available():
+                shell_class = ImageOverlayShell
+            else:
+                logging.info("[Overlay] Pillow is not available; using the widget renderer")
+        if theme_id != self._theme_id or shell_class is not self._shell_class:
+            for shell in self.shells:
+                shell.destroy()
+            self.shells = []
+            self._theme_id = theme_id
+            self._shell_class = shell_class
+
+        spare = [shell for shell in self.shells if shell.exists()]
+        shells = []
+        for rect in monitors:
+            rect = tuple(rect)
+            match = next((shell for shell in spare if shell.rect == rect), None)
+            if match is None:
+                match = shell_class(self, rect, theme_id)
+            else:
+                spare.remove(match)
+            shells.append(match)
+        for shell in spare:
+            shell.destroy()
+        self.shells = shells
+        return shells
+
+    def acquire(self, overlay: "Overlay", monitors, theme_id: str, renderer: str = "widgets") -> list:
+        if self.active is not None:
+            # The break still on screen ends as escaped, as if dismissed, so it is not left without an outcome
+            logging.info("[Overlay] Replacing the break still on screen")
+            self.active._dismiss_early()
+        shells = self.prepare(monitors, theme_id, renderer)
+        self.active = overlay
+        return shells
+
+    def release(self, overlay: "Overlay"):
+        if self.active is overlay:
+            self.active = None
+            for shell in self.shells:
+                shell.hide()
+
+    def _on_escape(self, event=None):
+        if self.active is not None:
+            self.active._dismiss_early()
+
+    def _on_user_input(self, event=None):
+        if self.active is not None:
+            self.active._on_user_input(event)
+
+    def _on_map(self, event=None):
+        if self.active is not None:
+            self.active._handle_first_map()
+
+
+_overlay_pools = {}
+
+
+def get_overlay_pool(root: tk.Tk) -> OverlayPool:
+    """The overlay window pool for a Tk root."""
+    pool = _overlay_pools.get(id(root))
+    if pool is None or pool.root is not root:
+        pool = _overlay_pools[id(root)] = OverlayPool(root)
+    return pool
+
+
 # --- Overlay Window ---
 class Overlay:
-    def __init__(self, root: tk.Tk, message, seconds: int, dismiss_text: str, on_done, theme_id: str = "green", flash_mode: bool = False, count_break: bool = True, language: str = "en"):
+    @traced("overlay.init")
+    def __init__(self, root: tk.Tk, message, seconds: int, dismiss_text: str, on_done, theme_id: str = "green", flash_mode: bool = False, count_break: bool = True, language: str = "en",
+                 body=None, emoji: str = None, esc_message: str = None, on_mapped=None):
         self.root = root
         self.seconds = max(1, int(seconds))
         self.remaining = self.seconds
@@ -275,10 +728,9 @@ class Overlay:
         self.dismiss_text = dismiss_text
         self.theme = get_theme(theme_id)
         self.flash_mode = flash_mode  # If true, show duration instead of countdown
-        self.progress_bars = []  # Store progress bars for all windows
-        self.countdown_labels = []  # Store countdown labels for color updates
         self.count_break = count_break  # Whether to count this as a real break
-        self.start_time = _time.time()  # Track real start time for drift correction
+        self._clock = get_clock()
+        self.start_time = self._clock.monotonic()  # Monotonic start, immune to wall-clock changes
         self.language = language  # Language for translations
         self.current_activity = None  # Track current activity (stretch/exercise)
         self.activity_switch_time = None  # When to switch activities
@@ -306,335 +758,59 @@ class Overlay:
             # Note: break_shown is already recorded in generate_combined_message
             self.was_escaped = False  # Track if user escaped early
 
-        # Create a fullscreen overlay on each monitor
-        for i, (x, y, width, height) in enumerate(monitors):
-            win = tk.Toplevel(root)
-            win.title(APP_NAME)
-            win.attributes("-topmost", True)
-            win.overrideredirect(True)
-            win.geometry(f"{width}x{height}+{x}+{y}")
-            win.configure(bg=self.theme.background)
-
-            if i == 0:  # Primary monitor gets focus
-                win.focus_force()
-                # REMOVED grab_set() - it locks the entire system!
-                # win.grab_set()  # DO NOT USE - causes system lockout
-                self.win = win  # Keep reference for compatibility
-
-            self.windows.append(win)
-
-        # Create UI elements on all windows
+        # Pooled fullscreen windows, one per monitor
+        self._finished = False
+        self._pool = get_overlay_pool(root)
+        from .config import get_settings
+        renderer = getattr(get_settings(), 'overlay_renderer', 'widgets')
+        with span("overlay.acquire_windows", monitors=len(monitors)):
+            shells = self._pool.acquire(self, monitors, theme_id, renderer)
+        self._shells = shells
+        self.windows = [shell.win for shell in shells]
+        self.win = self.windows[0]  # Primary monitor; kept for compatibility
+
+        self.count_var = self._pool.count_var
         if self.flash_mode:
             # In flash mode, show the total duration instead of countdown
             # Use overlay_seconds_left translation for countdown display
             duration_text = f"{self.seconds} {get_translation('overlay_seconds_left', self.language)}"
-            self.count_var = tk.StringVar(value=duration_text)
+            self.count_var.set(duration_text)
         else:
-            self.count_var = tk.StringVar(value=str(self.remaining))
-        self.sub_msg_var = tk.StringVar(value="")
+            self.count_var.set(str(self.remaining))
+        self.sub_msg_var = self._pool.sub_msg_var
+        self.sub_msg_var.set("")
 
-        # Get exercise emoji based on message
-        if self.is_structured:
-            self.exercise_emoji = self._get_exercise_emoji(
-                self.message_dict.get('stretch_text', '') + ' ' +
-                self.message_dict.get('exercise_text', '')
-            )
-        else:
-            self.exercise_emoji = self._get_exercise_emoji(self.message_dict['title'])
-
-        for win in self.windows:
-            container = tk.Frame(win, bg=self.theme.background)
-            container.pack(expand=True)
-
-            if self.is_structured:
-                # Title
-                title = tk.Label(container, text=self.message_dict['title'],
-                               font=("Segoe UI", 32, "bold"),
-                               fg=self.theme.text_primary, bg=self.theme.background)
-                title.pack(pady=(20, 30))
-
-                # Check if this is a single activity or dual activity format
-                if 'single_activity' in self.message_dict:
-                    # Single activity format (for short breaks or user preference)
-                    # Create a bordered frame for the activity
-                    activity_border = tk.Frame(container, bg=self.theme.accent,
-                                             highlightbackground=self.theme.accent,
-                                             highlightthickness=2,
-                                             bd=2)
-                    activity_border.pack(pady=20, padx=40)
-
-                    activity_frame = tk.Frame(activity_border, bg=self.theme.background)
-                    activity_frame.pack(padx=20, pady=15)
-
-                    activity_text = tk.Label(activity_frame,
-                                           text=self.message_dict['single_activity'],
-                                           font=("Segoe UI", 24),
-                                           fg=self.theme.text_primary, bg=self.theme.background,
-                                           wraplength=int(win.winfo_screenwidth() * 0.6))
-                    activity_text.pack()
-                else:
-                    # Dual activity format (for longer breaks with "both" preference)
-                    # Stretch section with border
-                    stretch_border = tk.Frame(container, bg=self.theme.accent,
-                                            highlightbackground=self.theme.accent,
-                                            highlightthickness=2,
-                                            bd=2)
-                    stretch_border.pack(pady=10, padx=40)
-
-                    stretch_frame = tk.Frame(stretch_border, bg=self.theme.background)
-                    stretch_frame.pack(padx=15, pady=10)
-
-                    stretch_header = tk.Label(stretch_frame,
-                                            text=self.message_dict['stretch_header'],
-                                            font=("Segoe UI", 24, "bold"),
-                                            fg=self.theme.accent, bg=self.theme.background)
-                    stretch_header.pack()
-
-                    stretch_text = tk.Label(stretch_frame,
-                                          text=self.message_dict['stretch_text'],
-                                          font=("Segoe UI", 20),
-                                          fg=self.theme.text_primary, bg=self.theme.background,
-                                          wraplength=int(win.winfo_screenwidth() * 0.6))
-                    stretch_text.pack(pady=(5, 0))
-
-                    # Exercise section with border
-                    exercise_border = tk.Frame(container, bg=self.theme.accent_secondary,
-                                             highlightbackground=self.theme.accent_secondary,
-                                             highlightthickness=2,
-                                             bd=2)
-                    exercise_border.pack(pady=10, padx=40)
-
-                    exercise_frame = tk.Frame(exercise_border, bg=self.theme.background)
-                    exercise_frame.pack(padx=15, pady=10)
-
-                    exercise_header = tk.Label(exercise_frame,
-                                             text=self.message_dict['exercise_header'],
-                                             font=("Segoe UI", 24, "bold"),
-                                             fg=self.theme.accent_secondary,
-                                             bg=self.theme.background)
-                    exercise_header.pack()
-
-                    exercise_text = tk.Label(exercise_frame,
-                                           text=self.message_dict['exercise_text'],
-                                           font=("Segoe UI", 20),
-                                           fg=self.theme.text_primary, bg=self.theme.background,
-                                           wraplength=int(win.winfo_screenwidth() * 0.6))
-                    exercise_text.pack(pady=(5, 0))
-
-                # Motivation text
-                motivation = tk.Label(container,
-                                    text=self.message_dict['motivation'],
-                                    font=("Segoe UI", 18, "italic"),
-                                    fg=self.theme.text_secondary, bg=self.theme.background,
-                                    wraplength=int(win.winfo_screenwidth() * 0.7))
-                motivation.pack(pady=(15, 20))
-            else:
-                # Legacy single message display
-                msg = tk.Label(container, text=self.message_dict['title'],
-                             font=("Segoe UI", 28, "bold"),
-                             fg=self.theme.text_primary, bg=self.theme.background,
-                             wraplength=int(win.winfo_screenwidth() * 0.8))
-                msg.pack(pady=20)
-
-            # Add body map visualization
+        # Emoji and body-map summary are normally prepared before the break fires
+        self.exercise_emoji = emoji or message_emoji(message)
+        if body is None:
             try:
-                # Create a frame for body map display
-                body_frame = tk.Frame(container, bg=self.theme.background)
-                body_frame.pack(pady=(10, 5))
-
-                # Get body map visualization first to show in title
-                from .body_map import get_body_visualization_data
-                body_data = get_body_visualization_data()
-                muscle_counts = body_data['muscle_work_counts']
-                stats = body_data['coverage_stats']
-
-                # Create progress title showing what's been accomplished
-                exercises = stats.get('exercises_done', 0)
-                stretches = stats.get('stretches_done', 0)
-                breaks = stats.get('breaks_completed', 0)
-
-                if breaks > 0:
-                    # Show accomplishments
-                    parts = []
-                    break_word = get_translation("break" if breaks == 1 else "breaks", self.language)
-                    parts.append(f"{breaks} {break_word}")
-
-                    if exercises > 0:
-                        exercise_word = get_translation("exercise" if exercises == 1 else "exercises", self.language)
-                        parts.append(f"{exercises} {exercise_word}")
-
-                    if stretches > 0:
-                        stretch_word = get_translation("stretch" if stretches == 1 else "stretches", self.language)
-                        parts.append(f"{stretches} {stretch_word}")
-
-                    # Create progress text with translations
-                    accomplished_text = get_translation("accomplished_today", self.language)
-                    progress_text = f"{accomplished_text}: {', '.join(parts)}"
-                else:
-                    progress_text = get_translation("journey_begins", self.language)
-
-                body_title = tk.Label(body_frame,
-                                    text=progress_text,
-                                    font=("Segoe UI", 16, "bold"),
-                                    fg=self.theme.accent,
-                                    bg=self.theme.background)
-                body_title.pack()
-
-                # Create visual muscle group display
-                if muscle_counts:
-                    # Sort by count
-                    sorted_muscles = sorted(muscle_counts.items(), key=lambda x: x[1], reverse=True)
-
-                    # Display top 5 worked muscles as mini bars
-                    muscle_display = tk.Frame(body_frame, bg=self.theme.background)
-                    muscle_display.pack(pady=5)
-
-                    for muscle, count in sorted_muscles[:5]:
-                        muscle_row = tk.Frame(muscle_display, bg=self.theme.background)
-                        muscle_row.pack()
-
-                        # Translate muscle name
-                        muscle_key = f"muscle_{muscle.lower()}"
-                        translated_name = get_translation(muscle_key, self.language)
-                        # Fallback to formatted English name if no translation
-                        if translated_name == muscle_key:
-                            translated_name = muscle.replace('_', ' ').title()
-                        name_label = tk.Label(muscle_row,
-                                            text=f"{translated_name}:",
-                                            font=("Segoe UI", 11),
-                                            fg=self.theme.text_secondary,
-                                            bg=self.theme.background,
-                                            width=15,
-                                            anchor='e')
-                        name_label.pack(side=tk.LEFT, padx=(0, 5))
-
-                        # Visual bar (using characters)
-                        bar_length = min(count * 2, 20)
-                        bar = '■' * bar_length
-                        bar_label = tk.Label(muscle_row,
-                                           text=f"{bar} ({count}x)",
-                                           font=("Segoe UI", 11),
-                                           fg=self.theme.accent_secondary,
-                                           bg=self.theme.background,
-                                           anchor='w')
-                        bar_label.pack(side=tk.LEFT)
-
-                # Status line removed for cleaner display
-
-                # Add frequency recommendation if coverage is low
-                from .body_map import BodyMapVisualizer
-                from .config import load_settings
-                visualizer = BodyMapVisualizer()
-                settings = load_settings()
-                recommendation = visualizer.get_frequency_recommendation(
-                    stats['coverage_percentage'],
-                    stats['total_breaks'],
-                    settings.interval_minutes
-                )
-
-                if recommendation:
-                    rec_label = tk.Label(container,
-                                       text=recommendation,
-                                       font=("Segoe UI", 12, "italic"),
-                                       fg=self.theme.accent,
-                                       bg=self.theme.background,
-                                       wraplength=int(win.winfo_screenwidth() * 0.7))
-                    rec_label.pack(pady=(0, 10))
-            except Exception as e:
-                # Silently fail if body map not available yet
-                pass
-
-            # Add exercise emoji icon
-            emoji_label = tk.Label(container, text=self.exercise_emoji, font=("Segoe UI Emoji", 72),
-                                  fg=self.theme.text_primary, bg=self.theme.background)
-            emoji_label.pack(pady=10)
-
-            # Adjust font size based on mode
-            if self.flash_mode:
-                count_font = ("Segoe UI", 48, "bold")
-            else:
-                count_font = ("Segoe UI", 72, "bold")
-
-            count = tk.Label(container, textvariable=self.count_var, font=count_font,
-                            fg=self._get_current_activity_color(), bg=self.theme.background)
-            count.pack(pady=10)
-            self.countdown_labels.append(count)  # Store for color updates
-
-            # Add progress bar (only in non-flash mode)
-            if not self.flash_mode:
-                # Progress bar container
-                progress_container = tk.Frame(container, bg=self.theme.background)
-                progress_container.pack(pady=(10, 20))
-
-                # Calculate width based on screen size
-                bar_width = min(600, int(win.winfo_screenwidth() * 0.5))
-
-                # Outer frame for progress bar (border)
-                progress_outer = tk.Frame(progress_container,
-                                        bg=self._darken_color(self.theme.background),
-                                        height=30, width=bar_width)
-                progress_outer.pack()
-                progress_outer.pack_propagate(False)
-
-                # Inner progress bar that will shrink
-                progress_bar = tk.Frame(progress_outer,
-                                       bg=self._get_current_activity_color(),
-                                       height=28,
-                                       width=bar_width - 2)
-                progress_bar.place(x=1, y=1)
-
-                # Store progress bar reference
-                self.progress_bars.append(progress_bar)
-
-                # Store initial width for calculations (use first window as reference)
-                if len(self.progress_bars) == 1:
-                    self.progress_width = bar_width - 2
-
-            sub_msg = tk.Label(container, textvariable=self.sub_msg_var, font=("Segoe UI", 18),
-                              fg=self.theme.text_secondary, bg=self.theme.background)
-            sub_msg.pack(pady=10)
-
-            # Add funny ESC instruction at the bottom
-            esc_frame = tk.Frame(container, bg=self.theme.background)
-            esc_frame.pack(pady=30)
-
-            # Get funny ESC message
-            esc_message = self._get_funny_esc_message()
-
-            esc_label = tk.Label(
-                esc_frame,
-                text=esc_message,
-                font=("Segoe UI", 14, "italic"),
-                fg=self.theme.text_secondary,
-                bg=self.theme.background,
-                wraplength=int(win.winfo_screenwidth() * 0.6)
-            )
-            esc_label.pack(pady=10)
-
-            # Add keyboard shortcuts for emergency exit - BIND GLOBALLY AND LOCALLY
-            # bind_all makes it work even if window doesn't have focus
-            win.bind_all("<Escape>", lambda e: self._dismiss_early())
-            win.bind("<Escape>", lambda e: self._dismiss_early())
-
-            # Alternative shortcuts
-            win.bind_all("<Control-c>", lambda e: self._dismiss_early())
-            win.bind_all("<Control-q>", lambda e: self._dismiss_early())
-            win.bind_all("<Alt-F4>", lambda e: self._dismiss_early())
+                from .config import get_settings
+                body = body_snapshot(self.language, get_settings().interval_minutes)
+            except Exception:
+                pass  # Body map not available yet
+        self.body = body
 
-            # Make window focusable for ESC to work
-            win.focus_set()
-            win.focus_force()
+        # Report when the break is actually on screen
+        self._on_mapped = on_mapped
 
-            # Bindings to show reminder message (but don't lock input)
-            win.bind("<Button-1>", self._on_user_input, add="+")
-            win.bind("<Key>", self._on_user_input, add="+")  # Any key press
-            # Removed FocusOut binding to avoid refocus loops
+        # Fill in and show every window
+        esc_message = esc_message or self._get_funny_esc_message()
+        for index, shell in enumerate(shells):
+            with span("overlay.show_monitor", index=index, rect=shell.rect):
+                shell.show(self, esc_message)
 
         # Start the countdown after 1 second to show the full duration first
-        if self.windows:
-            self.windows[0].after(1000, self._tick)
+        self._first_tick = True
+        self.windows[0].after(1000, self._tick)
+
+    def _handle_first_map(self, event=None):
+        callback, self._on_mapped = self._on_mapped, None
+        if callback:
+            get_tracer().instant("overlay.mapped")
+            callback()
 
-    def _darken_color(self, color: str) -> str:
+    @staticmethod
+    def _darken_color(color: str) -> str:
         """Darken a hex color by 20%."""
         if color.startswith("#"):
             color = color[1:]
@@ -651,63 +827,12 @@ class Overlay:
 
     def _get_funny_esc_message(self) -> str:
         """Generate a funny ESC message."""
-        import random
-
-        # Get translated ESC completion messages
-        completions = []
-        for i in range(1, 13):  # We have 12 completion messages
-            comp = get_translation(f"esc_completion_{i}", self.language)
-            if comp and comp != f"esc_completion_{i}":  # Check if translation exists
-                completions.append(comp)
-
-        # Fallback to minimal hardcoded messages if no translations found
-        if not completions:
-            completions = [
-                "you'll achieve peak couch potato status",
-                "your muscles will file for unemployment"
-            ]
-
-        esc_msg = get_translation("press_esc_msg", self.language)
-        completion = random.choice(completions)
-        return f"{esc_msg} {completion}"
-
-    def _get_exercise_emoji(self, message: str) -> str:
-        """Return an emoji based on the exercise message."""
-        msg_lower = message.lower()
-
-        # Map keywords to emojis
-        if any(word in msg_lower for word in ['stretch', 'yoga', 'bend']):
-            return "🧘"
-        elif any(word in msg_lower for word in ['walk', 'step', 'pace']):
-            return "🚶"
-        elif any(word in msg_lower for word in ['run', 'jog', 'sprint']):
-            return "🏃"
-        elif any(word in msg_lower for word in ['squat', 'lunge', 'leg']):
-            return "🦵"
-        elif any(word in msg_lower for word in ['push', 'pushup', 'press']):
-            return "💪"
-        elif any(word in msg_lower for word in ['jump', 'hop', 'leap']):
-            return "🤸"
-        elif any(word in msg_lower for word in ['dance', 'move', 'groove']):
-            return "💃"
-        elif any(word in msg_lower for word in ['arm', 'shoulder', 'rotate']):
-            return "🤷"
-        elif any(word in msg_lower for word in ['plank', 'core', 'abs']):
-            return "🏋️"
-        elif any(word in msg_lower for word in ['breathe', 'breath', 'inhale']):
-            return "🫁"
-        elif any(word in msg_lower for word in ['neck', 'head', 'roll']):
-            return "🙆"
-        elif any(word in msg_lower for word in ['sit', 'stand', 'posture']):
-            return "🪑"
-        else:
-            # Default exercise emoji
-            return "💪"
+        return funny_esc_message(self.language)
 
     def _setup_activity_timing(self):
         """Setup timing for activity transitions"""
-        from .config import load_settings
-        settings = load_settings()
+        from .config import get_settings
+        settings = get_settings()
         activity_type = getattr(settings, 'activity_type', 'both')
 
         if self.is_structured:
@@ -751,64 +876,33 @@ class Overlay:
 
     def _get_all_monitors(self):
         """Get dimensions of all monitors."""
-        monitors = []
-
-        if sys.platform.startswith("win"):
-            # Windows: Use ctypes to enumerate monitors
-            import ctypes
-            from ctypes import wintypes
-
-            user32 = ctypes.windll.user32
-
-            def enum_monitors_proc(hMonitor, hdcMonitor, lprcMonitor, dwData):
-                rect = lprcMonitor.contents
-                monitors.append((rect.left, rect.top,
-                                rect.right - rect.left,
-                                rect.bottom - rect.top))
-                return 1
-
-            MonitorEnumProc = ctypes.WINFUNCTYPE(
-                ctypes.c_int, wintypes.HMONITOR, wintypes.HDC,
-                ctypes.POINTER(wintypes.RECT), wintypes.LPARAM
-            )
-
-            callback = MonitorEnumProc(enum_monitors_proc)
-            user32.EnumDisplayMonitors(None, None, callback, 0)
+        return get_monitors(self.root)
 
-        # Fallback if no monitors found or on other platforms
-        if not monitors:
-            # Just use the primary screen
-            monitors = [(0, 0, self.root.winfo_screenwidth(),
-                        self.root.winfo_screenheight())]
+    def _tick(self):
+        if self._first_tick:
+            # The last stage of a break's trace; the file is written once it is done
+            self._first_tick = False
+            with span("overlay.first_tick"):
+                self._advance()
+            if get_tracer().enabled:
+                get_tracer().flush("break")
+            return
+        self._advance()
 
-        return monitors
+    def _advance(self):
+        if self._finished:
+            return  # Dismissed or replaced; the windows belong to another break now
 
-    def _tick(self):
         # Calculate actual elapsed time to prevent drift
-        now = _time.time()
+        now = self._clock.monotonic()
         elapsed = now - self.start_time
         self.remaining = max(0, self.seconds - int(elapsed))
 
         # Check if we need to switch activities (for dual activity mode)
         if self.activity_switch_time and self.remaining <= self.activity_switch_time:
             if self.current_activity == 'stretch':
-                # Switch to exercise
+                # Switch to exercise; the countdown and progress bar change colour
                 self.current_activity = 'exercise'
-                new_color = self._get_current_activity_color()
-
-                # Update countdown color
-                for label in self.countdown_labels:
-                    try:
-                        label.configure(fg=new_color)
-                    except:
-                        pass
-
-                # Update progress bar color
-                for bar in self.progress_bars:
-                    try:
-                        bar.configure(bg=new_color)
-                    except:
-                        pass
 
                 # Prevent further switches
                 self.activity_switch_time = None
@@ -816,17 +910,8 @@ class Overlay:
         if not self.flash_mode:
             # Normal countdown mode - update display with new value
             self.count_var.set(str(self.remaining))
-
-            # Update progress bars
-            if hasattr(self, 'progress_bars') and hasattr(self, 'progress_width'):
-                progress = self.remaining / self.seconds
-                new_width = max(1, int(self.progress_width * progress))
-                for bar in self.progress_bars:
-                    try:
-                        bar.configure(width=new_width)
-                    except:
-                        pass
         # In flash mode, the duration stays static
+        self._redraw_countdown()
 
         if self.remaining <= 0:
             # Break completed normally - record as completed and activity
@@ -835,13 +920,8 @@ class Overlay:
                 # Record the exercise or stretch that was done
                 if hasattr(self, 'generator'):
                     self.generator.record_last_activity_completion()
-            # Clean up all windows
-            for win in self.windows:
-                try:
-                    # No need to release grab since we don't use it anymore
-                    win.destroy()
-                except Exception:
-                    pass
+            # Hide the windows until the next break
+            self._finish()
             if self.on_done:
                 self.on_done()
             return
@@ -853,6 +933,14 @@ class Overlay:
             delay = max(50, int((next_tick - now) * 1000))
             self.windows[0].after(delay, self._tick)
 
+    def _redraw_countdown(self):
+        """Update the countdown, progress bar and reminder line on every monitor."""
+        for shell in self._shells:
+            try:
+                shell.update_countdown(self)
+            except tk.TclError:
+                pass
+
     def _on_user_input(self, event=None):
         # Show a fun reminder about trying to escape
         import random
@@ -874,6 +962,7 @@ class Overlay:
         if not self.extra_lines:
             self.sub_msg_var.set(random.choice(escape_attempts))
             self.extra_lines.append(True)  # Just track that we showed a message
+            self._redraw_countdown()
         # Don't refocus - it can cause problems
 
     def _refocus(self, event=None):
@@ -884,8 +973,17 @@ class Overlay:
         except Exception:
             pass
 
+    def _finish(self):
+        """Stop this break and hand its windows back to the pool."""
+        self._finished = True
+        self.windows = []
+        self._pool.release(self)
+
     def _dismiss_early(self):
         """Allow user to dismiss the overlay early - SAFELY."""
+        if self._finished:
+            return
+
         # Mark as escaped if this is a counted break
         if self.count_break and hasattr(self, 'tracker'):
             self.tracker.record_break_escaped()
@@ -894,16 +992,8 @@ class Overlay:
         # Stop the timer to prevent further ticks
         self.remaining = 0
 
-        # Clean up all windows immediately
-        for win in self.windows:
-            try:
-                # No grab to release since we don't use it
-                win.destroy()
-            except Exception:
-                pass
-
-        # Clear the windows list
-        self.windows = []
+        # Hide all windows immediately
+        self._finish()
 
         if self.on_done:
             self.on_done()
@@ -1560,27 +1650,18 @@ class SettingsWindow:
         # Update preview when values change
         def update_preview(*args):
             try:
-                from .trigger_utils import get_trigger_times_preview
-                interval = int(self.int_var.get())
-                minute = int(self.trigger_var.get())
-                from_hour = int(self.from_var.get().split(":")[0])
-
-                # For intervals < 60, minute represents offset within interval
-                # We need to calculate actual clock minutes
-                if interval < 60:
-                    # Calculate actual trigger minutes based on offset
-                    actual_minutes = []
-                    for period_start in range(0, 60, interval):
-                        actual_minute = (period_start + minute) % 60
-                        if actual_minute not in actual_minutes:
-                            actual_minutes.append(actual_minute)
-                    # Use the first actual minute for preview
-                    minute_for_preview = actual_minutes[0] if actual_minutes else 0
-                else:
-                    minute_for_preview = minute
-
-                # Get preview times
-                times = get_trigger_times_preview(interval, minute_for_preview, from_hour, 5)
+                from dataclasses import replace as dc_replace
+                # Preview from the same calendar the scheduler will use for these values
+                preview_settings = dc_replace(
+                    self.settings,
+                    active_from=self.from_var.get(),
+                    active_to=self.to_var.get(),
+                    interval_minutes=int(self.int_var.get()),
+                    trigger_at_minute=int(self.trigger_var.get()),
+                )
+                calendar = get_break_calendar(preview_settings)
+                window_start = datetime.combine(datetime.now().date(), calendar.active_from)
+                times = [t.strftime("%H:%M") for t in calendar.upcoming(window_start - timedelta(seconds=1), 5)]
 
                 # Format based on time format setting
                 if self.time_format_var.get():
@@ -1605,6 +1686,7 @@ class SettingsWindow:
         self.int_var.trace("w", update_preview)
         self.trigger_var.trace("w", update_preview)
         self.from_var.trace("w", update_preview)
+        self.to_var.trace("w", update_preview)
 
         # Set up traces for time format changes
         self.time_format_var.trace("w", update_preview)
@@ -2276,9 +2358,13 @@ class SettingsWindow:
                 # Preserve version checking settings
                 last_version_check=getattr(self.settings, 'last_version_check', 0),
                 latest_known_version=getattr(self.settings, 'latest_known_version', ""),
-                auto_check_updates=getattr(self.settings, 'auto_check_updates', True)
+                auto_check_updates=getattr(self.settings, 'auto_check_updates', True),
+                missed_break_policy=getattr(self.settings, 'missed_break_policy', 'skip'),
+                overlay_renderer=getattr(self.settings, 'overlay_renderer', 'widgets'),
+                metrics_endpoint=getattr(self.settings, 'metrics_endpoint', False)
             )
-            save_settings(s)
+            if not self.on_save:
+                save_settings(s)
             if callable(self._set_autostart_state):
                 try:
                     self._set_autostart_state(self.auto_var.get())
@@ -2304,198 +2390,73 @@ class SettingsWindow:
 
 
 # --- Scheduler ---
-class Scheduler(threading.Thread):
-    def __init__(self, trigger_fn, pre_warning_fn, get_settings):
-        super().__init__(daemon=True)
-        self.trigger_fn = trigger_fn
-        self.pre_warning_fn = pre_warning_fn
-        self.get_settings = get_settings
-        self._stop = threading.Event()
-        self._lock = threading.Lock()  # Add thread safety lock
-        self.next_fire = None
-        self.pre_warning_shown = False
-        self.snooze_until = None
-
-    def run(self):
-        # Calculate first trigger time based on trigger_at_minute
-        s: Settings = self.get_settings()
-        now = datetime.now()
-
-        # Calculate next trigger based on interval and trigger minute
-        next_hour, next_minute = calculate_next_trigger_time(
-            s.interval_minutes,
-            s.trigger_at_minute,
-            now.hour,
-            now.minute
-        )
+class TkSchedulerDriver:
+    """Runs a SchedulingEngine on the Tk main loop with a single pending root.after.
 
-        # Create datetime for next trigger
-        next_trigger = now.replace(hour=next_hour, minute=next_minute, second=0, microsecond=0)
-
-        # Keep adding intervals until we get a future time
-        while next_trigger <= now:
-            next_trigger += timedelta(minutes=s.interval_minutes)
-
-        # Check if next trigger is within active hours
-        next_trigger = self._ensure_within_active_hours(next_trigger, s)
-
-        self.next_fire = next_trigger
-        logging.info(f"[Scheduler] Initial next break scheduled for: {self.next_fire.strftime('%H:%M:%S')}")
-
-        while not self._stop.is_set():
-            s: Settings = self.get_settings()
-            if not s.paused and self._within_hours(s):
-                now = datetime.now()
-
-                # Check if we're in snooze period
-                if self.snooze_until and now < self.snooze_until:
-                    self._stop.wait(1.0)
-                    continue
-
-                # Clear snooze if expired
-                if self.snooze_until and now >= self.snooze_until:
-                    self.snooze_until = None
-                    # Reset next fire time after snooze
-                    self.next_fire = now + timedelta(seconds=5)  # Quick trigger after snooze
-                    self.pre_warning_shown = False
-
-                # Check for pre-warning
-                if s.pre_warning and self.next_fire and not self.pre_warning_shown:
-                    time_until = (self.next_fire - now).total_seconds()
-                    if 0 < time_until <= s.pre_warning_seconds:
-                        # Round up to avoid showing N-1 seconds
-                        seconds_to_show = math.ceil(time_until)
-                        logging.info(f"[Scheduler] Showing pre-warning: {seconds_to_show} seconds until break")
-                        self.pre_warning_fn(seconds_to_show)
-                        self.pre_warning_shown = True
-
-                # Check for main trigger
-                if self.next_fire and now >= self.next_fire:
-                    logging.info(f"[Scheduler] Triggering break at {now.strftime('%H:%M:%S')}")
-                    self.trigger_fn()
-
-                    # Calculate next trigger time
-                    next_hour, next_minute = calculate_next_trigger_time(
-                        s.interval_minutes,
-                        s.trigger_at_minute,
-                        now.hour,
-                        now.minute + 1  # Add 1 minute to avoid re-triggering
-                    )
+    Engine events are therefore delivered on the Tk thread, so handlers can
+    touch widgets directly.
+    """
 
-                    # Handle day rollover
-                    if next_hour < now.hour:
-                        # Next day
-                        next_trigger = (now + timedelta(days=1)).replace(
-                            hour=next_hour, minute=next_minute, second=0, microsecond=0
-                        )
-                    else:
-                        next_trigger = now.replace(
-                            hour=next_hour, minute=next_minute, second=0, microsecond=0
-                        )
-
-                    # Ensure we don't trigger in the past
-                    if next_trigger <= now:
-                        next_trigger += timedelta(minutes=s.interval_minutes)
-
-                    # Check if next trigger is within active hours
-                    next_trigger = self._ensure_within_active_hours(next_trigger, s)
-
-                    self.next_fire = next_trigger
-                    self.pre_warning_shown = False
-                    logging.info(f"[Scheduler] Next break scheduled for: {self.next_fire.strftime('%H:%M:%S')}")
-            else:
-                # Log every 30 seconds when outside active hours or paused
-                if not hasattr(self, '_last_status_log'):
-                    self._last_status_log = datetime.now()
-
-                if (datetime.now() - self._last_status_log).total_seconds() > 30:
-                    if s.paused:
-                        logging.debug("[Scheduler] Currently paused")
-                    else:
-                        logging.debug(f"[Scheduler] Outside active hours ({s.active_from} - {s.active_to})")
-                    self._last_status_log = datetime.now()
-
-            # Sleep in small increments to be responsive to changes
-            self._stop.wait(1.0)
-
-    def snooze(self, minutes=5):
-        """Snooze the next break for specified minutes."""
-        with self._lock:
-            self.snooze_until = datetime.now() + timedelta(minutes=minutes)
-            self.pre_warning_shown = False
-
-    def trigger_now(self):
-        """Trigger break immediately."""
-        with self._lock:
-            self.next_fire = datetime.now()
-            self.pre_warning_shown = True  # Skip pre-warning for manual trigger
-
-    def recalculate_next_fire(self):
-        """Recalculate the next break time based on current settings."""
-        with self._lock:
-            s: Settings = self.get_settings()
-            now = datetime.now()
-
-            # Calculate next trigger based on interval and trigger minute
-            next_hour, next_minute = calculate_next_trigger_time(
-                s.interval_minutes,
-                s.trigger_at_minute,
-                now.hour,
-                now.minute
-            )
-
-            # Create datetime for next trigger
-            next_trigger = now.replace(hour=next_hour, minute=next_minute, second=0, microsecond=0)
-
-            # Keep adding intervals until we get a future time
-            while next_trigger <= now:
-                next_trigger += timedelta(minutes=s.interval_minutes)
-
-            # Check if next trigger is within active hours
-            next_trigger = self._ensure_within_active_hours(next_trigger, s)
+    def __init__(self, root: tk.Tk, engine: SchedulingEngine):
+        self.root = root
+        self.engine = engine
+        self._after_id = None
+        self._slept_for = None
+        self._wake_pending = False
+        self._running = False
+        self._due = None
+        self._jitter = get_metrics().histogram("scheduler.tick_jitter_ms")
+        engine.set_waker(self.wake)
 
-        self.next_fire = next_trigger
-        self.pre_warning_shown = False
-        logging.info(f"[Scheduler] Recalculated next break for: {self.next_fire.strftime('%H:%M:%S')}")
+    def start(self):
+        self._running = True
+        self.engine.prime()
+        # First poll once the main loop is running
+        self._after_id = self.root.after(0, self._run)
 
     def stop(self):
-        self._stop.set()
-
-    def _within_hours(self, s: Settings) -> bool:
-        now = datetime.now().time()
-        start = s.parse_active_from()
-        end = s.parse_active_to()
-        if start <= end:
-            return start <= now <= end
-        # Overnight window
-        return now >= start or now <= end
-
-    def _ensure_within_active_hours(self, next_trigger: datetime, s: Settings) -> datetime:
-        """Ensure the next trigger time falls within active hours. If not, schedule for next day's start."""
-        start_time = s.parse_active_from()
-        end_time = s.parse_active_to()
-
-        trigger_time = next_trigger.time()
-
-        # If active hours don't span midnight (e.g., 5:00-17:00)
-        if start_time <= end_time:
-            # Check if trigger time is outside active hours
-            if trigger_time > end_time or trigger_time < start_time:
-                # Schedule for next day's start time
-                next_day = next_trigger.date() + timedelta(days=1)
-                return datetime.combine(next_day, start_time)
-        else:
-            # Active hours span midnight (e.g., 22:00-06:00)
-            if end_time < trigger_time < start_time:
-                # Schedule for today's start time if we haven't passed it, else tomorrow
-                if datetime.now().time() < start_time:
-                    return datetime.combine(next_trigger.date(), start_time)
-                else:
-                    next_day = next_trigger.date() + timedelta(days=1)
-                    return datetime.combine(next_day, start_time)
+        self._running = False
+        self.engine.set_waker(None)
+        if self._after_id:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
 
-        # Trigger time is within active hours
-        return next_trigger
+    def wake(self):
+        """Poll again as soon as the Tk loop is free; may be called from any thread."""
+        if not self._running or self._wake_pending:
+            return
+        self._wake_pending = True
+        try:
+            self.root.after(0, self._on_wake)
+        except Exception:
+            self._wake_pending = False
+
+    def _on_wake(self):
+        self._wake_pending = False
+        if self._after_id:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._due = None  # Woken early, not a timed tick
+        self._run()
+
+    def _run(self):
+        self._after_id = None
+        if not self._running:
+            return
+        now = get_clock().monotonic()
+        if self._due is not None:
+            # How late Tk ran the timer
+            self._jitter.observe(max(0.0, now - self._due) * 1000)
+        if self._slept_for is not None:
+            self.engine.after_wake(self._slept_for)
+        timeout = self.engine.poll()
+        self._slept_for = timeout
+        delay_ms = max(1, int(timeout * 1000))
+        self._due = get_clock().monotonic() + delay_ms / 1000
+        self._after_id = self.root.after(delay_ms, self._run)
 
 
 # --- App ---
@@ -2513,32 +2474,65 @@ class MoveReminderApp:
 
         self.root.withdraw()
         self._tray = None
-        self._scheduler = Scheduler(self.trigger_overlay, self.show_pre_warning, self._get_settings)
+        self._scheduler = SchedulingEngine(self._get_settings)
+        self._scheduler.subscribe(PreWarning, lambda event: self.show_pre_warning(event.seconds))
+        self._scheduler.subscribe(BreakDue, lambda event: self.trigger_overlay(fired_at=get_clock().monotonic()))
+        self._scheduler.subscribe(ActiveWindowChanged, lambda event: self._update_tray_menu())
+        # Schedule changes go to the app-wide bus; the tray follows them in batches
+        self._scheduler.subscribe(ScheduleChanged, get_event_bus().publish)
+        get_tk_batcher(self.root).subscribe(ScheduleChanged, lambda events: self._update_tray_menu())
+        self._status_key = None
+        self._status_text = ""
+        self._scheduler_driver = TkSchedulerDriver(self.root, self._scheduler)
         self._toast = None
-        self._lm = TinyPhraseLM(language=self.settings.language)
+        # Created by _start_break_content once the tray is up
+        self._lm = None
+        self._prefetcher = None
+        self._control_server = None
+        self._status_endpoint = None
+        self._status_file = None
+        self._today_stats = {}  # Coverage stats as of the last tracker or schedule change
+        # Reports stalls of the Tk loop (blocking calls on this thread freeze the tray menu)
+        self._watchdog = None
+        self._scheduler.subscribe(PreWarning, lambda event: self._start_break_content().request())
+        self._scheduler.subscribe(PreWarning, lambda event: self._prepare_break_windows())
         self._lock = threading.Lock()
         self._pause_until = None  # For temporary pause functionality
         self._skip_next = False  # Flag to skip next break
         self._settings_window = None
         self._body_map_window = None
-        self._settings_autosave_timer = None
+        self._settings_writer = SettingsWriter(self._get_settings)
         self._paused_icon = None
         self._disclaimer_accepted = False  # Track disclaimer acceptance for this session
 
-        # Initialize version checker
-        self._version_checker = VersionChecker(self.settings)
-        self._version_checker.set_update_callback(self._handle_update_available)
+        self._version_checker = None  # Created by _start_deferred_services
+        self._startup_argv = ()
         self._update_info = None  # Store update information
 
         # Register cleanup on exit
         atexit.register(self._cleanup_on_exit)
 
-        # Start periodic settings save
-        self._start_autosave()
+        # Persist settings changes in the background
+        self._settings_writer.start()
+        self._recompute_counts = {}
+        self.root.after(self.RECOMPUTE_LOG_MINUTES * 60 * 1000, self._log_recompute_rates)
 
     def _get_settings(self):
         return self.settings
 
+    def _start_break_content(self):
+        """The break content prefetcher, created with the phrase model on first need."""
+        if self._prefetcher is None:
+            from .tiny_lm import TinyPhraseLM
+
+            self._lm = TinyPhraseLM(language=self.settings.language)
+            # Next break's content is prepared in the background: at startup, during
+            # the pre-warning and after each break
+            self._prefetcher = BreakPrefetcher(self._lm, self._get_settings)
+            self._prefetcher.start()
+            self._prefetcher.request()
+        return self._prefetcher
+
     def _setup_linux_appindicator(self, image, menu):
         """Setup native AppIndicator3 for GNOME compatibility"""
         print("[Linux] Attempting to use native AppIndicator3...")
@@ -2701,13 +2695,7 @@ class MoveReminderApp:
         except Exception as e:
             print(f"[Linux] Persistent notification failed: {e}")
 
-        # Method 4: File-based control system
-        try:
-            self._setup_file_control_system()
-        except Exception as e:
-            print(f"[Linux] File control system failed: {e}")
-
-        # Method 5: Optional mini control window
+        # Method 4: Optional mini control window
         try:
             self._create_linux_mini_control()
         except Exception as e:
@@ -2719,7 +2707,7 @@ class MoveReminderApp:
         print("[Linux] • Super+Shift+G: Toggle pause/resume")
         print("[Linux] • ./GitFitDev --show-settings")
         print("[Linux] • ./GitFitDev --toggle-pause")
-        print("[Linux] • touch ~/.gitfitdev/control/show_settings")
+        print("[Linux] • ./GitFitDev ctl status|pause|resume|snooze 10|trigger|skip")
         print("[Linux] • Optional mini window: touch ~/.gitfitdev/show_mini_control")
 
     def _setup_dbus_service(self):
@@ -2860,62 +2848,6 @@ Keywords=gitfit;pause;resume;fitness;break;
         except Exception:
             pass
 
-    def _setup_file_control_system(self):
-        """Setup file-based control system for external tools"""
-        control_dir = os.path.expanduser("~/.gitfitdev/control")
-        os.makedirs(control_dir, exist_ok=True)
-
-        # Create control files that external scripts can touch
-        control_files = {
-            'show_settings': 'Touch this file to open settings',
-            'toggle_pause': 'Touch this file to toggle pause/resume',
-            'trigger_break': 'Touch this file to trigger break now',
-            'quit': 'Touch this file to quit application'
-        }
-
-        for filename, description in control_files.items():
-            readme_path = os.path.join(control_dir, f"{filename}.txt")
-            with open(readme_path, 'w') as f:
-                f.write(f"{description}\n")
-                f.write(f"Usage: touch ~/.gitfitdev/control/{filename}\n")
-
-        # Start file monitoring
-        def check_control_files():
-            try:
-                for action in ['show_settings', 'toggle_pause', 'trigger_break', 'quit']:
-                    control_file = os.path.join(control_dir, action)
-                    if os.path.exists(control_file):
-                        os.remove(control_file)  # Remove trigger file
-
-                        # Execute action
-                        if action == 'show_settings':
-                            self._call_in_tk(self.open_settings)
-                        elif action == 'toggle_pause':
-                            self._call_in_tk(lambda: self._toggle_pause(None, None))
-                        elif action == 'trigger_break':
-                            self._call_in_tk(self.trigger_overlay)
-                        elif action == 'quit':
-                            self._call_in_tk(self._quit)
-
-                        print(f"[Linux] Control file action executed: {action}")
-
-                # Schedule next check
-                if self.root:
-                    self.root.after(2000, check_control_files)  # Check every 2 seconds
-
-            except Exception as e:
-                print(f"[Linux] Control file monitoring error: {e}")
-                # Retry in 5 seconds
-                if self.root:
-                    self.root.after(5000, check_control_files)
-
-        # Start monitoring
-        if self.root:
-            self.root.after(1000, check_control_files)
-
-        print(f"[Linux] File control system active in: {control_dir}")
-        print(f"[Linux] Example: touch ~/.gitfitdev/control/show_settings")
-
     def _create_linux_mini_control(self):
         """Create a control window for Linux - shown by default unless explicitly disabled"""
         # Check if user explicitly disabled the control panel
@@ -2931,10 +2863,9 @@ Keywords=gitfit;pause;resume;fitness;break;
             self._mini_window.geometry("200x260")
             self._mini_window.resizable(False, False)
 
-            # Position in top-right corner but more visible
-            self._mini_window.geometry("+{}+{}".format(
-                self._mini_window.winfo_screenwidth() - 220, 40
-            ))
+            # Position in top-right corner of the primary monitor but more visible
+            x, y, width, _ = primary_monitor(self.root)
+            self._mini_window.geometry("+{}+{}".format(x + width - 220, y + 40))
 
             # Keep on top initially to ensure visibility
             self._mini_window.attributes('-topmost', True)
@@ -2980,14 +2911,15 @@ Keywords=gitfit;pause;resume;fitness;break;
                                  font=("Arial", 8), fg='#666666', bg='#f0f0f0')
             help_label.pack(pady=10)
 
-            # Update pause button text periodically
-            def update_pause_button():
-                if hasattr(self, '_pause_btn') and self._pause_btn.winfo_exists():
-                    pause_text = "⏸️ Pause Breaks" if not self.settings.paused else "▶️ Resume Breaks"
-                    self._pause_btn.config(text=pause_text)
-                    self._mini_window.after(1000, update_pause_button)
+            # Follow the paused state as it changes
+            def update_pause_button(events):
+                if self._pause_btn.winfo_exists():
+                    get_metrics().counter("recompute.pause_button").inc()
+                    pause_text = "⏸️ Pause Breaks" if not events[-1].paused else "▶️ Resume Breaks"
+                    if self._pause_btn.cget("text") != pause_text:
+                        self._pause_btn.config(text=pause_text)
 
-            self._mini_window.after(500, update_pause_button)
+            get_tk_batcher(self.root).subscribe(ScheduleChanged, update_pause_button)
 
             # Handle window close to minimize instead of destroy
             self._mini_window.protocol("WM_DELETE_WINDOW", self._mini_window.withdraw)
@@ -3026,13 +2958,7 @@ Keywords=gitfit;pause;resume;fitness;break;
         except Exception as e:
             print(f"[macOS] Keyboard shortcuts failed: {e}")
 
-        # Method 4: File-based control system (same as Linux)
-        try:
-            self._setup_file_control_system()
-        except Exception as e:
-            print(f"[macOS] File control system failed: {e}")
-
-        # Method 5: Native notifications with actions
+        # Method 4: Native notifications with actions
         try:
             self._setup_macos_notifications()
         except Exception as e:
@@ -3044,7 +2970,7 @@ Keywords=gitfit;pause;resume;fitness;break;
         print("[macOS] • Cmd+Option+Shift+G: Toggle pause/resume")
         print("[macOS] • ./GitFitDev --show-settings")
         print("[macOS] • ./GitFitDev --toggle-pause")
-        print("[macOS] • touch ~/.gitfitdev/control/show_settings")
+        print("[macOS] • ./GitFitDev ctl status|pause|resume|snooze 10|trigger|skip")
         print("[macOS] • Dock right-click menu (enhanced)")
 
     def _setup_applescript_handlers(self):
@@ -3154,7 +3080,7 @@ exec "{exe_path}" --toggle-pause
         except Exception as e:
             print(f"[macOS] Notification setup failed: {e}")
 
-    def start(self):
+    def start(self, argv=()):
         # Check disclaimer acceptance before starting any functionality
         if not self.settings.disclaimer_accepted:
             self._show_disclaimer()
@@ -3162,42 +3088,24 @@ exec "{exe_path}" --toggle-pause
                 # User declined, exit the application
                 return
 
+        # Everything the tray does not need waits until the icon is up
+        self._startup_argv = argv
+
         if pystray is None:
             messagebox.showerror(
                 APP_NAME,
                 get_translation("error_missing_deps", self.settings.language),
             )
             # Still run without tray — scheduler + overlay only
-            self._scheduler.start()
+            self._scheduler_driver.start()
+            self._on_tray_visible(None)
             self.root.mainloop()
             return
 
         image = _dumbbell_icon(64)
 
-        def get_status_text(item=None):
-            if self._pause_until and datetime.now() < self._pause_until:
-                minutes_left = int((self._pause_until - datetime.now()).total_seconds() / 60)
-                paused_for_text = get_translation("paused_for_minutes", self.settings.language)
-                return paused_for_text.format(minutes=minutes_left)
-            elif self.settings.paused:
-                return get_translation("status_paused", self.settings.language)
-            elif self._skip_next:
-                return get_translation("next_break_skipped", self.settings.language)
-            elif self._scheduler.next_fire:
-                time_str = self._scheduler.next_fire.strftime('%H:%M')
-                # Format based on user preference
-                if not self.settings.time_format_24h:
-                    h, m = map(int, time_str.split(':'))
-                    period = "AM" if h < 12 else "PM"
-                    h_12 = h % 12 if h % 12 != 0 else 12
-                    time_str = f"{h_12}:{m:02d} {period}"
-                next_break_text = get_translation("next_break", self.settings.language)
-                return f"{next_break_text}: {time_str}"
-            else:
-                return get_translation("status_active", self.settings.language)
-
         menu = pystray.Menu(
-            pystray.MenuItem(get_status_text, None, enabled=False),
+            pystray.MenuItem(self._get_status_text, None, enabled=False),
             pystray.Menu.SEPARATOR,
             pystray.MenuItem(get_translation("tray_trigger_now", self.settings.language), lambda: self._call_in_tk(self.trigger_overlay)),
             pystray.MenuItem(
@@ -3302,64 +3210,141 @@ exec "{exe_path}" --toggle-pause
             self._tray.default = lambda: self._call_in_tk(self.open_settings)
 
         # Start scheduler
-        self._scheduler.start()
-
-        # Start automatic version checking
-        self._version_checker.check_for_updates_async()
+        self._scheduler_driver.start()
 
         # Start tray in a thread; keep Tk mainloop on main thread
-        if self._tray:
+        if isinstance(self._tray, pystray.Icon):
+            t = threading.Thread(target=self._tray.run, kwargs={"setup": self._on_tray_visible}, daemon=True)
+            t.start()
+        elif self._tray:
             t = threading.Thread(target=self._tray.run, daemon=True)
             t.start()
+            self._on_tray_visible(None)
         else:
             print(f"[{platform.system()}] Running without system tray - using alternative access methods")
+            self._on_tray_visible(None)
 
         self.root.mainloop()
 
+    def _on_tray_visible(self, icon):
+        """pystray's setup callback: show the icon and record the time to tray."""
+        if icon is not None:
+            icon.visible = True
+        elapsed_ms = (_time.perf_counter() - _STARTED_AT) * 1000
+        get_metrics().histogram("startup.time_to_tray_ms", STARTUP_BUCKETS).observe(elapsed_ms)
+        logging.info(f"[Startup] Tray up {elapsed_ms:.0f} ms after import")
+        self._call_in_tk(self._start_deferred_services)
+        if os.environ.get(STARTUP_PROBE_ENV):
+            # bench.py's startup benchmark times launch to this line, then we exit
+            print(f"{STARTUP_PROBE_ENV} tray-visible {elapsed_ms:.1f}", flush=True)
+            self._quit()
+
+    def _start_deferred_services(self):
+        """Start what the tray does not need; runs on the Tk thread once the icon is up."""
+        if self._watchdog is not None:
+            return  # Already started
+        from .version_checker import VersionChecker
+        from .watchdog import StallWatchdog
+
+        with span("startup.deferred"):
+            self._start_break_content()
+            self._prepare_break_windows()
+            self._start_control_server()
+            self._watchdog = StallWatchdog(self.root)
+            self._watchdog.start()
+            self._open_status_file()
+            # /status and the status files follow schedule and tracker changes in batches
+            get_tk_batcher(self.root).subscribe((ScheduleChanged, TrackerChanged),
+                                                lambda events: self._update_status_outputs())
+            self._update_status_outputs()
+            self._update_status_endpoint(self.settings)
+            get_settings_store().subscribe(lambda settings, changed: self._update_status_endpoint(settings)
+                                           if 'metrics_endpoint' in changed else None)
+            # Start automatic version checking
+            self._version_checker = VersionChecker(self.settings)
+            self._version_checker.set_update_callback(self._handle_update_available)
+            self._version_checker.check_for_updates_async()
+        if self._startup_argv:
+            self._handle_argv(self._startup_argv)
+
     def _call_in_tk(self, fn):
         self.root.after(0, fn)
 
+    def _get_status_text(self, item=None):
+        """Status line shown at the top of the tray menu."""
+        minutes_left = None
+        if self._pause_until and datetime.now() < self._pause_until:
+            minutes_left = int((self._pause_until - datetime.now()).total_seconds() / 60)
+        next_fire = self._scheduler.next_fire
+        key = (minutes_left, self.settings.paused, self._skip_next, next_fire,
+               self.settings.language, self.settings.time_format_24h)
+        # Without a scheduled break the text comes from the calendar and the clock
+        if key != self._status_key or next_fire is None:
+            self._status_text = self._compute_status_text(minutes_left)
+            self._status_key = key
+        return self._status_text
+
+    def _compute_status_text(self, minutes_left):
+        get_metrics().counter("recompute.status_text").inc()
+        if minutes_left is not None:
+            paused_for_text = get_translation("paused_for_minutes", self.settings.language)
+            return paused_for_text.format(minutes=minutes_left)
+        elif self.settings.paused:
+            return get_translation("status_paused", self.settings.language)
+        elif self._skip_next:
+            return get_translation("next_break_skipped", self.settings.language)
+
+        # The scheduler's next_fire comes from the same calendar; fall back to it before the thread starts
+        next_fire = self._scheduler.next_fire or get_break_calendar(self.settings).next_break(datetime.now())
+        if next_fire:
+            time_str = next_fire.strftime('%H:%M')
+            # Format based on user preference
+            if not self.settings.time_format_24h:
+                h, m = map(int, time_str.split(':'))
+                period = "AM" if h < 12 else "PM"
+                h_12 = h % 12 if h % 12 != 0 else 12
+                time_str = f"{h_12}:{m:02d} {period}"
+            next_break_text = get_translation("next_break", self.settings.language)
+            return f"{next_break_text}: {time_str}"
+        else:
+            return get_translation("status_active", self.settings.language)
+
+    RECOMPUTE_LOG_MINUTES = 10
+
+    def _log_recompute_rates(self):
+        """Log how often derived state was recomputed, per minute, since the last log"""
+        counters = get_metrics().snapshot()["counters"]
+        rates = []
+        for name, value in counters.items():
+            if name.startswith("recompute."):
+                delta = value - self._recompute_counts.get(name, 0)
+                rates.append(f"{name[len('recompute.'):]}={delta / self.RECOMPUTE_LOG_MINUTES:.1f}")
+                self._recompute_counts[name] = value
+        if rates:
+            logging.info(f"[Metrics] Recomputations per minute: {', '.join(rates)}")
+        self.root.after(self.RECOMPUTE_LOG_MINUTES * 60 * 1000, self._log_recompute_rates)
+
     def _toggle_pause(self, icon, item):
         # pystray passes (icon, item)
-        def do():
-            self.settings.paused = not self.settings.paused
-            save_settings(self.settings)
-            # Update the menu to reflect new state
-            self._update_tray_menu()
-        self._call_in_tk(do)
+        self._call_in_tk(lambda: self._set_paused(not self.settings.paused))
+
+    def _set_paused(self, paused):
+        self.settings.paused = paused
+        self._settings_writer.request()
+        self._scheduler.wake()
+        # Update the menu to reflect new state
+        self._update_tray_menu()
 
     def _update_tray_menu(self):
         """Recreate the tray menu to update dynamic text."""
         if self._tray:
-            def get_status_text(item=None):
-                if self._pause_until and datetime.now() < self._pause_until:
-                    minutes_left = int((self._pause_until - datetime.now()).total_seconds() / 60)
-                    paused_for_text = get_translation("paused_for_minutes", self.settings.language)
-                    return paused_for_text.format(minutes=minutes_left)
-                elif self.settings.paused:
-                    return get_translation("status_paused", self.settings.language)
-                elif self._skip_next:
-                    return get_translation("next_break_skipped", self.settings.language)
-                elif self._scheduler.next_fire:
-                    time_str = self._scheduler.next_fire.strftime('%H:%M')
-                    # Format based on user preference
-                    if not self.settings.time_format_24h:
-                        h, m = map(int, time_str.split(':'))
-                        period = "AM" if h < 12 else "PM"
-                        h_12 = h % 12 if h % 12 != 0 else 12
-                        time_str = f"{h_12}:{m:02d} {period}"
-                    next_break_text = get_translation("next_break", self.settings.language)
-                    return f"{next_break_text}: {time_str}"
-                else:
-                    return get_translation("status_active", self.settings.language)
-
             # Build help submenu items, only About option
             help_items = [
                 pystray.MenuItem(get_translation("tray_about", self.settings.language), lambda: self._call_in_tk(self.show_about_dialog)),
             ]
 
             menu = pystray.Menu(
-                pystray.MenuItem(get_status_text, None, enabled=False),
+                pystray.MenuItem(self._get_status_text, None, enabled=False),
                 pystray.Menu.SEPARATOR,
                 pystray.MenuItem(get_translation("tray_trigger_now", self.settings.language), lambda: self._call_in_tk(self.trigger_overlay)),
                 pystray.MenuItem(
@@ -3419,6 +3404,7 @@ exec "{exe_path}" --toggle-pause
 
         try:
             # Create and show body map window
+            from .body_map_window import BodyMapWindow
             self._body_map_window = BodyMapWindow(self.root, self.settings.theme, self.settings.language)
 
             # Override the close handling to clear our reference
@@ -3450,12 +3436,13 @@ exec "{exe_path}" --toggle-pause
         def on_save(new_settings: Settings):
             self.settings = new_settings
             # Update language in message generator if it changed
-            self._lm.language = new_settings.language
+            if self._lm is not None:
+                self._lm.language = new_settings.language
             # Only update generator language if it exists
             if hasattr(self._lm, 'generator') and self._lm.generator is not None:
                 self._lm.generator.language = new_settings.language
-                # Refresh exercise pools with new position preference
-                self._lm.generator.initialize_pools()
+            # Publishing the settings also re-prepares the next break in the new language
+            self._settings_writer.request()
             # Recalculate next break time when settings change
             self._scheduler.recalculate_next_fire()
             # Update tray menu to show new time
@@ -3751,6 +3738,7 @@ exec "{exe_path}" --toggle-pause
         # Check version
         self.check_version_async(status_label)
 
+    @traced("toast.show")
     def show_pre_warning(self, seconds_remaining):
         """Show a pre-warning toast notification."""
         logging.info(f"[App] show_pre_warning called with {seconds_remaining} seconds")
@@ -3785,6 +3773,8 @@ exec "{exe_path}" --toggle-pause
         # Show new toast with current theme
         message = get_translation("toast_time_to_move", self.settings.language)
         try:
+            from .toast import ToastNotification
+
             # Use flash mode if enabled
             if self.settings.pre_warning_flash:
                 flash_duration = getattr(self.settings, 'pre_warning_flash_duration', 3)
@@ -3815,8 +3805,11 @@ exec "{exe_path}" --toggle-pause
         except Exception as e:
             logging.error(f"[Toast] Error creating notification: {e}")
 
-    def trigger_overlay(self):
-        with self._lock:
+    @traced("break.trigger")
+    def trigger_overlay(self, fired_at: float = None):
+        if fired_at is None:
+            fired_at = get_clock().monotonic()
+        with locked(self._lock, "break.lock_wait"):
             # Block break functionality if disclaimer not accepted
             if not self.settings.disclaimer_accepted:
                 logging.info("[App] Break blocked - disclaimer not accepted")
@@ -3843,10 +3836,208 @@ exec "{exe_path}" --toggle-pause
                     pass
                 self._toast = None
 
-            msg = self._lm.generate_combined_message(break_seconds=self.settings.lock_seconds, count_break=True)
-            dismiss_text = self._lm.get_dismiss_button_text()
+            disk_reads = get_settings_store().disk_reads
+            content = self._start_break_content().take()
+            self._lm.commit_message(content.composed, count_break=True)
             # Never use flash mode for the main break overlay - we want countdown
-            Overlay(self.root, msg, self.settings.lock_seconds, dismiss_text, on_done=lambda: None, theme_id=self.settings.theme, flash_mode=False, count_break=True, language=self.settings.language)
+            Overlay(self.root, content.message, self.settings.lock_seconds, content.dismiss_text,
+                    on_done=self._prefetcher.request, theme_id=self.settings.theme, flash_mode=False,
+                    count_break=True, language=self.settings.language, body=content.body, emoji=content.emoji,
+                    esc_message=content.esc_message, on_mapped=lambda: self._record_break_latency(fired_at))
+            logging.info(f"[App] Break shown ({get_settings_store().disk_reads - disk_reads} settings file reads)")
+
+    def _prepare_break_windows(self):
+        """Build the overlay windows for the current monitors and theme ahead of the break."""
+        pool = get_overlay_pool(self.root)
+        if pool.active is not None:
+            return
+        renderer = getattr(self.settings, 'overlay_renderer', 'widgets')
+        try:
+            monitors = get_monitors(self.root)
+            pool.prepare(monitors, self.settings.theme, renderer)
+        except tk.TclError as e:
+            logging.error(f"[App] Failed to prepare overlay windows: {e}")
+            return
+        if renderer == "image":
+            # Frames for the prepared break are drawn before it fires
+            self._start_break_content().set_frame_sizes(rect[2:] for rect in monitors)
+
+    def _record_break_latency(self, fired_at: float):
+        """Record the time from the scheduler firing to the overlay being on screen"""
+        elapsed_ms = (get_clock().monotonic() - fired_at) * 1000
+        latency = get_metrics().histogram(FIRE_TO_MAPPED)
+        latency.observe(elapsed_ms)
+        if elapsed_ms > FIRE_TO_MAPPED_BUDGET_MS:
+            logging.warning(f"[App] Break overlay took {elapsed_ms:.0f} ms to appear "
+                            f"(budget {FIRE_TO_MAPPED_BUDGET_MS:.0f} ms, p95 {latency.quantile(0.95):.0f} ms)")
+        else:
+            logging.info(f"[App] Break overlay on screen {elapsed_ms:.0f} ms after firing")
+
+    def _start_control_server(self):
+        """Accept commands from ``gitfitdev ctl`` and from later launches."""
+        from .control import ControlServer
+
+        try:
+            self._control_server = ControlServer(self._control_handlers(), self._call_in_tk)
+            self._control_server.start()
+        except Exception as e:
+            self._control_server = None
+            logging.error(f"[Control] Command channel unavailable: {e}")
+
+    def _control_handlers(self):
+        def minutes(args):
+            if len(args) != 1 or not args[0].isdigit() or int(args[0]) < 1:
+                raise ValueError("expected a number of minutes")
+            return int(args[0])
+
+        def pause(args):
+            if args:
+                self._pause_for_duration(minutes(args))
+            elif not self.settings.paused:
+                self._set_paused(True)
+            return self._control_status()
+
+        def resume(args):
+            if self._pause_until:
+                self._resume_from_temp_pause()
+            elif self.settings.paused:
+                self._set_paused(False)
+            return self._control_status()
+
+        def toggle_pause(args):
+            return pause(()) if not self.settings.paused else resume(())
+
+        def snooze(args):
+            if not self._scheduler.next_fire:
+                raise ValueError("no break is scheduled")
+            self._snooze_break(minutes(args))
+            return self._control_status()
+
+        def trigger(args):
+            self.trigger_overlay()
+            return self._control_status()
+
+        def skip(args):
+            self._skip_next_break()
+            return self._control_status()
+
+        def stats(args):
+            from .tiny_lm import get_body_visualization_data
+            return {
+                "today": get_body_visualization_data()["coverage_stats"],
+                "counters": get_metrics().snapshot()["counters"],
+            }
+
+        def settings(args):
+            self.open_settings()
+
+        def trace(args):
+            tracer = get_tracer()
+            action = args[0] if args else "status"
+            if action == "on":
+                tracer.enable()
+            elif action == "off":
+                tracer.disable()
+            elif action == "flush":
+                tracer.flush("ctl")
+            elif action != "status":
+                raise ValueError("expected on, off, flush or status")
+            return {"enabled": tracer.enabled, "directory": str(tracer.directory),
+                    "last_file": str(tracer.last_file) if tracer.last_file else None}
+
+        def quit_app(args):
+            self._quit()
+
+        return {
+            "pause": pause,
+            "resume": resume,
+            "toggle-pause": toggle_pause,
+            "snooze": snooze,
+            "trigger": trigger,
+            "skip": skip,
+            "status": lambda args: self._control_status(),
+            "stats": stats,
+            "settings": settings,
+            "trace": trace,
+            "quit": quit_app,
+            "argv": self._handle_argv,
+        }
+
+    def _control_status(self):
+        next_fire = self._scheduler.next_fire
+        return {
+            "status": self._get_status_text(),
+            "paused": self.settings.paused,
+            "paused_until": self._pause_until.isoformat(timespec='seconds') if self._pause_until else None,
+            "skip_next": self._skip_next,
+            "next_break": next_fire.isoformat(timespec='seconds') if next_fire else None,
+        }
+
+    def _update_status_endpoint(self, settings):
+        """Serve /status and /metrics on the lock socket while ``metrics_endpoint`` is on."""
+        if getattr(settings, 'metrics_endpoint', False):
+            if self._status_endpoint is None and _lock_socket is not None:
+                from .status_endpoint import StatusEndpoint
+                self._status_endpoint = StatusEndpoint(_lock_socket, self._endpoint_status)
+                self._status_endpoint.start()
+        elif self._status_endpoint is not None:
+            self._status_endpoint.stop()
+            self._status_endpoint = None
+
+    def _open_status_file(self):
+        """Open the status-bar files (see status_file.py); not on Windows."""
+        if sys.platform.startswith("win"):
+            return
+        from .status_file import StatusFile
+
+        try:
+            self._status_file = StatusFile()
+        except OSError as e:
+            logging.error(f"[Status] Status file unavailable: {e}")
+            return
+        logging.info(f"[Status] Writing {self._status_file.text_path}")
+
+    def _update_status_outputs(self):
+        """Refresh today's stats for /status and rewrite the status files (Tk thread)."""
+        from .tiny_lm import get_generator
+
+        stats = get_generator().tracker.get_coverage_stats()
+        self._today_stats = stats
+        if self._status_file is None:
+            return
+        from .status_file import Status
+
+        next_fire = self._scheduler.next_fire
+        self._status_file.update(Status(
+            next=int(next_fire.timestamp()) if next_fire and not self.settings.paused else 0,
+            paused=bool(self.settings.paused),
+            until=int(self._pause_until.timestamp()) if self._pause_until else 0,
+            completed=stats.get('breaks_completed', 0),
+            coverage=int(round(stats.get('coverage_percentage', 0))),
+        ))
+
+    def _endpoint_status(self):
+        """/status body; runs on the endpoint thread, so today's stats come from the Tk thread's last snapshot."""
+        next_fire = self._scheduler.next_fire
+        snooze_until = self._scheduler.snooze_until
+        pause_until = self._pause_until
+        return {
+            "version": __version__,
+            "next_break": next_fire.isoformat(timespec='seconds') if next_fire else None,
+            "snoozed_until": snooze_until.isoformat(timespec='seconds') if snooze_until else None,
+            "paused": self.settings.paused,
+            "paused_until": pause_until.isoformat(timespec='seconds') if pause_until else None,
+            "skip_next": self._skip_next,
+            "today": dict(self._today_stats),
+        }
+
+    def _handle_argv(self, argv):
+        """Act on a launch's command-line flags (our own, or forwarded by a second launch)."""
+        if "--show-settings" in argv:
+            self.open_settings()
+        elif "--toggle-pause" in argv:
+            self._set_paused(not self.settings.paused)
+        return self._control_status()
 
     def _skip_next_break(self):
         """Skip the next scheduled break."""
@@ -3857,7 +4048,7 @@ exec "{exe_path}" --toggle-pause
     def _snooze_break(self, minutes):
         """Reschedule the next break to occur in X minutes."""
         if self._scheduler.next_fire:
-            self._scheduler.next_fire = datetime.now() + timedelta(minutes=minutes)
+            self._scheduler.reschedule(datetime.now() + timedelta(minutes=minutes))
             self._skip_next = False  # Clear skip flag if set
             self._update_tray_menu()
             logging.info(f"[App] Break snoozed for {minutes} minutes")
@@ -3866,9 +4057,13 @@ exec "{exe_path}" --toggle-pause
         """Pause breaks for a specific duration."""
         self._pause_until = datetime.now() + timedelta(minutes=minutes)
         self.settings.paused = True
-        save_settings(self.settings)
+        self._settings_writer.request()
+        self._scheduler.wake()
         self._update_tray_menu()
 
+        # A pause that only moves the end time changes no scheduler state
+        self._update_status_outputs()
+
         # Schedule a resume after the duration
         self.root.after(minutes * 60 * 1000, self._resume_from_temp_pause)
         logging.info(f"[App] Paused for {minutes} minutes")
@@ -3877,7 +4072,7 @@ exec "{exe_path}" --toggle-pause
         """Resume from temporary pause."""
         self._pause_until = None
         self.settings.paused = False
-        save_settings(self.settings)
+        self._settings_writer.request()
         self._scheduler.recalculate_next_fire()
         self._update_tray_menu()
         logging.info("[App] Resumed from temporary pause")
@@ -3888,7 +4083,7 @@ exec "{exe_path}" --toggle-pause
         self._pause_until = None
         if self.settings.paused:
             self.settings.paused = False
-            save_settings(self.settings)
+            self._settings_writer.request()
         self._scheduler.recalculate_next_fire()
         self._update_tray_menu()
         logging.info("[App] Schedule reset")
@@ -3900,7 +4095,7 @@ exec "{exe_path}" --toggle-pause
             self._disclaimer_accepted = True
             self.settings.disclaimer_accepted = True
             self.settings.disclaimer_version = "1.0"
-            save_settings(self.settings)
+            self._settings_writer.request()
             logging.info("[App] User accepted liability disclaimer")
 
         def on_decline():
@@ -3921,7 +4116,7 @@ exec "{exe_path}" --toggle-pause
     def _cleanup_on_exit(self):
         """Clean up resources and save settings on exit."""
         try:
-            self._scheduler.stop()
+            self._scheduler_driver.stop()
         except Exception:
             pass
         if self._tray:
@@ -3946,17 +4141,28 @@ exec "{exe_path}" --toggle-pause
             except:
                 pass
 
-        # Stop autosave timer
-        if self._settings_autosave_timer:
+        if self._prefetcher:
             try:
-                self.root.after_cancel(self._settings_autosave_timer)
-            except:
+                self._prefetcher.stop()
+            except Exception:
                 pass
-
-        # Save settings
+        if self._control_server:
+            self._control_server.stop()
+        if self._watchdog:
+            self._watchdog.stop()
+        if self._status_endpoint:
+            self._status_endpoint.stop()
+        if self._status_file:
+            self._status_file.close()
+            self._status_file = None
+        if get_tracer().enabled:
+            get_tracer().flush("exit", wait=True)
+        get_topology().close()
+
+        # Write any pending settings changes
         try:
-            save_settings(self.settings)
-            logging.info("[App] Settings saved on exit")
+            self._settings_writer.stop()
+            logging.info("[App] Settings flushed on exit")
         except Exception as e:
             logging.error(f"[App] Failed to save settings on exit: {e}")
 
@@ -4002,21 +4208,6 @@ exec "{exe_path}" --toggle-pause
         else:
             self.check_for_updates()
 
-    def _start_autosave(self):
-        """Start periodic settings autosave."""
-        def autosave():
-            try:
-                with self._lock:
-                    save_settings(self.settings)
-                logging.debug("[App] Settings autosaved")
-            except Exception as e:
-                logging.error(f"[App] Autosave failed: {e}")
-            # Schedule next autosave in 5 minutes
-            self._settings_autosave_timer = self.root.after(300000, autosave)
-
-        # Initial autosave in 5 minutes
-        self._settings_autosave_timer = self.root.after(300000, autosave)
-
     # --- Start on Login helpers (best-effort per OS) ---
     def _autostart_label(self):
         return "GitFitDev"
@@ -4212,6 +4403,9 @@ def check_pid_file():
     return False
 
 
+_lock_socket = None
+
+
 def check_socket_lock(port=52847):
     """Try to bind to a local socket as a cross-platform single-instance check."""
     try:
@@ -4219,7 +4413,8 @@ def check_socket_lock(port=52847):
         _lock_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         _lock_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         _lock_socket.bind(('127.0.0.1', port))
-        _lock_socket.listen(1)
+        # Also the opt-in /status and /metrics endpoint (see status_endpoint.py)
+        _lock_socket.listen(5)
 
         # Keep socket alive for app lifetime
         def cleanup_socket():
@@ -4328,15 +4523,7 @@ def ensure_single_instance():
 
 
 def main():
-    # Check for command line arguments
-    show_settings = False
-    toggle_pause = False
-
-    if len(sys.argv) > 1:
-        if "--show-settings" in sys.argv:
-            show_settings = True
-        elif "--toggle-pause" in sys.argv:
-            toggle_pause = True
+    _ensure_deps()
 
     # Check for single instance
     if not ensure_single_instance():
@@ -4349,32 +4536,11 @@ def main():
         except:
             language = "en"
 
-        # Handle commands for existing instance
-        if toggle_pause:
-            # Signal existing instance to toggle pause via file
-            try:
-                control_dir = os.path.expanduser("~/.gitfitdev/control")
-                os.makedirs(control_dir, exist_ok=True)
-                toggle_file = os.path.join(control_dir, "toggle_pause")
-                with open(toggle_file, 'w') as f:
-                    f.write("")
-                print("Toggle pause signal sent to existing instance.")
-                sys.exit(0)
-            except Exception as e:
-                print(f"Failed to signal existing instance: {e}")
-
-        if show_settings:
-            # Signal existing instance to show settings via file
-            try:
-                control_dir = os.path.expanduser("~/.gitfitdev/control")
-                os.makedirs(control_dir, exist_ok=True)
-                settings_file = os.path.join(control_dir, "show_settings")
-                with open(settings_file, 'w') as f:
-                    f.write("")
-                print("Show settings signal sent to existing instance.")
-                sys.exit(0)
-            except Exception as e:
-                print(f"Failed to signal existing instance: {e}")
+        # Hand flags such as --show-settings to the running instance
+        from .control import forward_argv
+        if len(sys.argv) > 1 and forward_argv(sys.argv[1:]):
+            print("Command sent to the running instance.")
+            sys.exit(0)
 
         error_msg = get_translation("error_already_running", language)
         # Replace placeholder with app name
@@ -4398,29 +4564,7 @@ def main():
         sys.exit(0)
 
     app = MoveReminderApp()
-
-    # Handle command line flags
-    if show_settings:
-        def open_settings_delayed():
-            import time
-            time.sleep(2)  # Wait for app to fully initialize
-            if app.root:
-                app.root.after(100, app.open_settings)
-
-        import threading
-        threading.Thread(target=open_settings_delayed, daemon=True).start()
-
-    elif toggle_pause:
-        def toggle_pause_delayed():
-            import time
-            time.sleep(2)  # Wait for app to fully initialize
-            if app.root:
-                app.root.after(100, lambda: app._toggle_pause(None, None))
-
-        import threading
-        threading.Thread(target=toggle_pause_delayed, daemon=True).start()
-
-    app.start()
+    app.start(sys.argv[1:])
 
 
 if __name__ == "__main__":
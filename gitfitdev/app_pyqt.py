@@ -7,7 +7,6 @@ import os
 import threading
 import random
 import subprocess
-from datetime import datetime, timedelta
 from typing import Optional
 
 # Ensure PyQt5 is installed
@@ -27,7 +26,7 @@ def ensure_pyqt5():
 
 ensure_pyqt5()
 
-from PyQt5.QtCore import (Qt, QTimer, pyqtSignal, QThread, QUrl, QTime,
+from PyQt5.QtCore import (Qt, QObject, QTimer, pyqtSignal, QUrl, QTime,
                           QSettings, QSize, QRect)
 from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
                             QLabel, QPushButton, QSystemTrayIcon, QMenu,
@@ -41,6 +40,7 @@ from PyQt5.QtGui import (QFont, QPalette, QColor, QIcon, QPixmap, QPainter,
 from .config import load_settings, save_settings, Settings
 from .branding import APP_NAME
 from .tiny_lm import TinyPhraseLM
+from .core import BreakDue, PreWarning, SchedulingEngine
 # Removed image manager - using emoji icons instead
 
 # Windows mutex for single instance
@@ -284,47 +284,41 @@ class BreakOverlay(QWidget):
             self.close_overlay()
 
 
-class SchedulerThread(QThread):
-    """Background thread for scheduling breaks."""
+class QtSchedulerDriver(QObject):
+    """Runs a SchedulingEngine on the Qt event loop with one single-shot QTimer."""
 
-    trigger_break = pyqtSignal()
+    _wake_requested = pyqtSignal()
 
-    def __init__(self, get_settings):
-        super().__init__()
-        self.get_settings = get_settings
-        self.running = True
-
-    def run(self):
-        """Run the scheduler."""
-        # Wait for first interval
-        settings = self.get_settings()
-        next_fire = datetime.now() + timedelta(minutes=max(1, settings.interval_minutes))
-
-        while self.running:
-            settings = self.get_settings()
-            if not settings.paused and self.within_active_hours(settings):
-                now = datetime.now()
-                if now >= next_fire:
-                    self.trigger_break.emit()
-                    next_fire = now + timedelta(minutes=max(1, settings.interval_minutes))
-
-            self.msleep(1000)  # Sleep 1 second
-
-    def within_active_hours(self, settings):
-        """Check if current time is within active hours."""
-        now = datetime.now().time()
-        start = settings.parse_active_from()
-        end = settings.parse_active_to()
-
-        if start <= end:
-            return start <= now <= end
-        else:
-            # Overnight schedule
-            return now >= start or now <= end
+    def __init__(self, engine: SchedulingEngine, parent=None):
+        super().__init__(parent)
+        self.engine = engine
+        self._slept_for = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._run)
+        # Signals are queued across threads, so wake() is safe from anywhere
+        self._wake_requested.connect(self._on_wake)
+        engine.set_waker(self._wake_requested.emit)
+
+    def start(self):
+        self.engine.prime()
+        self._timer.start(0)
 
     def stop(self):
-        """Stop the scheduler."""
-        self.running = False
+        self.engine.set_waker(None)
+        self._timer.stop()
+
+    def _on_wake(self):
+        self._timer.stop()
+        self._run()
+
+    def _run(self):
+        if self._slept_for is not None:
+            self.engine.after_wake(self._slept_for)
+        timeout = self.engine.poll()
+        self._slept_for = timeout
+        self._timer.start(max(1, int(timeout * 1000)))
 
 
 class SettingsDialog(QDialog):
@@ -417,7 +411,10 @@ class GitFitBreaksApp(QWidget):
         self.settings = load_settings()
         self.phrase_lm = TinyPhraseLM()
         self.tray_icon = None
-        self.scheduler = None
+        self.scheduler = SchedulingEngine(lambda: self.settings)
+        self.scheduler.subscribe(BreakDue, lambda event: self.trigger_break())
+        self.scheduler.subscribe(PreWarning, self.show_pre_warning)
+        self.scheduler_driver = None
 
         self.setup_tray()
         self.start_scheduler()
@@ -435,9 +432,13 @@ class GitFitBreaksApp(QWidget):
         menu = QMenu()
 
         trigger_action = QAction("Trigger Now", self)
-        trigger_action.triggered.connect(self.trigger_break)
+        trigger_action.triggered.connect(self.scheduler.trigger_now)
         menu.addAction(trigger_action)
 
+        snooze_action = QAction("Snooze 5 Minutes", self)
+        snooze_action.triggered.connect(lambda: self.scheduler.snooze(5))
+        menu.addAction(snooze_action)
+
         self.pause_action = QAction("Pause" if not self.settings.paused else "Resume", self)
         self.pause_action.triggered.connect(self.toggle_pause)
         menu.addAction(self.pause_action)
@@ -481,9 +482,14 @@ class GitFitBreaksApp(QWidget):
 
     def start_scheduler(self):
         """Start the break scheduler."""
-        self.scheduler = SchedulerThread(lambda: self.settings)
-        self.scheduler.trigger_break.connect(self.trigger_break)
-        self.scheduler.start()
+        self.scheduler_driver = QtSchedulerDriver(self.scheduler, self)
+        self.scheduler_driver.start()
+
+    def show_pre_warning(self, event):
+        """Tell the user a break is coming up."""
+        if self.tray_icon:
+            self.tray_icon.showMessage(APP_NAME, f"Break in {event.seconds} seconds",
+                                       QSystemTrayIcon.Information, 5000)
 
     def trigger_break(self):
         """Show break overlay."""
@@ -501,6 +507,7 @@ class GitFitBreaksApp(QWidget):
         """Toggle pause state."""
         self.settings.paused = not self.settings.paused
         save_settings(self.settings)
+        self.scheduler.wake()
         self.pause_action.setText("Resume" if self.settings.paused else "Pause")
 
     def open_settings(self):
@@ -509,12 +516,12 @@ class GitFitBreaksApp(QWidget):
         if dialog.exec_():
             # Settings were saved
             self.settings = load_settings()
+            self.scheduler.recalculate_next_fire()
 
     def quit_app(self):
         """Quit the application."""
-        if self.scheduler:
-            self.scheduler.stop()
-            self.scheduler.wait()
+        if self.scheduler_driver:
+            self.scheduler_driver.stop()
         QApplication.quit()
 
 
@@ -0,0 +1,498 @@
+"""Micro-benchmarks for the hot paths of a break.
+
+Usage:
+    python -m gitfitdev.bench              # run every benchmark
+    python -m gitfitdev.bench catalog      # run selected benchmarks
+    python -m gitfitdev.bench --list
+
+Timings are the best of several repeats, in microseconds per call. A
+benchmark that finds a timing over its budget reports it with over_budget();
+the run then exits with status 1.
+"""
+
+import argparse
+import random
+import re
+import sys
+import time as _time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+BENCHMARKS: Dict[str, Callable[[], List[Tuple[str, float]]]] = {}
+BUDGET_FAILURES: List[str] = []
+
+
+def benchmark(name: str):
+    """Register a function returning [(label, microseconds per call), ...]."""
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+
+def time_per_call(fn: Callable[[], object], number: int = 0, repeat: int = 5) -> float:
+    """Best-of-``repeat`` microseconds per call; ``number`` 0 calibrates to ~50 ms per repeat."""
+    if number <= 0:
+        number = 1
+        while True:
+            start = _time.perf_counter()
+            for _ in range(number):
+                fn()
+            if _time.perf_counter() - start >= 0.05:
+                break
+            number *= 2
+    best = float("inf")
+    for _ in range(repeat):
+        start = _time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, _time.perf_counter() - start)
+    return best / number * 1e6
+
+
+def over_budget(label: str, value_ms: float, budget_ms: float) -> bool:
+    """Record ``label`` as a failure if it took more than ``budget_ms``; returns whether it did."""
+    if value_ms <= budget_ms:
+        return False
+    BUDGET_FAILURES.append(f"{label}: {value_ms:.0f} ms (budget {budget_ms:.0f} ms)")
+    return True
+
+
+# --- Catalog selection ---
+
+def _synthetic_catalog(size: int, seed: int = 1) -> list:
+    from .fitness_data import Exercise, MuscleGroup, Position
+
+    rng = random.Random(seed)
+    muscles = list(MuscleGroup)
+    positions = list(Position)
+    return [
+        Exercise(f"Synthetic exercise {i}", rng.sample(muscles, rng.randint(1, 3)),
+                 rng.randint(1, 3), rng.choice(positions))
+        for i in range(size)
+    ]
+
+
+def _legacy_least_worked(worked: Dict[str, int]) -> list:
+    from .fitness_data import MuscleGroup
+
+    sorted_muscles = sorted(list(MuscleGroup), key=lambda mg: worked.get(mg.value, 0))
+    return sorted_muscles[:len(sorted_muscles) // 2]
+
+
+def _legacy_select(pool: list, worked: Dict[str, int]):
+    """Selection as it was done before the catalog index."""
+    least_worked = _legacy_least_worked(worked)
+    candidates = [e for e in pool if any(mg in least_worked for mg in e.muscle_groups)]
+    return random.choice(candidates) if candidates else random.choice(pool)
+
+
+@benchmark("catalog")
+def bench_catalog() -> List[Tuple[str, float]]:
+    from .catalog_index import CatalogIndex, MuscleRanking
+    from .fitness_data import EXERCISES, STRETCHES, MuscleGroup
+
+    rng = random.Random(7)
+    worked = {mg.value: rng.randint(0, 5) for mg in MuscleGroup}
+    results = []
+    for label, pool in (("200 items", list(EXERCISES) + list(STRETCHES)),
+                        ("50k items", _synthetic_catalog(50_000))):
+        index = CatalogIndex(pool)
+        ranking = MuscleRanking(worked)
+        names = [mg.value for mg in MuscleGroup]
+
+        def indexed():
+            # A completed break bumps a muscle group, then the next break selects
+            ranking.add(rng.choice(names))
+            return index.choose(ranking.least_worked())
+
+        def legacy():
+            worked[rng.choice(names)] += 1
+            return _legacy_select(pool, worked)
+
+        results.append((f"select, legacy scan ({label})", time_per_call(legacy)))
+        results.append((f"select, bitmask index ({label})", time_per_call(indexed)))
+        start = _time.perf_counter()
+        CatalogIndex(pool)
+        results.append((f"index build, once per position ({label})", (_time.perf_counter() - start) * 1e6))
+    return results
+
+
+# --- Activity text rendering ---
+
+def _legacy_adjust_duration(text: str, max_duration: int) -> str:
+    """Durations fitted to the break with regexes, as before content_templates."""
+    # Handle "X sec each" patterns - divide by 2 for each side
+    def replace_each_sec(match):
+        seconds = int(match.group(1))
+        adjusted = min(seconds, max_duration // 2)
+        adjusted = max(3, adjusted)  # Minimum 3 seconds
+        return f"{adjusted} sec each"
+
+    text = re.sub(r'(\d+) sec each', replace_each_sec, text)
+
+    # Handle "X seconds each" patterns - divide by 2
+    def replace_each_seconds(match):
+        seconds = int(match.group(1))
+        adjusted = min(seconds, max_duration // 2)
+        adjusted = max(3, adjusted)  # Minimum 3 seconds
+        return f"{adjusted} seconds each"
+
+    text = re.sub(r'(\d+) seconds each', replace_each_seconds, text)
+
+    # Handle regular "X seconds" patterns
+    def replace_seconds(match):
+        seconds = int(match.group(1))
+        adjusted = min(seconds, max_duration)
+        adjusted = max(3, adjusted)  # Minimum 3 seconds
+        return f"{adjusted} seconds"
+
+    text = re.sub(r'(\d+) seconds(?! each)', replace_seconds, text)
+
+    # Handle "X-Y seconds" patterns
+    def replace_range_seconds(match):
+        low = int(match.group(1))
+        high = int(match.group(2))
+        adj_high = min(high, max_duration)
+        adj_low = min(low, adj_high - 5, max_duration - 10)
+        adj_low = max(3, adj_low)
+        adj_high = max(adj_low + 5, adj_high)
+        return f"{adj_low}-{adj_high} seconds"
+
+    text = re.sub(r'(\d+)-(\d+) seconds', replace_range_seconds, text)
+
+    # Handle "X times each" patterns - divide by 2
+    def replace_each_times(match):
+        times = int(match.group(1))
+        # Calculate time per rep (assume 2 seconds per rep)
+        total_time = times * 2
+        if total_time > max_duration // 2:
+            adjusted_times = max(3, max_duration // 4)  # 2 seconds per rep, divided by 2 for each side
+            return f"{adjusted_times} times each"
+        return match.group(0)
+
+    text = re.sub(r'(\d+) times each', replace_each_times, text)
+
+    # Handle regular "X times" patterns
+    def replace_times(match):
+        times = int(match.group(1))
+        # Calculate time per rep (assume 2 seconds per rep)
+        total_time = times * 2
+        if total_time > max_duration:
+            adjusted_times = max(3, max_duration // 2)
+            return f"{adjusted_times} times"
+        return match.group(0)
+
+    text = re.sub(r'(\d+) times(?! each)', replace_times, text)
+
+    # Handle "hold X sec" patterns (both with and without 'onds')
+    text = re.sub(r'hold (\d+) sec(?:onds?)?(?:\b|,)',
+                 lambda m: f'hold {min(int(m.group(1)), max_duration)} sec,', text)
+
+    return text
+
+
+@benchmark("render")
+def bench_render() -> List[Tuple[str, float]]:
+    from . import content_templates
+    from .fitness_data import EXERCISES, STRETCHES
+    from .fitness_translations import translate_exercise, translate_stretch
+
+    items = [("exercise", e.description) for e in EXERCISES] + [("stretch", s.description) for s in STRETCHES]
+    results = []
+    for language in ("en", "sk"):
+        position = [0]
+
+        def legacy():
+            kind, description = items[position[0] % len(items)]
+            position[0] += 1
+            translate = translate_exercise if kind == "exercise" else translate_stretch
+            return _legacy_adjust_duration(translate(description, language), 50)
+
+        def compiled():
+            kind, description = items[position[0] % len(items)]
+            position[0] += 1
+            return content_templates.render_activity(kind, description, 50, language)
+
+        def cold():
+            content_templates.get_template.cache_clear()
+            content_templates.render_activity.cache_clear()
+            compiled()
+
+        results.append((f"activity text, legacy regex rewrite ({language})", time_per_call(legacy)))
+        results.append((f"activity text, compile + render ({language})", time_per_call(cold)))
+        for kind, description in items:
+            content_templates.render_activity(kind, description, 50, language)
+        results.append((f"activity text, memoized render ({language})", time_per_call(compiled)))
+    return results
+
+
+# --- Image overlay frames ---
+
+# Monitor layouts: (label, [(width, height), ...])
+OVERLAY_LAYOUTS = (
+    ("1 monitor", [(1920, 1080)]),
+    ("2 monitors", [(1920, 1080), (2560, 1440)]),
+    ("4 monitors", [(1920, 1080), (1920, 1080), (2560, 1440), (3840, 2160)]),
+)
+
+
+def _sample_frame_spec():
+    from .overlay_render import FrameSpec
+    from .prefetch import BodySnapshot
+
+    message = {
+        'title': "Time to move!",
+        'stretch_header': "Stretch (25s)",
+        'stretch_text': "Interlace your fingers, reach overhead and lean slowly to each side for 25 seconds",
+        'exercise_header': "Exercise (25s)",
+        'exercise_text': "Stand up and do 15 slow squats, keeping your knees behind your toes",
+        'motivation': "Your back thanks you for every one of these.",
+    }
+    body = BodySnapshot("Accomplished today: 3 breaks, 2 exercises, 1 stretch",
+                        [("Shoulders", 3), ("Legs", 2), ("Back", 2), ("Core", 1), ("Neck", 1)],
+                        "Good pace - keep taking a break every hour.", 10)
+    return FrameSpec.from_content(message, body, "🧘", "Press ESC if you must, but then...", "dark")
+
+
+@benchmark("overlay")
+def bench_overlay() -> List[Tuple[str, float]]:
+    from . import overlay_render
+
+    if not overlay_render.available():
+        print("  (skipped: Pillow is not installed)")
+        return []
+    spec = _sample_frame_spec()
+    overlay_render.render_frame(spec, (640, 480))  # Load fonts outside the timings
+    frames = {size: overlay_render.render_frame(spec, size) for _, sizes in OVERLAY_LAYOUTS for size in sizes}
+    results = []
+    with _tk_photos() as photos:
+        for label, sizes in OVERLAY_LAYOUTS:
+            distinct = sorted(set(sizes))
+
+            def build():
+                # One frame per distinct resolution, as FrameRenderer caches them
+                for size in distinct:
+                    overlay_render.render_frame(spec, size)
+
+            def tick():
+                for size in sizes:
+                    overlay_render.render_countdown(frames[size], spec, "42", 0.7, "#48bb78", "")
+
+            results.append((f"frame build ({label})", time_per_call(build, number=1, repeat=3)))
+            results.append((f"per-tick strip ({label})", time_per_call(tick)))
+            if photos is not None:
+                strips = [(photos(frames[size].image.crop(frames[size].countdown_box)),
+                           overlay_render.render_countdown(frames[size], spec, "42", 0.7, "#48bb78", ""))
+                          for size in sizes]
+
+                def blit():
+                    for photo, strip in strips:
+                        photo.paste(strip)
+
+                def upload():
+                    for size in sizes:
+                        photos(frames[size].image)
+
+                results.append((f"Tk frame upload, once per break ({label})", time_per_call(upload, number=1, repeat=3)))
+                results.append((f"Tk strip blit, per tick ({label})", time_per_call(blit)))
+    return results
+
+
+@benchmark("tracing")
+def bench_tracing() -> List[Tuple[str, float]]:
+    from . import tracing
+
+    tracer = tracing.get_tracer()
+    was_enabled = tracer.enabled
+
+    @tracing.traced("bench.call")
+    def decorated():
+        pass
+
+    def with_span():
+        with tracing.span("bench.span"):
+            pass
+
+    results = []
+    try:
+        for state in (False, True):
+            tracer.enabled = state  # Bypass enable()/disable(): no log lines or trace files
+            label = "on" if state else "off"
+            results.append((f"span, tracing {label}", time_per_call(with_span)))
+            results.append((f"traced call, tracing {label}", time_per_call(decorated)))
+    finally:
+        tracer.enabled = was_enabled
+        with tracer._lock:
+            tracer._events.clear()
+    results.append(("plain call", time_per_call(lambda: None)))
+    return results
+
+
+# --- Startup ---
+
+# Regression thresholds for the startup benchmark
+IMPORT_BUDGET_MS = 250.0
+TIME_TO_TRAY_BUDGET_MS = 1500.0
+STARTUP_TIMEOUT = 30.0
+# app.STARTUP_PROBE_ENV; importing app here would load the GUI into the benchmark
+STARTUP_PROBE_ENV = "GITFITDEV_STARTUP_PROBE"
+
+# Started after the tray is up or on first use; none may load with gitfitdev.app
+DEFERRED_MODULES = ("gitfitdev.control", "gitfitdev.version_checker", "gitfitdev.status_endpoint",
+                    "gitfitdev.status_file", "gitfitdev.watchdog", "gitfitdev.body_map_window",
+                    "gitfitdev.toast", "gitfitdev.disclaimer_text", "gitfitdev.tiny_lm",
+                    "gitfitdev.fitness_data", "urllib.request")
+
+
+def parse_importtime(output: str) -> List[Tuple[str, int, float, float]]:
+    """``python -X importtime`` lines as (module, depth, self us, cumulative us)."""
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            rows.append((name.strip(), (len(name) - len(name.lstrip())) // 2,
+                         float(self_us), float(cumulative_us)))
+        except ValueError:
+            continue  # The header line
+    return rows
+
+
+def _startup_env(home: str) -> Dict[str, str]:
+    """Environment for launching this checkout with a throwaway profile (disclaimer accepted)."""
+    import json
+    import os
+
+    config_dir = os.path.join(home, ".gitfitdev")
+    os.makedirs(config_dir, exist_ok=True)
+    with open(os.path.join(config_dir, "config.json"), "w", encoding="utf-8") as f:
+        json.dump({"disclaimer_accepted": True}, f)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    path = os.pathsep.join(p for p in (root, os.environ.get("PYTHONPATH")) if p)
+    return dict(os.environ, HOME=home, USERPROFILE=home, PYTHONPATH=path)
+
+
+def _import_rows(env: Dict[str, str], repeat: int = 5) -> List[Tuple[str, int, float, float]]:
+    """importtime rows of the fastest of ``repeat`` fresh imports of gitfitdev.app."""
+    import subprocess
+
+    best = []
+    for _ in range(repeat + 1):  # The first run may write bytecode caches
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import gitfitdev.app"],
+                              env=env, capture_output=True, text=True, timeout=STARTUP_TIMEOUT)
+        rows = parse_importtime(proc.stderr)
+        if proc.returncode != 0 or not rows or rows[-1][0] != "gitfitdev.app":
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "import failed")
+        if not best or rows[-1][3] < best[-1][3]:
+            best = rows
+    return best
+
+
+def _time_to_tray(env: Dict[str, str]) -> Optional[Tuple[float, float]]:
+    """(launch to tray, app import to tray) in ms, or None if the tray never came up."""
+    import subprocess
+    import threading
+
+    marker = f"{STARTUP_PROBE_ENV} tray-visible "
+    started = _time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-m", "gitfitdev"], env=dict(env, **{STARTUP_PROBE_ENV: "1"}),
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    killer = threading.Timer(STARTUP_TIMEOUT, proc.kill)
+    killer.start()
+    result = None
+    try:
+        for line in proc.stdout:
+            if line.startswith(marker):
+                result = ((_time.perf_counter() - started) * 1000, float(line[len(marker):]))
+                break
+        proc.wait(timeout=STARTUP_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+    finally:
+        killer.cancel()
+        proc.stdout.close()
+    return result
+
+
+@benchmark("startup")
+def bench_startup() -> List[Tuple[str, float]]:
+    import tempfile
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="gitfitdev-bench-") as home:
+        env = _startup_env(home)
+        try:
+            rows = _import_rows(env)
+        except Exception as e:
+            print(f"  (skipped: gitfitdev.app does not import here: {e})")
+            return []
+        total_ms = rows[-1][3] / 1000
+        results.append(("import gitfitdev.app (-X importtime)", rows[-1][3]))
+        heaviest = sorted((row for row in rows if row[1] == 1), key=lambda row: row[3], reverse=True)
+        for name, _, _, cumulative_us in heaviest[:5]:
+            results.append((f"  of which {name}", cumulative_us))
+        over_budget("import gitfitdev.app", total_ms, IMPORT_BUDGET_MS)
+        loaded = {row[0] for row in rows}
+        BUDGET_FAILURES.extend(f"{name} is imported on the startup path"
+                               for name in DEFERRED_MODULES if name in loaded)
+
+        tray = _time_to_tray(env)
+    if tray is None:
+        print("  (time to tray skipped: no tray came up - no display, or another instance is running)")
+        return results
+    launch_ms, import_ms = tray
+    results.append(("launch to tray visible (wall)", launch_ms * 1000))
+    results.append(("app import to tray visible (in-app)", import_ms * 1000))
+    over_budget("time to tray", launch_ms, TIME_TO_TRAY_BUDGET_MS)
+    return results
+
+
+@contextmanager
+def _tk_photos():
+    """ImageTk.PhotoImage bound to a hidden Tk root, or None without a display.
+
+    The root is destroyed when the block ends.
+    """
+    try:
+        import tkinter as tk
+        from PIL import ImageTk
+        root = tk.Tk()
+    except Exception:
+        yield None
+        return
+    root.withdraw()
+    try:
+        yield lambda image: ImageTk.PhotoImage(image, master=root)
+    finally:
+        root.destroy()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m gitfitdev.bench", description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    parser.add_argument("--list", action="store_true", help="list available benchmarks")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    for name in args.names or BENCHMARKS:
+        print(f"[{name}]")
+        for label, micros in BENCHMARKS[name]():
+            print(f"  {label:<50} {micros:>12.2f} us")
+    if BUDGET_FAILURES:
+        print("[over budget]")
+        for failure in BUDGET_FAILURES:
+            print(f"  {failure}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
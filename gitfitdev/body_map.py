@@ -244,9 +244,9 @@ class BodyMapVisualizer:
 
         # Calculate expected breaks based on user settings and current time
         from datetime import datetime
-        from .config import load_settings
+        from .config import get_settings
 
-        settings = load_settings()
+        settings = get_settings()
         try:
             now = datetime.now()
             active_from_time = datetime.strptime(settings.active_from, '%H:%M').time()
@@ -316,10 +316,10 @@ class BodyMapVisualizer:
     def get_frequency_recommendation(self, coverage_percentage: float, total_breaks: int, current_interval: int = 30, test_hour: int = None) -> str:
         """Get recommendation for break frequency based on coverage"""
         from datetime import datetime
-        from .config import load_settings
+        from .config import get_settings
 
         # Get user's actual work schedule
-        settings = load_settings()
+        settings = get_settings()
         try:
             active_from_hour = int(settings.active_from.split(':')[0])
             active_to_hour = int(settings.active_to.split(':')[0])
@@ -355,8 +355,8 @@ class BodyMapVisualizer:
 
         # Check if they're skipping too many breaks
         from .translations import get_translation
-        from .config import load_settings
-        settings = load_settings()
+        from .config import get_settings
+        settings = get_settings()
         language = settings.language
 
         if total_breaks < expected_breaks * 0.5 and hours_since_start >= 3:
@@ -395,12 +395,14 @@ def get_daily_report() -> str:
 def get_break_status_description() -> str:
     """Get descriptive break status string used across the app"""
     from datetime import datetime
-    from .config import load_settings
+    from .config import get_settings
+    from .metrics import get_metrics
     from .translations import get_translation
 
+    get_metrics().counter("recompute.break_status").inc()
     data = get_body_visualization_data()
     stats = data['coverage_stats']
-    settings = load_settings()
+    settings = get_settings()
     lang = getattr(settings, 'language', 'en')
 
     try:
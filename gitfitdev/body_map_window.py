@@ -7,11 +7,20 @@ from typing import Optional
 from .body_map import get_daily_report, get_body_visualization_data, BodyMapVisualizer
 from .themes import get_theme
 from .translations import get_translation
-from .body_svg import create_canvas_body_map, create_legend_frame
+from .body_svg import BodyMapCanvas, create_legend_frame
+from .tracing import traced
 
 
 class BodyMapWindow:
-    """Window showing detailed body map and daily fitness progress"""
+    """Window showing detailed body map and daily fitness progress
+
+    Widgets are created once; refreshes only reconfigure what changed since
+    the last one. The window refreshes when the tracker reports a change, and
+    every AUTO_REFRESH_MS for the time-of-day dependent break status.
+    """
+
+    MAX_MUSCLE_ROWS = 5
+    AUTO_REFRESH_MS = 60000
 
     def __init__(self, parent: Optional[tk.Tk] = None, theme_id: str = "green", language: str = "en"):
         """Create body map viewer window"""
@@ -26,10 +35,18 @@ class BodyMapWindow:
 
         self.theme = get_theme(theme_id)
         self.visualizer = BodyMapVisualizer()
+        self._last_counts = None
+        self._shown_rows = None
+        self._refresh_job = None
 
         self.setup_window()
         self.create_widgets()
         self.update_display()
+        self._schedule_refresh()
+        from .events import TrackerChanged, get_tk_batcher
+        self._unsubscribe_tracker = get_tk_batcher(self.root).subscribe(
+            TrackerChanged, lambda events: self.update_display())
+        self.root.bind("<Destroy>", self._on_destroy, add="+")
 
     def setup_window(self):
         """Configure the window"""
@@ -100,6 +117,46 @@ class BodyMapWindow:
         self.muscle_frame = tk.Frame(muscles_frame, bg=self.theme.background)
         self.muscle_frame.pack(padx=10, pady=5, fill=tk.X)
 
+        # Rows for the top muscle groups, filled in by update_display
+        self.muscle_rows = []
+        for _ in range(self.MAX_MUSCLE_ROWS):
+            row_frame = tk.Frame(self.muscle_frame, bg=self.theme.background)
+            # Muscle name
+            name_label = tk.Label(
+                row_frame,
+                font=("Segoe UI", 11),
+                fg=self.theme.text_primary,
+                bg=self.theme.background,
+                anchor='w',
+                width=20
+            )
+            name_label.pack(side=tk.LEFT)
+            # Progress bar
+            bar_label = tk.Label(
+                row_frame,
+                font=("Consolas", 10),
+                fg=self.theme.accent_secondary,
+                bg=self.theme.background
+            )
+            bar_label.pack(side=tk.LEFT, padx=10)
+            # Count
+            count_label = tk.Label(
+                row_frame,
+                font=("Segoe UI", 11, "bold"),
+                fg=self.theme.accent,
+                bg=self.theme.background,
+                width=5
+            )
+            count_label.pack(side=tk.LEFT)
+            self.muscle_rows.append((row_frame, name_label, bar_label, count_label))
+        self.no_data_label = tk.Label(
+            self.muscle_frame,
+            text=get_translation('body_map_no_data', self.language),
+            font=("Segoe UI", 12),
+            fg=self.theme.text_secondary,
+            bg=self.theme.background
+        )
+
         # Visual Body Map section with side-by-side layout
         body_section_frame = tk.LabelFrame(
             main_frame,
@@ -124,9 +181,14 @@ class BodyMapWindow:
         self.legend_container = tk.Frame(body_content, bg=self.theme.background)
         self.legend_container.pack(side=tk.LEFT, anchor='n', padx=(10, 10), pady=(20, 0))
 
-        # Initialize body canvas and legend
-        self.body_canvas = None
-        self.legend_frame = None
+        # Body map drawn once; refreshes recolour regions in place
+        self.body_map = BodyMapCanvas(self.body_container, width=200, height=250)
+        self.body_map.pack()
+        self.body_canvas = self.body_map.canvas
+
+        # Legend
+        self.legend_frame = create_legend_frame(self.legend_container, self.theme)
+        self.legend_frame.pack()
 
         # Buttons - ensure they're always visible at bottom
         button_frame = tk.Frame(main_frame, bg=self.theme.background)
@@ -168,8 +230,11 @@ class BodyMapWindow:
         )
         close_btn.pack(side=tk.RIGHT)
 
+    @traced("body_map.refresh")
     def update_display(self):
         """Update all displays with current data"""
+        from .metrics import get_metrics
+        get_metrics().counter("recompute.body_map_window").inc()
         # Get data
         data = get_body_visualization_data()
         muscle_counts = data['muscle_work_counts']
@@ -177,10 +242,10 @@ class BodyMapWindow:
 
         # Get descriptive break status using shared function
         from .body_map import get_break_status_description
-        from .config import load_settings
+        from .config import get_settings
 
         break_status = get_break_status_description()
-        settings = load_settings()
+        settings = get_settings()
 
         # Update stats with compact format using translations
         from .translations import get_translation
@@ -223,90 +288,75 @@ class BodyMapWindow:
 
         stats_text = f"{line1}\n{line2}\n{line3}"
 
-        self.stats_display.config(text=stats_text)
+        if self.stats_display.cget("text") != stats_text:
+            self.stats_display.config(text=stats_text)
+
+        # Nothing else to do if no muscle group count changed
+        if muscle_counts == self._last_counts:
+            return
+        self._last_counts = dict(muscle_counts)
 
         # Update muscle groups display
-        for widget in self.muscle_frame.winfo_children():
-            widget.destroy()
+        # Sort by count; only show top 5 muscle groups to save space
+        rows = sorted(muscle_counts.items(), key=lambda x: x[1], reverse=True)[:self.MAX_MUSCLE_ROWS]
+        if rows != self._shown_rows:
+            self._update_muscle_rows(rows)
+            self._shown_rows = rows
 
-        if muscle_counts:
-            # Sort by count
-            sorted_muscles = sorted(muscle_counts.items(), key=lambda x: x[1], reverse=True)
+        # Update the body map colours
+        self.update_body_display(muscle_counts)
 
-            # Only show top 5 muscle groups to save space
-            for muscle, count in sorted_muscles[:5]:
-                row_frame = tk.Frame(self.muscle_frame, bg=self.theme.background)
+    def _update_muscle_rows(self, rows):
+        """Fill in the muscle rows, touching only rows whose content changed"""
+        previous = self._shown_rows or []
+        for i, (row_frame, name_label, bar_label, count_label) in enumerate(self.muscle_rows):
+            if i >= len(rows):
+                row_frame.pack_forget()
+                continue
+            muscle, count = rows[i]
+            if i < len(previous) and previous[i] == rows[i]:
+                continue
+            muscle_name = muscle.replace('_', ' ').title()
+            name_label.config(text=f"{muscle_name:20}")
+            # Progress bar
+            bar_length = min(count * 3, 30)
+            bar = '#' * bar_length + '.' * (30 - bar_length)
+            bar_label.config(text=f"[{bar}]")
+            count_label.config(text=f"{count}x")
+            if i >= len(previous):
                 row_frame.pack(fill=tk.X, pady=2)
 
-                # Muscle name
-                muscle_name = muscle.replace('_', ' ').title()
-                name_label = tk.Label(
-                    row_frame,
-                    text=f"{muscle_name:20}",
-                    font=("Segoe UI", 11),
-                    fg=self.theme.text_primary,
-                    bg=self.theme.background,
-                    anchor='w',
-                    width=20
-                )
-                name_label.pack(side=tk.LEFT)
-
-                # Progress bar
-                bar_length = min(count * 3, 30)
-                bar = '#' * bar_length + '.' * (30 - bar_length)
-                bar_label = tk.Label(
-                    row_frame,
-                    text=f"[{bar}]",
-                    font=("Consolas", 10),
-                    fg=self.theme.accent_secondary,
-                    bg=self.theme.background
-                )
-                bar_label.pack(side=tk.LEFT, padx=10)
-
-                # Count
-                count_label = tk.Label(
-                    row_frame,
-                    text=f"{count}x",
-                    font=("Segoe UI", 11, "bold"),
-                    fg=self.theme.accent,
-                    bg=self.theme.background,
-                    width=5
-                )
-                count_label.pack(side=tk.LEFT)
-
+        if rows:
+            self.no_data_label.pack_forget()
         else:
-            no_data_label = tk.Label(
-                self.muscle_frame,
-                text=get_translation('body_map_no_data', settings.language),
-                font=("Segoe UI", 12),
-                fg=self.theme.text_secondary,
-                bg=self.theme.background
-            )
-            no_data_label.pack(pady=20)
-
-        # Update body ASCII art
-        self.update_body_display(muscle_counts)
+            self.no_data_label.pack(pady=20)
 
     def update_body_display(self, muscle_counts):
-        """Update the visual body map and legend"""
-        # Remove old canvas if exists
-        if self.body_canvas:
-            self.body_canvas.destroy()
-        if self.legend_frame:
-            self.legend_frame.destroy()
-
-        # Create new body map
-        self.body_canvas = create_canvas_body_map(
-            self.body_container,
-            muscle_counts,
-            width=200,
-            height=250
-        )
-        self.body_canvas.pack()
+        """Update the visual body map"""
+        self.body_map.update(muscle_counts)
 
-        # Create legend
-        self.legend_frame = create_legend_frame(self.legend_container, self.theme)
-        self.legend_frame.pack()
+    def _schedule_refresh(self):
+        self._refresh_job = self.root.after(self.AUTO_REFRESH_MS, self._auto_refresh)
+
+    def _auto_refresh(self):
+        """Pick up breaks completed while the window is open"""
+        self._refresh_job = None
+        try:
+            self.update_display()
+        except tk.TclError:
+            return  # Window is gone
+        self._schedule_refresh()
+
+    def _on_destroy(self, event=None):
+        if event is not None and event.widget is not self.root:
+            return
+        self._unsubscribe_tracker()
+        if self._refresh_job is not None:
+            try:
+                self.root.after_cancel(self._refresh_job)
+            except tk.TclError:
+                pass
+            self._refresh_job = None
 
     def _create_body_art(self, muscle_counts):
         """Create ASCII art representation of worked muscles"""
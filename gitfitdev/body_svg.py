@@ -16,9 +16,9 @@ def generate_body_svg(muscle_data: dict, width: int = 400, height: int = 600) ->
         SVG string
     """
     from .translations import get_translation
-    from .config import load_settings
+    from .config import get_settings
 
-    settings = load_settings()
+    settings = get_settings()
     lang = settings.language
 
     # Get translations for the SVG
@@ -244,103 +244,130 @@ def create_svg_widget(parent, muscle_data: dict, width: int = 400, height: int =
         return create_canvas_body_map(parent, muscle_data, width, height)
 
 
+# Canvas body map regions: (region, muscle groups summed into it, hidden while unworked)
+CANVAS_REGIONS = (
+    ("neck", ("neck",), False),
+    ("shoulders", ("shoulders",), False),
+    ("chest", ("chest",), False),
+    ("back", ("back", "upper_back", "lower_back"), True),
+    ("core", ("core", "abs"), False),
+    ("arms", ("arms", "biceps", "triceps"), False),
+    ("forearms", ("forearms", "wrists"), True),
+    ("glutes", ("glutes", "hips"), False),
+    ("quads", ("quads", "legs"), False),
+    ("hamstrings", ("hamstrings",), True),
+    ("calves", ("calves",), False),
+)
+
+
+def canvas_region_counts(muscle_data: dict) -> dict:
+    """Work count per canvas region."""
+    return {region: sum(muscle_data.get(mg, 0) for mg in muscles) for region, muscles, _ in CANVAS_REGIONS}
+
+
+def canvas_region_color(count: int) -> str:
+    if count == 0:
+        return "#3a3a3a"
+    elif count <= 2:
+        return "#4ade80"
+    elif count <= 4:
+        return "#22c55e"
+    else:
+        return "#16a34a"
+
+
+class BodyMapCanvas:
+    """Canvas body map drawn once, with items tagged per region.
+
+    update() recolours only the regions whose counts changed, so the map can
+    be refreshed as often as needed without rebuilding the canvas.
+    """
+
+    def __init__(self, parent, width: int = 200, height: int = 250):
+        import tkinter as tk
+
+        self.canvas = canvas = tk.Canvas(parent, width=width, height=height, bg='#1e293b', highlightthickness=0)
+        self._counts = {}
+        self._hidden_when_unworked = {region for region, _, hidden in CANVAS_REGIONS if hidden}
+
+        # Center the body in the canvas
+        cx = width // 2
+        off = canvas_region_color(0)
+
+        def region(name, kind, *coords, **options):
+            options.setdefault('outline', '')
+            state = 'hidden' if name in self._hidden_when_unworked else 'normal'
+            getattr(canvas, f"create_{kind}")(*coords, fill=off, tags=(f"region:{name}",), state=state, **options)
+
+        # Draw body outline (centered)
+        # Head
+        canvas.create_oval(cx-13, 12, cx+12, 37, outline='#475569', width=1, fill='')
+        # Neck
+        region("neck", "rectangle", cx-8, 32, cx+7, 40)
+        # Torso outline
+        canvas.create_rectangle(cx-20, 40, cx+20, 130, outline='#475569', width=1, fill='')
+        # Shoulders
+        region("shoulders", "oval", cx-30, 40, cx-15, 55)
+        region("shoulders", "oval", cx+15, 40, cx+30, 55)
+        # Chest
+        region("chest", "rectangle", cx-15, 45, cx+15, 70)
+        # Back (shown as overlay behind chest with transparency effect)
+        region("back", "rectangle", cx-18, 47, cx+18, 115, stipple='gray50')
+        # Core/Abs
+        region("core", "rectangle", cx-13, 72, cx+12, 120)
+        # Arms (biceps + triceps + arms)
+        region("arms", "polygon", cx-20, 45, cx-30, 45, cx-40, 100, cx-30, 105, outline='#475569', width=1)
+        region("arms", "polygon", cx+20, 45, cx+30, 45, cx+40, 100, cx+30, 105, outline='#475569', width=1)
+        # Forearms/Wrists
+        region("forearms", "oval", cx-42, 85, cx-32, 105)
+        region("forearms", "oval", cx+32, 85, cx+42, 105)
+        # Glutes
+        region("glutes", "oval", cx-18, 125, cx+18, 135)
+        # Quads (front thigh)
+        region("quads", "polygon", cx-20, 130, cx-15, 130, cx-18, 200, cx-23, 200, outline='#475569', width=1)
+        region("quads", "polygon", cx+15, 130, cx+20, 130, cx+22, 200, cx+17, 200, outline='#475569', width=1)
+        # Hamstrings (back thigh - shown with stipple pattern)
+        region("hamstrings", "rectangle", cx-22, 140, cx-13, 190, stipple='gray50')
+        region("hamstrings", "rectangle", cx+13, 140, cx+22, 190, stipple='gray50')
+        # Calves
+        region("calves", "oval", cx-25, 205, cx-15, 240)
+        region("calves", "oval", cx+15, 205, cx+25, 240)
+
+    def pack(self, **kwargs):
+        self.canvas.pack(**kwargs)
+
+    def update(self, muscle_data: dict) -> int:
+        """Recolour regions whose counts changed; returns how many changed."""
+        changed = 0
+        for name, count in canvas_region_counts(muscle_data).items():
+            if self._counts.get(name, 0) == count:
+                continue
+            options = {'fill': canvas_region_color(count)}
+            if name in self._hidden_when_unworked:
+                options['state'] = 'normal' if count > 0 else 'hidden'
+            self.canvas.itemconfigure(f"region:{name}", **options)
+            self._counts[name] = count
+            changed += 1
+        return changed
+
+
 def create_canvas_body_map(parent, muscle_data: dict, width: int = 200, height: int = 250):
     """
     Canvas-based body map visualization without legend.
     Legend should be created separately with create_legend_frame.
     """
-    import tkinter as tk
-
-    canvas = tk.Canvas(parent, width=width, height=height, bg='#1e293b', highlightthickness=0)
-
-    # Helper to get color based on count
-    def get_color(count: int) -> str:
-        if count == 0:
-            return "#3a3a3a"
-        elif count <= 2:
-            return "#4ade80"
-        elif count <= 4:
-            return "#22c55e"
-        else:
-            return "#16a34a"
-
-    # Center the body in the canvas
-    cx = width // 2
-
-    # Draw body outline (centered)
-    # Head
-    canvas.create_oval(cx-13, 12, cx+12, 37, outline='#475569', width=1, fill='')
-
-    # Neck
-    neck_color = get_color(muscle_data.get('neck', 0))
-    canvas.create_rectangle(cx-8, 32, cx+7, 40, fill=neck_color, outline='')
-
-    # Torso outline
-    canvas.create_rectangle(cx-20, 40, cx+20, 130, outline='#475569', width=1, fill='')
-
-    # Shoulders
-    shoulders_color = get_color(muscle_data.get('shoulders', 0))
-    canvas.create_oval(cx-30, 40, cx-15, 55, fill=shoulders_color, outline='')
-    canvas.create_oval(cx+15, 40, cx+30, 55, fill=shoulders_color, outline='')
-
-    # Chest
-    chest_color = get_color(muscle_data.get('chest', 0))
-    canvas.create_rectangle(cx-15, 45, cx+15, 70, fill=chest_color, outline='')
-
-    # Back (shown as overlay behind chest with transparency effect)
-    back_color = get_color(muscle_data.get('back', 0) + muscle_data.get('upper_back', 0) + muscle_data.get('lower_back', 0))
-    if muscle_data.get('back', 0) > 0 or muscle_data.get('upper_back', 0) > 0 or muscle_data.get('lower_back', 0) > 0:
-        canvas.create_rectangle(cx-18, 47, cx+18, 115, fill=back_color, outline='', stipple='gray50')
-
-    # Core/Abs
-    core_color = get_color(muscle_data.get('core', 0) + muscle_data.get('abs', 0))
-    canvas.create_rectangle(cx-13, 72, cx+12, 120, fill=core_color, outline='')
-
-    # Arms (biceps + triceps + arms)
-    arms_color = get_color(muscle_data.get('arms', 0) + muscle_data.get('biceps', 0) + muscle_data.get('triceps', 0))
-    # Left arm
-    canvas.create_polygon(cx-20, 45, cx-30, 45, cx-40, 100, cx-30, 105, fill=arms_color, outline='#475569', width=1)
-    # Right arm
-    canvas.create_polygon(cx+20, 45, cx+30, 45, cx+40, 100, cx+30, 105, fill=arms_color, outline='#475569', width=1)
-
-    # Forearms/Wrists
-    forearms_color = get_color(muscle_data.get('forearms', 0) + muscle_data.get('wrists', 0))
-    if muscle_data.get('forearms', 0) > 0 or muscle_data.get('wrists', 0) > 0:
-        canvas.create_oval(cx-42, 85, cx-32, 105, fill=forearms_color, outline='')
-        canvas.create_oval(cx+32, 85, cx+42, 105, fill=forearms_color, outline='')
-
-    # Glutes
-    glutes_color = get_color(muscle_data.get('glutes', 0) + muscle_data.get('hips', 0))
-    canvas.create_oval(cx-18, 125, cx+18, 135, fill=glutes_color, outline='')
-
-    # Quads (front thigh)
-    quads_color = get_color(muscle_data.get('quads', 0) + muscle_data.get('legs', 0))
-    # Left leg
-    canvas.create_polygon(cx-20, 130, cx-15, 130, cx-18, 200, cx-23, 200, fill=quads_color, outline='#475569', width=1)
-    # Right leg
-    canvas.create_polygon(cx+15, 130, cx+20, 130, cx+22, 200, cx+17, 200, fill=quads_color, outline='#475569', width=1)
-
-    # Hamstrings (back thigh - shown with stipple pattern)
-    hamstrings_color = get_color(muscle_data.get('hamstrings', 0))
-    if muscle_data.get('hamstrings', 0) > 0:
-        canvas.create_rectangle(cx-22, 140, cx-13, 190, fill=hamstrings_color, outline='', stipple='gray50')
-        canvas.create_rectangle(cx+13, 140, cx+22, 190, fill=hamstrings_color, outline='', stipple='gray50')
-
-    # Calves
-    calves_color = get_color(muscle_data.get('calves', 0))
-    canvas.create_oval(cx-25, 205, cx-15, 240, fill=calves_color, outline='')
-    canvas.create_oval(cx+15, 205, cx+25, 240, fill=calves_color, outline='')
-
-    return canvas
+    body_map = BodyMapCanvas(parent, width, height)
+    body_map.update(muscle_data)
+    return body_map.canvas
 
 
 def create_legend_frame(parent, theme):
     """Create a separate legend frame for muscle activity levels"""
     import tkinter as tk
     from .translations import get_translation
-    from .config import load_settings
+    from .config import get_settings
 
-    settings = load_settings()
+    settings = get_settings()
     frame = tk.Frame(parent, bg=theme.background)
 
     # Title
@@ -0,0 +1,176 @@
+"""Break calendar: the schedule in Settings compiled into concrete break instants.
+
+Breaks fall on a grid anchored at local midnight: ``trigger_at_minute`` plus
+every multiple of ``interval_minutes``. Only grid points inside the active
+window (``active_from`` .. ``active_to``, end minute inclusive, may span
+midnight) are kept. The grid is the same for every date, so it is compiled
+once into minutes-of-day and turned into datetimes per date on demand.
+
+Naive datetimes are treated as local wall-clock time. For timezone-aware
+datetimes the instants are resolved in that timezone: wall-clock times that
+fall into a DST gap are moved forward by the gap and times that occur twice
+when clocks go back only produce one break.
+"""
+
+import threading
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import Dict, List, Optional, Tuple
+
+MINUTES_PER_DAY = 24 * 60
+
+# Settings fields that affect the calendar; nothing else invalidates it
+SCHEDULE_FIELDS = ("active_from", "active_to", "interval_minutes", "trigger_at_minute")
+
+
+def _parse_hhmm(value: str) -> time:
+    hh, mm = value.split(":")
+    return time(int(hh), int(mm))
+
+
+class BreakCalendar:
+    """Immutable break schedule with O(log n) next-break lookup."""
+
+    _DAY_CACHE_SIZE = 8
+
+    def __init__(self, active_from: str, active_to: str, interval_minutes: int, trigger_at_minute: int):
+        self.active_from = _parse_hhmm(active_from)
+        self.active_to = _parse_hhmm(active_to)
+        self.interval_minutes = max(1, int(interval_minutes))
+        self.trigger_at_minute = int(trigger_at_minute)
+
+        self._start_minute = self.active_from.hour * 60 + self.active_from.minute
+        self._end_minute = self.active_to.hour * 60 + self.active_to.minute
+        offset = self.trigger_at_minute % self.interval_minutes
+        self.minutes: Tuple[int, ...] = tuple(
+            m for m in range(offset, MINUTES_PER_DAY, self.interval_minutes)
+            if self._minute_in_window(m)
+        )
+
+        self._days: Dict[Tuple[date, Optional[tzinfo]], Tuple[List[datetime], List[float]]] = {}
+        self._days_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings) -> "BreakCalendar":
+        return cls(settings.active_from, settings.active_to,
+                   settings.interval_minutes, settings.trigger_at_minute)
+
+    @property
+    def overnight(self) -> bool:
+        """True if the active window spans midnight (e.g. 22:00-06:00)."""
+        return self._start_minute > self._end_minute
+
+    def _minute_in_window(self, minute: int) -> bool:
+        if self._start_minute <= self._end_minute:
+            return self._start_minute <= minute <= self._end_minute
+        # Overnight window
+        return minute >= self._start_minute or minute <= self._end_minute
+
+    def in_window(self, when: datetime) -> bool:
+        """Whether a wall-clock time is inside the active window (minute resolution)."""
+        return self._minute_in_window(when.hour * 60 + when.minute)
+
+    def next_window_start(self, after: datetime) -> datetime:
+        """The first time the active window opens strictly after ``after``."""
+        start = datetime.combine(after.date(), self.active_from, tzinfo=after.tzinfo)
+        if start <= after:
+            start = datetime.combine(after.date() + timedelta(days=1), self.active_from, tzinfo=after.tzinfo)
+        return start
+
+    def breaks_on(self, day: date, tz: Optional[tzinfo] = None) -> List[datetime]:
+        """All break instants whose wall-clock date is ``day``, sorted.
+
+        Returns naive datetimes when ``tz`` is None, otherwise aware ones.
+        """
+        return list(self._day(day, tz)[0])
+
+    def _day(self, day: date, tz: Optional[tzinfo]) -> Tuple[List[datetime], List[float]]:
+        key = (day, tz)
+        with self._days_lock:
+            cached = self._days.get(key)
+        if cached is not None:
+            return cached
+
+        midnight = datetime.combine(day, time())
+        instants = [midnight + timedelta(minutes=m) for m in self.minutes]
+        if tz is None:
+            keys = [(dt - midnight).total_seconds() for dt in instants]
+        else:
+            resolved = {}
+            for naive in instants:
+                aware = naive.replace(tzinfo=tz)
+                # Round-trip through UTC: times inside a DST gap come back shifted
+                aware = aware.astimezone(timezone.utc).astimezone(tz)
+                resolved.setdefault(aware.timestamp(), aware)
+            keys = sorted(resolved)
+            instants = [resolved[k] for k in keys]
+
+        with self._days_lock:
+            if len(self._days) >= self._DAY_CACHE_SIZE:
+                self._days.pop(next(iter(self._days)))
+            self._days[key] = (instants, keys)
+        return instants, keys
+
+    def next_break(self, after: datetime) -> Optional[datetime]:
+        """The first break strictly after ``after``, or None if the window contains no breaks."""
+        if not self.minutes:
+            return None
+        tz = after.tzinfo
+        # The grid repeats daily, so today or tomorrow always has one (two more days cover DST gaps)
+        for days_ahead in range(3):
+            day = after.date() + timedelta(days=days_ahead)
+            instants, keys = self._day(day, tz)
+            if tz is None:
+                position = (after - datetime.combine(day, time())).total_seconds()
+            else:
+                position = after.timestamp()
+            index = bisect_right(keys, position)
+            if index < len(instants):
+                return instants[index]
+        return None
+
+    def upcoming(self, after: datetime, count: int) -> List[datetime]:
+        """The next ``count`` breaks strictly after ``after``."""
+        result = []
+        current = after
+        while len(result) < count:
+            nxt = self.next_break(current)
+            if nxt is None:
+                break
+            result.append(nxt)
+            current = nxt
+        return result
+
+    def breaks_between(self, start: datetime, end: datetime) -> List[datetime]:
+        """Breaks in the half-open interval (start, end]."""
+        result = []
+        current = start
+        while True:
+            nxt = self.next_break(current)
+            if nxt is None or nxt > end:
+                return result
+            result.append(nxt)
+            current = nxt
+
+
+_calendar_cache: Dict[tuple, BreakCalendar] = {}
+_calendar_lock = threading.Lock()
+
+
+def schedule_key(settings) -> tuple:
+    """The schedule-relevant part of a Settings object."""
+    return tuple(getattr(settings, name) for name in SCHEDULE_FIELDS)
+
+
+def get_break_calendar(settings) -> BreakCalendar:
+    """Shared calendar for these settings; rebuilt only when a schedule field changes."""
+    key = schedule_key(settings)
+    with _calendar_lock:
+        calendar = _calendar_cache.get(key)
+        if calendar is None:
+            calendar = BreakCalendar(*key)
+            # Keep the current schedule plus whatever the settings preview is showing
+            if len(_calendar_cache) >= 4:
+                _calendar_cache.pop(next(iter(_calendar_cache)))
+            _calendar_cache[key] = calendar
+        return calendar
@@ -0,0 +1,149 @@
+"""Muscle-group index over the exercise and stretch catalogs.
+
+Each filtered catalog (exercises or stretches for one position preference) is
+numbered once and every MuscleGroup is mapped to a bitmask of the items that
+work it. "Items working any of these muscles" is then an OR of a few integers,
+and a uniform pick among them selects the k-th set bit.
+
+MuscleRanking keeps the muscle groups ordered by today's work count as counts
+change, so the least-worked half is available without re-sorting.
+"""
+
+import random
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .fitness_data import (
+    EXERCISES, STRETCHES, MuscleGroup,
+    filter_exercises_by_position, filter_stretches_by_position
+)
+
+
+def _popcount(mask: int) -> int:
+    try:
+        return mask.bit_count()
+    except AttributeError:  # Python < 3.10
+        return bin(mask).count("1")
+
+
+def nth_set_bit(mask: int, n: int) -> int:
+    """Position of the n-th (0-based) set bit of ``mask``."""
+    low, high = 0, mask.bit_length()
+    # Smallest position p such that bits [0, p] contain n + 1 set bits
+    while low < high:
+        mid = (low + high) // 2
+        if _popcount(mask & ((2 << mid) - 1)) > n:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+class CatalogIndex:
+    """Bitmask index from muscle group to catalog items."""
+
+    _CANDIDATE_CACHE_SIZE = 32
+
+    def __init__(self, items: Sequence):
+        self.items = tuple(items)
+        self.all_mask = (1 << len(self.items)) - 1
+        # Fill byte bitmaps first; OR-ing into a growing int per item is quadratic
+        size = (len(self.items) + 7) // 8
+        bitmaps: Dict[MuscleGroup, bytearray] = {mg: bytearray(size) for mg in MuscleGroup}
+        for item_id, item in enumerate(self.items):
+            for mg in item.muscle_groups:
+                bitmaps.setdefault(mg, bytearray(size))[item_id >> 3] |= 1 << (item_id & 7)
+        self.by_muscle: Dict[MuscleGroup, int] = {
+            mg: int.from_bytes(bitmap, "little") for mg, bitmap in bitmaps.items()
+        }
+        self._candidates: Dict[frozenset, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def mask_for(self, muscles: Iterable[MuscleGroup]) -> int:
+        """Items that work at least one of ``muscles``."""
+        key = frozenset(muscles)
+        mask = self._candidates.get(key)
+        if mask is None:
+            mask = 0
+            for mg in key:
+                mask |= self.by_muscle.get(mg, 0)
+            if len(self._candidates) >= self._CANDIDATE_CACHE_SIZE:
+                self._candidates.pop(next(iter(self._candidates)))
+            self._candidates[key] = mask
+        return mask
+
+    def pick(self, mask: int, rng=random):
+        """A uniformly random item from ``mask``."""
+        count = _popcount(mask)
+        if count == 0:
+            raise IndexError("Cannot choose from an empty selection")
+        return self.items[nth_set_bit(mask, rng.randrange(count))]
+
+    def choose(self, muscles: Iterable[MuscleGroup], rng=random):
+        """A random item working one of ``muscles``, or any item if none does."""
+        mask = self.mask_for(muscles)
+        return self.pick(mask or self.all_mask, rng)
+
+
+class MuscleRanking:
+    """Muscle groups ordered by work count, ties in enum order, updated in place."""
+
+    def __init__(self, counts: Optional[Dict[str, int]] = None):
+        self._order = {mg: i for i, mg in enumerate(MuscleGroup)}
+        self.reset(counts)
+
+    def reset(self, counts: Optional[Dict[str, int]] = None) -> None:
+        counts = counts or {}
+        self.counts = {mg: counts.get(mg.value, 0) for mg in MuscleGroup}
+        self.ranked: List[MuscleGroup] = sorted(MuscleGroup, key=self._key)
+        self._least: Optional[Tuple[MuscleGroup, ...]] = None
+
+    def _key(self, mg: MuscleGroup) -> Tuple[int, int]:
+        return self.counts[mg], self._order[mg]
+
+    def add(self, mg_name: str, amount: int = 1) -> None:
+        """Count more work for a muscle group and move it back to its new rank."""
+        try:
+            mg = MuscleGroup(mg_name)
+        except ValueError:
+            return
+        self.counts[mg] += amount
+        ranked = self.ranked
+        i = ranked.index(mg)
+        key = self._key(mg)
+        while i + 1 < len(ranked) and self._key(ranked[i + 1]) < key:
+            ranked[i] = ranked[i + 1]
+            i += 1
+        ranked[i] = mg
+        self._least = None
+
+    def least_worked(self) -> Tuple[MuscleGroup, ...]:
+        """The less-worked half of all muscle groups."""
+        if self._least is None:
+            self._least = tuple(self.ranked[:len(self.ranked) // 2])
+        return self._least
+
+
+_indexes: Dict[Tuple[str, str], CatalogIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_catalog_index(kind: str, position_preference: str) -> CatalogIndex:
+    """Shared index of ``kind`` ("exercise" or "stretch") filtered by position preference.
+
+    Membership does not depend on the language (text is translated when the
+    break is rendered), so one index per position preference serves all of them.
+    """
+    key = (kind, position_preference)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            if kind == "exercise":
+                items = filter_exercises_by_position(list(EXERCISES), position_preference)
+            else:
+                items = filter_stretches_by_position(list(STRETCHES), position_preference)
+            index = CatalogIndex(items)
+            _indexes[key] = index
+        return index
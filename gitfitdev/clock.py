@@ -0,0 +1,164 @@
+"""Clock abstraction for scheduling.
+
+Breaks are planned in wall-clock time, but waiting and measuring elapsed time
+must use the monotonic clock. Comparing how far each of them moved between two
+observations tells us when the machine was suspended or the wall clock was
+stepped (manual change, NTP):
+
+- wall moved much more than monotonic: forward jump. On Linux and macOS the
+  monotonic clock stops during suspend, so a resume looks like this too.
+- wall moved much less than monotonic: the clock was set back.
+- monotonic moved much more than we asked to sleep: the process was frozen
+  (Windows keeps the monotonic clock running during suspend).
+
+Everything that needs the time takes a Clock so tests and the simulator can
+substitute VirtualClock and run a week of schedule in milliseconds.
+"""
+
+import threading
+import time as _time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+# Divergence (seconds) between wall and monotonic time that counts as a jump
+JUMP_THRESHOLD_SECONDS = 5.0
+
+MISSED_BREAK_POLICIES = ("skip", "coalesce", "defer")
+
+
+class Clock:
+    """The real system clock."""
+
+    def now(self) -> datetime:
+        """Local wall-clock time (naive)."""
+        return datetime.now()
+
+    def monotonic(self) -> float:
+        return _time.monotonic()
+
+    def wait(self, condition: threading.Condition, timeout: Optional[float]) -> bool:
+        """Wait on a held condition for at most ``timeout`` seconds."""
+        return condition.wait(timeout)
+
+
+class VirtualClock(Clock):
+    """Manually driven clock for tests, simulations and benchmarks.
+
+    wait() never blocks: it advances virtual time by the full timeout, as if
+    nothing woke the waiter early.
+    """
+
+    def __init__(self, start: datetime):
+        self._wall = start
+        self._mono = 0.0
+
+    def now(self) -> datetime:
+        return self._wall
+
+    def monotonic(self) -> float:
+        return self._mono
+
+    def wait(self, condition: threading.Condition, timeout: Optional[float]) -> bool:
+        if timeout is not None:
+            self.advance(timeout)
+        return False
+
+    def advance(self, seconds: float) -> None:
+        """Let time pass normally."""
+        self._wall += timedelta(seconds=seconds)
+        self._mono += seconds
+
+    def advance_to(self, when: datetime) -> None:
+        seconds = (when - self._wall).total_seconds()
+        if seconds > 0:
+            self.advance(seconds)
+
+    def suspend(self, seconds: float) -> None:
+        """Sleep the machine: wall time moves on, monotonic time does not."""
+        self._wall += timedelta(seconds=seconds)
+
+    def step_wall(self, seconds: float) -> None:
+        """Step the wall clock (NTP, manual change); negative goes back."""
+        self._wall += timedelta(seconds=seconds)
+
+
+@dataclass
+class ClockJump:
+    """A detected discontinuity between two clock observations."""
+    kind: str              # "forward", "backward" or "stall"
+    before: datetime       # wall time at the previous observation
+    after: datetime        # wall time now
+    wall_delta: float      # seconds the wall clock moved
+    mono_delta: float      # seconds the monotonic clock moved
+
+    @property
+    def skew(self) -> float:
+        return self.wall_delta - self.mono_delta
+
+
+class ClockWatcher:
+    """Compares successive (wall, monotonic) observations to spot sleeps and jumps."""
+
+    def __init__(self, clock: Clock, threshold: float = JUMP_THRESHOLD_SECONDS):
+        self.clock = clock
+        self.threshold = threshold
+        self.jumps = 0
+        self._last_wall: Optional[datetime] = None
+        self._last_mono: Optional[float] = None
+
+    def reset(self) -> None:
+        self._last_wall = self.clock.now()
+        self._last_mono = self.clock.monotonic()
+
+    def check(self, expected_sleep: Optional[float] = None) -> Optional[ClockJump]:
+        """Observe the clocks and report a jump since the previous call, if any.
+
+        ``expected_sleep`` is how long the caller intended to wait; a much
+        longer monotonic gap means the process did not run in between.
+        """
+        wall = self.clock.now()
+        mono = self.clock.monotonic()
+        before, last_mono = self._last_wall, self._last_mono
+        self._last_wall, self._last_mono = wall, mono
+        if before is None:
+            return None
+
+        wall_delta = (wall - before).total_seconds()
+        mono_delta = mono - last_mono
+        skew = wall_delta - mono_delta
+        if skew > self.threshold:
+            kind = "forward"
+        elif skew < -self.threshold:
+            kind = "backward"
+        elif expected_sleep is not None and mono_delta - expected_sleep > self.threshold:
+            kind = "stall"
+        else:
+            return None
+        self.jumps += 1
+        return ClockJump(kind, before, wall, wall_delta, mono_delta)
+
+
+class Countdown:
+    """Seconds remaining until a deadline, measured on the monotonic clock."""
+
+    def __init__(self, seconds: float, clock: Optional[Clock] = None):
+        self.clock = clock or Clock()
+        self.duration = seconds
+        self._start = self.clock.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        return self.clock.monotonic() - self._start
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.duration - self.elapsed)
+
+
+_system_clock = Clock()
+
+
+def get_clock() -> Clock:
+    """The process-wide system clock."""
+    return _system_clock
@@ -1,8 +1,12 @@
 import json
 import os
 import threading
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from datetime import time
+from typing import Callable, List, Optional, Tuple
+
+from .metrics import get_metrics
+from .tracing import traced
 
 
 def _home_dir() -> str:
@@ -50,6 +54,12 @@ class Settings:
     last_version_check: float = 0  # Last version check timestamp
     latest_known_version: str = ""  # Latest version found during check
     auto_check_updates: bool = True  # Automatically check for updates
+    # What to do with breaks missed while suspended/paused: "skip", "coalesce" (one now) or "defer" (shortly after)
+    missed_break_policy: str = "skip"
+    # Break overlay drawing: "widgets" (Tk labels) or "image" (Pillow-composited frame, falls back to widgets)
+    overlay_renderer: str = "widgets"
+    # Serve /status and /metrics over HTTP on 127.0.0.1:52847 (the single-instance port)
+    metrics_endpoint: bool = False
     # Note: These are now the production defaults (9-5, 1hr intervals, 30sec breaks)
 
     def parse_active_from(self) -> time:
@@ -98,22 +108,18 @@ def get_default_settings() -> Settings:
     )
 
 
-def load_settings() -> Settings:
+def _read_settings_file(path: str) -> Settings:
     try:
-        with _lock:
-            path = _config_path()
-            if not os.path.exists(path):
-                return get_default_settings()
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            # Handle legacy break_offset_minutes field
-            if 'break_offset_minutes' in data and 'trigger_at_minute' not in data:
-                data['trigger_at_minute'] = data['break_offset_minutes']
-            if 'break_offset_minutes' in data:
-                del data['break_offset_minutes']
-            # Use default settings as base, override with saved data
-            defaults = asdict(get_default_settings())
-            return Settings(**{**defaults, **data})
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        # Handle legacy break_offset_minutes field
+        if 'break_offset_minutes' in data and 'trigger_at_minute' not in data:
+            data['trigger_at_minute'] = data['break_offset_minutes']
+        if 'break_offset_minutes' in data:
+            del data['break_offset_minutes']
+        # Use default settings as base, override with saved data
+        defaults = asdict(get_default_settings())
+        return Settings(**{**defaults, **data})
     except (json.JSONDecodeError, TypeError, ValueError) as e:
         # Log error and return defaults for corrupted config
         import logging
@@ -123,6 +129,122 @@ def load_settings() -> Settings:
         return get_default_settings()
 
 
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class SettingsStore:
+    """Process-wide parsed settings, re-read only when config.json changes on disk.
+
+    get() costs one os.stat; the file is parsed again only if its mtime or size
+    changed. Subscribers are called with (settings, changed_field_names) whenever
+    a new version is seen, whether it came from disk or from save_settings().
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self._path = path
+        self._settings: Optional[Settings] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._subscribers: List[Callable[[Settings, Tuple[str, ...]], None]] = []
+        self.disk_reads = 0
+
+    @property
+    def path(self) -> str:
+        return self._path or _config_path()
+
+    def get(self) -> Settings:
+        """The shared Settings instance; treat it as read-only."""
+        path = self.path
+        stamp = _file_stamp(path)
+        with _lock:
+            if self._settings is not None and stamp == self._stamp:
+                return self._settings
+            if stamp is None:
+                settings = get_default_settings()
+            else:
+                settings = _read_settings_file(path)
+                self.disk_reads += 1
+                get_metrics().counter("settings.reload").inc()
+            changed = self._swap(settings, stamp)
+        self._notify(settings, changed)
+        return settings
+
+    def publish(self, settings: Settings) -> None:
+        """Make not-yet-saved settings current in memory and notify subscribers.
+
+        The file stamp is kept, so get() keeps returning these until the file
+        changes; the pending write then lands without a re-read.
+        """
+        settings = replace(settings)
+        with _lock:
+            changed = self._swap(settings, self._stamp)
+        self._notify(settings, changed)
+
+    def invalidate(self) -> None:
+        """Force the next get() to re-read the file."""
+        with _lock:
+            self._stamp = None
+
+    def _stored(self, settings: Settings, stamp: Optional[Tuple[int, int]]) -> None:
+        """Adopt settings that were just written, so the write is not read back."""
+        settings = replace(settings)
+        with _lock:
+            changed = self._swap(settings, stamp)
+        self._notify(settings, changed)
+
+    def _swap(self, settings: Settings, stamp: Optional[Tuple[int, int]]) -> Tuple[str, ...]:
+        previous = self._settings
+        self._settings = settings
+        self._stamp = stamp
+        if previous is None:
+            return ()
+        old, new = asdict(previous), asdict(settings)
+        return tuple(name for name in new if old.get(name) != new[name])
+
+    def _notify(self, settings: Settings, changed: Tuple[str, ...]) -> None:
+        if not changed:
+            return
+        for callback in list(self._subscribers):
+            try:
+                callback(settings, changed)
+            except Exception as e:
+                import logging
+                logging.error(f"[Settings] Subscriber failed: {e}")
+
+    def subscribe(self, callback: Callable[[Settings, Tuple[str, ...]], None]) -> Callable[[], None]:
+        """Call ``callback(settings, changed_fields)`` on every change; returns an unsubscribe function."""
+        self._subscribers.append(callback)
+
+        def unsubscribe():
+            try:
+                self._subscribers.remove(callback)
+            except ValueError:
+                pass
+        return unsubscribe
+
+
+_store = SettingsStore()
+
+
+def get_settings_store() -> SettingsStore:
+    return _store
+
+
+def get_settings() -> Settings:
+    """Current settings, shared and cached; do not modify the returned object."""
+    return _store.get()
+
+
+def load_settings() -> Settings:
+    """A private copy of the current settings that the caller may modify and save."""
+    return replace(_store.get())
+
+
+@traced("settings.save")
 def save_settings(settings: Settings) -> None:
     with _lock:
         _ensure_dir(_config_dir())
@@ -136,3 +258,113 @@ def save_settings(settings: Settings) -> None:
             # Fallback copy
             with open(path, "w", encoding="utf-8") as f:
                 json.dump(asdict(settings), f, indent=2)
+        stamp = _file_stamp(path)
+    get_metrics().counter("disk.settings_write").inc()
+    if path == _store.path:
+        _store._stored(settings, stamp)
+
+
+class SettingsWriter:
+    """Persists settings from a background thread, only when something changed.
+
+    request() marks the settings as possibly modified. The writer waits until
+    requests have been quiet for ``delay`` seconds (but no longer than
+    ``max_delay`` after the first one), compares the settings with what it
+    last wrote and does one atomic save if any field differs. Every
+    ``check_interval`` seconds it also compares without being asked, which
+    picks up fields that were changed in place without a request.
+    """
+
+    def __init__(self, get_current: Callable[[], Settings], delay: float = 1.0,
+                 max_delay: float = 5.0, check_interval: float = 300.0):
+        import time as _time
+
+        self._get_current = get_current
+        self._time = _time.monotonic
+        self.delay = delay
+        self.max_delay = max_delay
+        self.check_interval = check_interval
+        self._saved = asdict(get_current())
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._first_request: Optional[float] = None
+        self._last_request: Optional[float] = None
+        self._next_check = self._time() + check_interval
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self.writes = 0
+        self.skipped = 0
+
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="SettingsWriter", daemon=True)
+        self._thread.start()
+
+    def request(self) -> None:
+        """Note that settings may have changed; safe to call from any thread."""
+        _store.publish(self._get_current())
+        with self._cond:
+            now = self._time()
+            if self._first_request is None:
+                self._first_request = now
+            self._last_request = now
+            self._cond.notify()
+
+    def dirty_fields(self) -> Tuple[str, ...]:
+        current = asdict(self._get_current())
+        return tuple(name for name in current if self._saved.get(name) != current[name])
+
+    def flush(self) -> bool:
+        """Write now if anything changed; returns whether a write happened."""
+        with self._cond:
+            self._first_request = self._last_request = None
+        return self._write()
+
+    def stop(self) -> None:
+        """Flush pending changes and stop the writer thread."""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running:
+                    now = self._time()
+                    if self._last_request is not None:
+                        due = min(self._last_request + self.delay, self._first_request + self.max_delay)
+                    else:
+                        due = self._next_check
+                    if now >= due:
+                        break
+                    self._cond.wait(due - now)
+                if not self._running:
+                    return
+                self._first_request = self._last_request = None
+                self._next_check = self._time() + self.check_interval
+            try:
+                self._write()
+            except Exception as e:
+                import logging
+                logging.error(f"[Settings] Background save failed: {e}")
+
+    def _write(self) -> bool:
+        with self._write_lock:
+            settings = replace(self._get_current())
+            data = asdict(settings)
+            changed = [name for name in data if self._saved.get(name) != data[name]]
+            if not changed:
+                self.skipped += 1
+                return False
+            save_settings(settings)
+            self._saved = data
+            self.writes += 1
+        import logging
+        logging.info(f"[Settings] Saved ({', '.join(changed)})")
+        return True
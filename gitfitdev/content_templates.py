@@ -0,0 +1,140 @@
+"""Activity texts compiled into templates with typed duration and rep slots.
+
+Exercise and stretch descriptions mention durations and repetitions ("hold
+20 sec", "15 sec each side", "10 times") that have to be clamped to the break
+length. Instead of regex-rewriting the (possibly translated) text on every
+break, each English description is parsed once: every number becomes a slot
+whose kind says how it scales. The translated text is split at its numbers and
+its slots are mapped positionally onto the English ones; translations carry
+the same numbers in the same order, which is also what the translation
+lookup relies on. Rendering for a break length is then a slot fill, memoized
+per (kind, description, max_duration, language).
+
+If a translation's numbers cannot be matched up with the English ones, the
+translated text is used unchanged rather than guessed at.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple, Union
+
+# A number, optionally a range, optionally preceded by "hold", with the unit after it
+_SLOT_RE = re.compile(
+    r"(?P<hold>\bhold )?(?P<a>\d+)(?:-(?P<b>\d+))?"
+    r"(?P<unit> seconds each| sec each| seconds| sec| times each| times)?"
+)
+_NUMBER_RE = re.compile(r"\d+")
+
+MIN_SECONDS = 3
+MIN_REPS = 3
+
+_UNIT_KINDS = {
+    " sec each": "each_seconds",
+    " seconds each": "each_seconds",
+    " seconds": "seconds",
+    " times each": "each_times",
+    " times": "times",
+}
+
+
+@dataclass(frozen=True)
+class Slot:
+    """One number (or low-high range) in an activity text."""
+    kind: str                 # fixed, seconds, each_seconds, range_seconds, times, each_times, hold
+    values: Tuple[int, ...]   # original number(s); two for a range
+
+    @property
+    def width(self) -> int:
+        """How many numbers of the text this slot covers."""
+        return len(self.values)
+
+    def render(self, max_duration: int) -> Tuple[int, ...]:
+        kind = self.kind
+        n = self.values[0]
+        if kind == "fixed":
+            return self.values
+        if kind == "seconds":
+            return (max(MIN_SECONDS, min(n, max_duration)),)
+        if kind == "each_seconds":
+            # Time per side: half the break at most
+            return (max(MIN_SECONDS, min(n, max_duration // 2)),)
+        if kind == "hold":
+            return (min(n, max_duration),)
+        if kind == "range_seconds":
+            high = max(MIN_SECONDS, min(self.values[1], max_duration))
+            low = max(MIN_SECONDS, min(n, high - 5, max_duration - 10))
+            return low, max(low + 5, high)
+        if kind == "times":
+            # About 2 seconds per repetition
+            return (n if n * 2 <= max_duration else max(MIN_REPS, max_duration // 2),)
+        if kind == "each_times":
+            return (n if n * 2 <= max_duration // 2 else max(MIN_REPS, max_duration // 4),)
+        return self.values
+
+
+@dataclass(frozen=True)
+class ActivityTemplate:
+    """Literal text interleaved with slot references."""
+    parts: Tuple[Union[str, Tuple[int, int]], ...]   # strings, or (slot index, number within the slot)
+    slots: Tuple[Slot, ...]
+
+    def render(self, max_duration: int) -> str:
+        values = [slot.render(max_duration) for slot in self.slots]
+        return "".join(part if isinstance(part, str) else str(values[part[0]][part[1]])
+                       for part in self.parts)
+
+
+def parse_slots(text: str) -> Tuple[Slot, ...]:
+    """Classify every number of an English activity text."""
+    slots = []
+    for m in _SLOT_RE.finditer(text):
+        unit = m.group("unit")
+        a, b = int(m.group("a")), m.group("b")
+        if b is not None:
+            if unit == " seconds":
+                slots.append(Slot("range_seconds", (a, int(b))))
+                continue
+            # Only the number next to the unit scales, as in "5-10 times"
+            slots.append(Slot("fixed", (a,)))
+            a = int(b)
+        if unit == " sec":
+            kind = "hold" if m.group("hold") else "fixed"
+        else:
+            kind = _UNIT_KINDS.get(unit, "fixed")
+        slots.append(Slot(kind, (a,)))
+    return tuple(slots)
+
+
+def compile_template(english: str, text: str) -> ActivityTemplate:
+    """Template for ``text`` (a translation of ``english``, or the same string)."""
+    slots = parse_slots(english)
+    refs = [(index, offset) for index, slot in enumerate(slots) for offset in range(slot.width)]
+    pieces = _NUMBER_RE.split(text)
+    if len(pieces) - 1 != len(refs):
+        return ActivityTemplate((text,), ())
+
+    parts = []
+    for piece, ref in zip(pieces, refs):
+        if piece:
+            parts.append(piece)
+        parts.append(ref)
+    if pieces[-1]:
+        parts.append(pieces[-1])
+    return ActivityTemplate(tuple(parts), slots)
+
+
+@lru_cache(maxsize=1024)
+def get_template(kind: str, description: str, language: str) -> ActivityTemplate:
+    """Compiled template of an exercise or stretch description in a language."""
+    from .fitness_translations import translate_exercise, translate_stretch
+
+    translate = translate_exercise if kind == "exercise" else translate_stretch
+    text = description if language == "en" else translate(description, language)
+    return compile_template(description, text)
+
+
+@lru_cache(maxsize=4096)
+def render_activity(kind: str, description: str, max_duration: int, language: str = "en") -> str:
+    """Translated description with durations and reps fitted to ``max_duration`` seconds."""
+    return get_template(kind, description, language).render(max_duration)
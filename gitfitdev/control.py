@@ -0,0 +1,302 @@
+"""Local control channel for a running instance.
+
+The app listens on a Unix-domain socket (``~/.gitfitdev/control.sock``) or,
+on Windows, a per-user named pipe. Each connection carries one JSON request
+and one JSON response:
+
+    {"command": "snooze", "args": ["10"]}
+    {"ok": true, "result": {...}}            or  {"ok": false, "error": "..."}
+
+Connections are authenticated with a random key kept in
+``~/.gitfitdev/control.key`` (readable by the user only).
+
+Commands: pause, resume, toggle-pause, snooze MINUTES, trigger, skip, status,
+stats, settings, trace on|off|flush|status, quit, and argv (a second launch
+forwarding its command line).
+
+Usage:
+    python -m gitfitdev ctl status
+    python -m gitfitdev ctl snooze 10
+    python -m gitfitdev ctl --json stats
+"""
+
+import getpass
+import json
+import logging
+import os
+import secrets
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener, answer_challenge, deliver_challenge
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence
+
+COMMANDS = ("pause", "resume", "toggle-pause", "snooze", "trigger", "skip", "status", "stats",
+            "settings", "trace", "quit", "argv")
+
+APP_LABEL = "GitFit.dev"
+
+# Longest a command may take on the Tk thread before the client gets an error
+HANDLER_TIMEOUT = 5.0
+
+# Longest either side waits for the other's part of the authentication handshake
+HANDSHAKE_TIMEOUT = 2.0
+
+# How long a second launch waits for the control channel of an instance that is still starting
+FORWARD_RETRY_SECONDS = 2.0
+FORWARD_RETRY_INTERVAL = 0.1
+
+
+class ControlError(Exception):
+    """No running instance answered, or it refused the command."""
+
+
+class NotRunningError(ControlError):
+    """Nothing is accepting connections on the control channel."""
+
+
+def _data_dir() -> Path:
+    return Path.home() / ".gitfitdev"
+
+
+def control_address() -> str:
+    if sys.platform.startswith("win"):
+        return rf"\\.\pipe\GitFitDev-{getpass.getuser()}"
+    return str(_data_dir() / "control.sock")
+
+
+def _family() -> str:
+    return "AF_PIPE" if sys.platform.startswith("win") else "AF_UNIX"
+
+
+def _key_path() -> Path:
+    return _data_dir() / "control.key"
+
+
+def _create_key() -> bytes:
+    """A fresh key, written so only the current user can read it."""
+    key = secrets.token_bytes(32)
+    path = _key_path()
+    path.parent.mkdir(exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    os.replace(tmp, path)
+    return key
+
+
+def _read_key() -> bytes:
+    try:
+        return _key_path().read_bytes()
+    except OSError as e:
+        raise NotRunningError(f"{APP_LABEL} is not running") from e
+
+
+class _TimedConnection:
+    """A connection whose reads fail after ``timeout`` seconds without data.
+
+    Only what the multiprocessing challenge functions use, so that a peer
+    that never answers the handshake cannot block the other side.
+    """
+
+    def __init__(self, conn, timeout: float):
+        self._conn = conn
+        self._timeout = timeout
+
+    def send_bytes(self, data: bytes):
+        self._conn.send_bytes(data)
+
+    def recv_bytes(self, maxlength: Optional[int] = None) -> bytes:
+        if not self._conn.poll(self._timeout):
+            raise TimeoutError(f"no handshake reply within {self._timeout:.0f}s")
+        return self._conn.recv_bytes(maxlength)
+
+
+class ControlServer:
+    """Accepts control connections on a background thread.
+
+    Handlers run on the Tk thread through ``call_in_tk``; the connection
+    thread waits for their result and sends it back.
+    """
+
+    def __init__(self, handlers: Dict[str, Callable[[Sequence[str]], object]],
+                 call_in_tk: Callable[[Callable[[], None]], None]):
+        self._handlers = handlers
+        self._call_in_tk = call_in_tk
+        self._listener: Optional[Listener] = None
+        self._key = b""
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def start(self):
+        address = control_address()
+        if _family() == "AF_UNIX" and os.path.exists(address):
+            # Left over from an instance that did not exit cleanly; we hold the single-instance lock
+            os.unlink(address)
+        self._key = _create_key()
+        # Authenticated in each connection's thread (_handle): Listener's own
+        # handshake would run in accept() and a silent client would block it
+        self._listener = Listener(address, family=_family())
+        if _family() == "AF_UNIX":
+            os.chmod(address, 0o600)
+        self._thread = threading.Thread(target=self._serve, name="ControlServer", daemon=True)
+        self._thread.start()
+        logging.info(f"[Control] Listening on {address}")
+
+    def stop(self):
+        self._stopped = True
+        listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        address = listener.address
+        try:
+            listener.close()
+        except OSError:
+            pass
+        if _family() == "AF_UNIX":
+            try:
+                os.unlink(address)
+            except OSError:
+                pass
+
+    def _serve(self):
+        while not self._stopped:
+            listener = self._listener
+            if listener is None:
+                return
+            try:
+                conn = listener.accept()
+            except Exception as e:
+                if self._stopped:
+                    return
+                # A client that went away
+                logging.warning(f"[Control] Failed to accept a connection: {e}")
+                continue
+            threading.Thread(target=self._handle, args=(conn,), name="ControlRequest", daemon=True).start()
+
+    def _handle(self, conn):
+        with conn:
+            try:
+                timed = _TimedConnection(conn, HANDSHAKE_TIMEOUT)
+                deliver_challenge(timed, self._key)
+                answer_challenge(timed, self._key)
+            except (AuthenticationError, OSError, EOFError) as e:
+                logging.warning(f"[Control] Rejected connection: {e}")
+                return
+            try:
+                request = json.loads(conn.recv_bytes(65536).decode("utf-8"))
+                response = {"ok": True, "result": self._dispatch(request)}
+            except Exception as e:
+                response = {"ok": False, "error": str(e)}
+            try:
+                conn.send_bytes(json.dumps(response, default=str).encode("utf-8"))
+            except OSError:
+                pass
+
+    def _dispatch(self, request: dict):
+        command = request.get("command")
+        args = [str(arg) for arg in request.get("args", [])]
+        handler = self._handlers.get(command)
+        if handler is None:
+            raise ValueError(f"unknown command {command!r}")
+        logging.info(f"[Control] {command} {' '.join(args)}".rstrip())
+        future = Future()
+
+        def run():
+            try:
+                future.set_result(handler(args))
+            except Exception as e:
+                future.set_exception(e)
+        self._call_in_tk(run)
+        return future.result(timeout=HANDLER_TIMEOUT)
+
+
+def send_command(command: str, args: Sequence[str] = (), timeout: float = HANDLER_TIMEOUT + 1):
+    """Send one command to the running instance and return its result."""
+    key = _read_key()
+    try:
+        conn = Client(control_address(), family=_family())
+    except (OSError, EOFError) as e:
+        raise NotRunningError(f"{APP_LABEL} is not running") from e
+    with conn:
+        try:
+            timed = _TimedConnection(conn, HANDSHAKE_TIMEOUT)
+            answer_challenge(timed, key)
+            deliver_challenge(timed, key)
+        except TimeoutError as e:
+            raise ControlError(f"{APP_LABEL} is not responding") from e
+        except (OSError, EOFError, AuthenticationError) as e:
+            # AuthenticationError: a key left by an earlier instance, before the new one replaced it
+            raise NotRunningError(f"{APP_LABEL} is not running") from e
+        conn.send_bytes(json.dumps({"command": command, "args": list(args)}).encode("utf-8"))
+        if not conn.poll(timeout):
+            raise ControlError(f"no answer to {command} within {timeout:.0f}s")
+        response = json.loads(conn.recv_bytes().decode("utf-8"))
+    if not response.get("ok"):
+        raise ControlError(response.get("error", "command failed"))
+    return response.get("result")
+
+
+def forward_argv(argv: Sequence[str], retry_seconds: float = FORWARD_RETRY_SECONDS) -> bool:
+    """Hand a second launch's command line to the running instance; False if none answered.
+
+    The running instance opens its control channel only once its tray icon
+    is up, so a launch during its startup keeps trying for ``retry_seconds``.
+    """
+    deadline = time.monotonic() + retry_seconds
+    while True:
+        try:
+            send_command("argv", argv)
+            return True
+        except NotRunningError as e:
+            if time.monotonic() < deadline:
+                time.sleep(FORWARD_RETRY_INTERVAL)
+                continue
+            error = e
+        except ControlError as e:
+            error = e
+        logging.info(f"[Control] Could not forward {' '.join(argv)}: {error}")
+        return False
+
+
+def _print_result(result):
+    if isinstance(result, dict):
+        for key, value in result.items():
+            if isinstance(value, dict):
+                print(f"{key}:")
+                for sub_key, sub_value in value.items():
+                    print(f"  {sub_key}: {sub_value}")
+            else:
+                print(f"{key}: {value}")
+    elif result is not None:
+        print(result)
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m gitfitdev ctl",
+                                     description="Control the running GitFit.dev instance.")
+    parser.add_argument("--json", action="store_true", help="print the raw JSON result")
+    parser.add_argument("command", choices=[c for c in COMMANDS if c != "argv"])
+    parser.add_argument("args", nargs="*", help="command arguments (snooze: minutes; trace: on, off, flush)")
+    args = parser.parse_args(argv)
+
+    try:
+        result = send_command(args.command, args.args)
+    except ControlError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    if args.json:
+        print(json.dumps(result, indent=2, default=str))
+    else:
+        _print_result(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,376 @@
+"""GUI-free scheduling engine shared by the Tk and PyQt front ends.
+
+SchedulingEngine owns the break schedule (calendar, pre-warnings, snooze,
+missed-break handling, clock-jump detection) but not the waiting: a front
+end drives it with a single timer. Call poll(), sleep for the number of
+seconds it returns, call after_wake() and poll again. Anything that changes
+the schedule calls the waker the driver registered, so the driver cancels
+its timer and polls right away.
+
+What happens is reported as typed events (PreWarning, BreakDue,
+ActiveWindowChanged, ScheduleChanged) to subscribers, always from inside poll(), i.e. on
+whatever thread the driver runs it on.
+
+Importing this module needs neither Tk, PyQt, pystray nor Pillow.
+"""
+
+import logging
+import math
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Type
+
+from .break_calendar import get_break_calendar
+from .clock import Clock, ClockWatcher, MISSED_BREAK_POLICIES, get_clock
+from .config import Settings
+from .tracing import span
+
+
+@dataclass(frozen=True)
+class PreWarning:
+    """A break is coming up in ``seconds``."""
+    seconds: int
+    break_at: datetime
+
+
+@dataclass(frozen=True)
+class BreakDue:
+    """A break should start now."""
+    due_at: datetime
+    fired_at: datetime
+    manual: bool = False
+
+
+@dataclass(frozen=True)
+class ActiveWindowChanged:
+    """The active hours started or ended (also sent once on the first poll)."""
+    active: bool
+    at: datetime
+
+
+@dataclass(frozen=True)
+class ScheduleChanged:
+    """The next break, the snooze or the paused state changed (also sent once on the first poll)."""
+    next_fire: Optional[datetime]
+    snooze_until: Optional[datetime]
+    paused: bool
+
+
+class SchedulingEngine:
+    """Deadline-driven break scheduler.
+
+    Instead of polling once a second, the engine works out the next moment
+    something can happen (pre-warning, break, snooze expiry or an active-hours
+    boundary) and tells its driver to sleep until then. Anything that changes
+    the schedule calls wake() so the deadline is recomputed immediately.
+
+    Breaks are planned in wall-clock time but all waiting is monotonic. After
+    each wait the engine checks the clocks for a suspend/resume or a wall
+    clock step; breaks that were missed because of one (or because the app
+    was paused across them) are handled by Settings.missed_break_policy.
+    """
+
+    # Upper bound on a single sleep so a changed wall clock (manual change,
+    # NTP step) is noticed within a minute even if nobody calls wake().
+    MAX_SLEEP_SECONDS = 60.0
+    # A break this late counts as missed rather than merely due
+    MISSED_GRACE_SECONDS = 60.0
+    # How long the "defer" policy waits after the user is back
+    DEFER_SECONDS = 120.0
+
+    def __init__(self, get_settings, clock: Clock = None):
+        self.get_settings = get_settings
+        self.clock = clock or get_clock()
+        self._lock = threading.Lock()
+        self._subscribers: Dict[type, List[Callable]] = {}
+        self._waker: Optional[Callable[[], None]] = None
+        self._watcher = ClockWatcher(self.clock)
+        self.next_fire = None
+        self.last_fired = None
+        self.pre_warning_shown = False
+        self.snooze_until = None
+        self.active = None
+        self._manual = False
+        self.wakeups = 0
+        self.missed_breaks = 0
+        self._started_at = self.clock.monotonic()
+        self._last_status_log = None
+        self._published_schedule = None
+
+    # --- Events ---
+
+    def subscribe(self, event_type: Type, callback: Callable) -> Callable[[], None]:
+        """Call ``callback(event)`` for every event of ``event_type``; returns an unsubscribe function."""
+        with self._lock:
+            self._subscribers.setdefault(event_type, []).append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                try:
+                    self._subscribers.get(event_type, []).remove(callback)
+                except ValueError:
+                    pass
+        return unsubscribe
+
+    def _emit(self, event):
+        with self._lock:
+            callbacks = list(self._subscribers.get(type(event), ()))
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                logging.error(f"[Scheduler] {type(event).__name__} handler failed: {e}", exc_info=True)
+
+    # --- Driving ---
+
+    def set_waker(self, waker: Optional[Callable[[], None]]):
+        """Register the driver callback that makes it poll again as soon as possible."""
+        self._waker = waker
+
+    def wake(self):
+        """Make the driver re-evaluate the deadlines right away. Safe from any thread."""
+        waker = self._waker
+        if waker is not None:
+            waker()
+
+    def prime(self):
+        """Compute the first break; drivers call this once before the first poll()."""
+        s: Settings = self.get_settings()
+        with self._lock:
+            self.next_fire = self._compute_next_fire(s, self.clock.now())
+        logging.info(f"[Scheduler] Initial next break scheduled for: {self._format_next_fire()}")
+        self._started_at = self.clock.monotonic()
+        self._watcher.reset()
+
+    def poll(self) -> float:
+        """Handle whatever is due now; returns how long to sleep before polling again."""
+        delay = self._step()
+        self._emit_schedule_change()
+        return delay
+
+    def _emit_schedule_change(self):
+        # Everything that changes the schedule wakes the driver, so one check per poll sees it
+        paused = bool(self.get_settings().paused)
+        with self._lock:
+            state = ScheduleChanged(self.next_fire, self.snooze_until, paused)
+            if state == self._published_schedule:
+                return
+            self._published_schedule = state
+        self._emit(state)
+
+    def after_wake(self, slept_for: float):
+        """Bookkeeping after a sleep of (at most) ``slept_for`` seconds."""
+        self.wakeups += 1
+        self._check_clock(slept_for)
+
+    def _check_clock(self, expected_sleep: float):
+        jump = self._watcher.check(expected_sleep)
+        if jump is None:
+            return
+        logging.info(f"[Scheduler] Clock {jump.kind} jump detected: wall moved {jump.wall_delta:.0f}s, "
+                     f"monotonic {jump.mono_delta:.0f}s ({jump.before.strftime('%H:%M:%S')} -> "
+                     f"{jump.after.strftime('%H:%M:%S')})")
+        if jump.kind == "backward":
+            # Breaks between the new time and the last one shown were already taken
+            s: Settings = self.get_settings()
+            with self._lock:
+                anchor = max(jump.after, self.last_fired) if self.last_fired else jump.after
+                self.next_fire = self._compute_next_fire(s, anchor)
+                self.pre_warning_shown = False
+            logging.info(f"[Scheduler] Next break after clock change: {self._format_next_fire()}")
+        # Forward jumps and stalls leave next_fire in the past; _step applies the missed-break policy
+
+    def _step(self) -> float:
+        """Run everything that is due now and return seconds until the next deadline."""
+        s: Settings = self.get_settings()
+        now = self.clock.now()
+
+        active = self._within_hours(s, now)
+        if active != self.active:
+            self.active = active
+            self._emit(ActiveWindowChanged(active, now))
+
+        if s.paused:
+            self._log_idle_status(s, now)
+            # Only an explicit resume (which calls wake()) can change anything
+            return self.MAX_SLEEP_SECONDS
+
+        with self._lock:
+            # Clear snooze if expired
+            if self.snooze_until and now >= self.snooze_until:
+                overdue = (now - self.snooze_until).total_seconds() > self.MISSED_GRACE_SECONDS
+                self.snooze_until = None
+                if not overdue:
+                    # Reset next fire time after snooze
+                    self.next_fire = now + timedelta(seconds=5)  # Quick trigger after snooze
+                    self.pre_warning_shown = False
+                # else: slept through the snooze; the missed-break policy below decides
+
+            if (self.next_fire and not self.snooze_until
+                    and (now - self.next_fire).total_seconds() > self.MISSED_GRACE_SECONDS):
+                self._apply_missed_policy(s, now)
+
+        if not active:
+            # Breaks themselves always lie inside the window, but the pre-warning for
+            # one at the window start, a snoozed break or a manual trigger may not
+            wake_at = get_break_calendar(s).next_window_start(now)
+            with self._lock:
+                lead = timedelta(seconds=s.pre_warning_seconds if s.pre_warning else 0)
+                starts_at = self.next_fire - lead if self.next_fire else None
+                pending = self.snooze_until is not None or (starts_at is not None and starts_at <= now)
+            if not pending:
+                self._log_idle_status(s, now)
+                if starts_at is not None and now < starts_at < wake_at:
+                    wake_at = starts_at
+                return self._seconds_until(wake_at, now)
+
+        with self._lock:
+            # Check if we're in snooze period
+            if self.snooze_until and now < self.snooze_until:
+                return self._seconds_until(self.snooze_until, now)
+
+            next_fire = self.next_fire
+            manual = self._manual
+            show_warning = False
+            if s.pre_warning and next_fire and not self.pre_warning_shown:
+                time_until = (next_fire - now).total_seconds()
+                if 0 < time_until <= s.pre_warning_seconds:
+                    show_warning = True
+                    self.pre_warning_shown = True
+
+        # Subscribers run outside the lock: they may call back into the engine
+        if show_warning:
+            # Round up to avoid showing N-1 seconds
+            seconds_to_show = math.ceil((next_fire - now).total_seconds())
+            logging.info(f"[Scheduler] Showing pre-warning: {seconds_to_show} seconds until break")
+            self._emit(PreWarning(seconds_to_show, next_fire))
+
+        if next_fire and now >= next_fire:
+            logging.info(f"[Scheduler] Triggering break at {now.strftime('%H:%M:%S')}")
+            with span("scheduler.break_due", manual=manual):
+                self._emit(BreakDue(next_fire, now, manual))
+            with self._lock:
+                self._manual = False
+                self.last_fired = max(now, next_fire)
+                # A subscriber may already have rescheduled (e.g. skipped break)
+                if self.next_fire == next_fire:
+                    self.next_fire = self._compute_next_fire(s, self.last_fired)
+                    self.pre_warning_shown = False
+            logging.info(f"[Scheduler] Next break scheduled for: {self._format_next_fire()} "
+                         f"({self.wakeups_per_hour():.1f} wakeups/hour)")
+
+        return self._seconds_until_next_deadline(s)
+
+    def _apply_missed_policy(self, s: Settings, now: datetime):
+        """Deal with a next_fire that is well in the past. Called with _lock held."""
+        calendar = get_break_calendar(s)
+        missed = 1 + len(calendar.breaks_between(self.next_fire, now))
+        self.missed_breaks += missed
+        policy = getattr(s, "missed_break_policy", "skip")
+        if policy not in MISSED_BREAK_POLICIES:
+            policy = "skip"
+
+        upcoming = calendar.next_break(now)
+        if not calendar.in_window(now):
+            # Never make up for missed breaks outside the active hours
+            policy = "skip"
+        if policy == "coalesce":
+            # One break right away stands in for all of them
+            self.next_fire = now
+            self.pre_warning_shown = True
+        elif policy == "defer":
+            deferred = now + timedelta(seconds=self.DEFER_SECONDS)
+            self.next_fire = min(deferred, upcoming) if upcoming else deferred
+            self.pre_warning_shown = False
+        else:
+            self.next_fire = upcoming
+            self.pre_warning_shown = False
+        logging.info(f"[Scheduler] {missed} missed break(s), policy '{policy}': next break {self._format_next_fire()}")
+
+    def _seconds_until_next_deadline(self, s: Settings) -> float:
+        now = self.clock.now()
+        deadlines = []
+        with self._lock:
+            if self.snooze_until:
+                deadlines.append(self.snooze_until)
+            if self.next_fire:
+                deadlines.append(self.next_fire)
+                warn_at = self._pre_warning_time(s)
+                if warn_at is not None and warn_at > now:
+                    deadlines.append(warn_at)
+        # Leaving the active window changes what the tray reports
+        end = datetime.combine(now.date(), s.parse_active_to()) + timedelta(minutes=1)
+        if end > now:
+            deadlines.append(end)
+        if not deadlines:
+            return self.MAX_SLEEP_SECONDS
+        return self._seconds_until(min(deadlines), now)
+
+    def _pre_warning_time(self, s: Settings):
+        """When the pending pre-warning is due, or None. Called with _lock held."""
+        if not s.pre_warning or not self.next_fire or self.pre_warning_shown:
+            return None
+        return self.next_fire - timedelta(seconds=s.pre_warning_seconds)
+
+    def _seconds_until(self, deadline: datetime, now: datetime) -> float:
+        return min(max((deadline - now).total_seconds(), 0.0), self.MAX_SLEEP_SECONDS)
+
+    def _log_idle_status(self, s: Settings, now: datetime):
+        # Log every 30 seconds at most when outside active hours or paused
+        if self._last_status_log and (now - self._last_status_log).total_seconds() <= 30:
+            return
+        if s.paused:
+            logging.debug("[Scheduler] Currently paused")
+        else:
+            logging.debug(f"[Scheduler] Outside active hours ({s.active_from} - {s.active_to})")
+        logging.debug(f"[Scheduler] {self.wakeups_per_hour():.1f} wakeups/hour")
+        self._last_status_log = now
+
+    def _compute_next_fire(self, s: Settings, now: datetime):
+        return get_break_calendar(s).next_break(now)
+
+    def _format_next_fire(self) -> str:
+        next_fire = self.next_fire
+        return next_fire.strftime('%Y-%m-%d %H:%M:%S') if next_fire else "never (no breaks in active hours)"
+
+    def wakeups_per_hour(self) -> float:
+        """Average number of scheduler wakeups per hour since start."""
+        elapsed = self.clock.monotonic() - self._started_at
+        if elapsed <= 0:
+            return 0.0
+        return self.wakeups * 3600.0 / elapsed
+
+    def snooze(self, minutes=5):
+        """Snooze the next break for specified minutes."""
+        with self._lock:
+            self.snooze_until = self.clock.now() + timedelta(minutes=minutes)
+            self.pre_warning_shown = False
+        self.wake()
+
+    def trigger_now(self):
+        """Trigger break immediately."""
+        with self._lock:
+            self.next_fire = self.clock.now()
+            self.pre_warning_shown = True  # Skip pre-warning for manual trigger
+            self._manual = True
+        self.wake()
+
+    def reschedule(self, when: datetime):
+        """Move the next break to a specific time."""
+        with self._lock:
+            self.next_fire = when
+            self.pre_warning_shown = False
+        self.wake()
+
+    def recalculate_next_fire(self):
+        """Recalculate the next break time based on current settings."""
+        with self._lock:
+            s: Settings = self.get_settings()
+            self.next_fire = self._compute_next_fire(s, self.clock.now())
+            self.pre_warning_shown = False
+        logging.info(f"[Scheduler] Recalculated next break for: {self._format_next_fire()}")
+        self.wake()
+
+    def _within_hours(self, s: Settings, now: datetime = None) -> bool:
+        return get_break_calendar(s).in_window(now or self.clock.now())
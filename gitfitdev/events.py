@@ -0,0 +1,141 @@
+"""In-process state-change notifications.
+
+Model code publishes typed events on the shared bus; the tracker reports
+TrackerChanged after every recorded event, and the app forwards the
+scheduling engine's ScheduleChanged. Consumers subscribe instead of polling
+or recomputing on a timer:
+
+    unsubscribe = get_event_bus().subscribe(TrackerChanged, on_change)
+
+Bus subscribers run synchronously on the publishing thread. Tk code
+subscribes through get_tk_batcher(root) instead: events published since the
+last frame are collected and delivered together in a single after_idle
+callback on the Tk thread, so a burst of changes costs one UI update.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple, Type
+
+
+@dataclass(frozen=True)
+class TrackerChanged:
+    """Today's tracker data changed."""
+    kind: str  # Journal event type (exercise, stretch, shown, completed, escaped, reset) or "day"
+    revision: int  # DailyTracker.revision after the change
+
+
+class EventBus:
+    """Typed publish/subscribe; subscribers are called on the publishing thread."""
+
+    def __init__(self):
+        self._subscribers: Dict[type, List[Callable]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, event_type: Type, callback: Callable) -> Callable[[], None]:
+        """Call ``callback(event)`` for every event of ``event_type``; returns an unsubscribe function."""
+        with self._lock:
+            self._subscribers.setdefault(event_type, []).append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                try:
+                    self._subscribers.get(event_type, []).remove(callback)
+                except ValueError:
+                    pass
+        return unsubscribe
+
+    def publish(self, event) -> None:
+        with self._lock:
+            callbacks = list(self._subscribers.get(type(event), ()))
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                logging.error(f"[Events] {type(event).__name__} handler failed: {e}", exc_info=True)
+
+
+_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    """The process-wide event bus."""
+    return _bus
+
+
+class TkBatcher:
+    """Delivers bus events to Tk code in batches, once per idle pass of the event loop."""
+
+    def __init__(self, root, bus: EventBus = None):
+        self.root = root
+        self._bus = bus or get_event_bus()
+        self._lock = threading.Lock()
+        self._pending: list = []
+        self._scheduled = False
+        self._callbacks: List[Tuple[Tuple[type, ...], Callable]] = []
+        self._bus_subscriptions: Dict[type, Callable[[], None]] = {}
+
+    def subscribe(self, event_types, callback: Callable[[list], None]) -> Callable[[], None]:
+        """Call ``callback(events)`` on the Tk thread with the events of ``event_types`` in each batch."""
+        event_types = tuple(event_types) if isinstance(event_types, (list, tuple)) else (event_types,)
+        entry = (event_types, callback)
+        with self._lock:
+            self._callbacks.append(entry)
+            for event_type in event_types:
+                if event_type not in self._bus_subscriptions:
+                    self._bus_subscriptions[event_type] = self._bus.subscribe(event_type, self._on_event)
+
+        def unsubscribe():
+            with self._lock:
+                try:
+                    self._callbacks.remove(entry)
+                except ValueError:
+                    pass
+        return unsubscribe
+
+    def _on_event(self, event):
+        with self._lock:
+            self._pending.append(event)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        try:
+            self.root.after_idle(self._flush)
+        except Exception:
+            with self._lock:
+                self._scheduled = False  # Tk is shutting down
+
+    def _flush(self):
+        with self._lock:
+            events, self._pending = self._pending, []
+            self._scheduled = False
+            callbacks = list(self._callbacks)
+        for event_types, callback in callbacks:
+            matching = [event for event in events if isinstance(event, event_types)]
+            if not matching:
+                continue
+            try:
+                callback(matching)
+            except Exception as e:
+                logging.error(f"[Events] UI update failed: {e}", exc_info=True)
+
+    def close(self):
+        with self._lock:
+            subscriptions = list(self._bus_subscriptions.values())
+            self._bus_subscriptions.clear()
+            self._callbacks.clear()
+        for unsubscribe in subscriptions:
+            unsubscribe()
+
+
+_batchers: Dict[int, TkBatcher] = {}
+
+
+def get_tk_batcher(root) -> TkBatcher:
+    """The event batcher for a Tk root (any widget of it may be passed)."""
+    root = root._root()
+    batcher = _batchers.get(id(root))
+    if batcher is None or batcher.root is not root:
+        batcher = _batchers[id(root)] = TkBatcher(root)
+    return batcher
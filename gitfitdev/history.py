@@ -0,0 +1,269 @@
+"""Multi-day activity history in SQLite.
+
+Every tracked event (exercise, stretch, break shown/completed/escaped) is kept
+as a row, and triggers maintain per-muscle-group daily, weekly and monthly
+rollups plus per-activity daily counts as rows are inserted or deleted.
+Queries read the rollups, so "last 90 days of coverage" or the current streak
+touch at most a few hundred rows no matter how many years of events exist.
+
+The database runs in WAL mode: a single writer connection serialised by a
+lock, plus one read connection per thread that never waits for the writer.
+"""
+
+import logging
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+ACTIVITIES = ("exercise", "stretch", "shown", "completed", "escaped")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id          INTEGER PRIMARY KEY,
+    ts          TEXT NOT NULL,
+    date        TEXT NOT NULL,
+    week        TEXT NOT NULL,
+    month       TEXT NOT NULL,
+    activity    TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_events_activity_date ON events (activity, date);
+CREATE INDEX IF NOT EXISTS idx_events_date ON events (date);
+
+CREATE TABLE IF NOT EXISTS event_muscles (
+    event_id     INTEGER NOT NULL REFERENCES events (id) ON DELETE CASCADE,
+    date         TEXT NOT NULL,
+    muscle_group TEXT NOT NULL,
+    PRIMARY KEY (event_id, muscle_group)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_event_muscles_date_mg ON event_muscles (date, muscle_group);
+
+CREATE TABLE IF NOT EXISTS daily_rollup (
+    date         TEXT NOT NULL,
+    muscle_group TEXT NOT NULL,
+    count        INTEGER NOT NULL,
+    PRIMARY KEY (date, muscle_group)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS weekly_rollup (
+    week         TEXT NOT NULL,
+    muscle_group TEXT NOT NULL,
+    count        INTEGER NOT NULL,
+    PRIMARY KEY (week, muscle_group)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS monthly_rollup (
+    month        TEXT NOT NULL,
+    muscle_group TEXT NOT NULL,
+    count        INTEGER NOT NULL,
+    PRIMARY KEY (month, muscle_group)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS daily_activity (
+    activity TEXT NOT NULL,
+    date     TEXT NOT NULL,
+    count    INTEGER NOT NULL,
+    PRIMARY KEY (activity, date)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_events_insert AFTER INSERT ON events BEGIN
+    INSERT INTO daily_activity (activity, date, count) VALUES (NEW.activity, NEW.date, 1)
+        ON CONFLICT (activity, date) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_events_delete AFTER DELETE ON events BEGIN
+    UPDATE daily_activity SET count = count - 1 WHERE activity = OLD.activity AND date = OLD.date;
+    DELETE FROM daily_activity WHERE activity = OLD.activity AND date = OLD.date AND count <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_muscles_insert AFTER INSERT ON event_muscles BEGIN
+    INSERT INTO daily_rollup (date, muscle_group, count) VALUES (NEW.date, NEW.muscle_group, 1)
+        ON CONFLICT (date, muscle_group) DO UPDATE SET count = count + 1;
+    INSERT INTO weekly_rollup (week, muscle_group, count)
+        VALUES ((SELECT week FROM events WHERE id = NEW.event_id), NEW.muscle_group, 1)
+        ON CONFLICT (week, muscle_group) DO UPDATE SET count = count + 1;
+    INSERT INTO monthly_rollup (month, muscle_group, count)
+        VALUES ((SELECT month FROM events WHERE id = NEW.event_id), NEW.muscle_group, 1)
+        ON CONFLICT (month, muscle_group) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_muscles_delete BEFORE DELETE ON event_muscles BEGIN
+    UPDATE daily_rollup SET count = count - 1
+        WHERE date = OLD.date AND muscle_group = OLD.muscle_group;
+    UPDATE weekly_rollup SET count = count - 1
+        WHERE week = (SELECT week FROM events WHERE id = OLD.event_id) AND muscle_group = OLD.muscle_group;
+    UPDATE monthly_rollup SET count = count - 1
+        WHERE month = (SELECT month FROM events WHERE id = OLD.event_id) AND muscle_group = OLD.muscle_group;
+END;
+"""
+
+
+def week_key(day: date) -> str:
+    """ISO week label, e.g. 2026-W42."""
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def month_key(day: date) -> str:
+    return f"{day.year}-{day.month:02d}"
+
+
+class HistoryStore:
+    """SQLite-backed event history with incrementally maintained rollups."""
+
+    def __init__(self, path: Optional[Path] = None):
+        if path is None:
+            data_dir = Path.home() / '.gitfitdev'
+            data_dir.mkdir(exist_ok=True)
+            path = data_dir / 'history.db'
+        self.path = str(path)
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        self._writer = self._connect()
+        with self._write_lock:
+            self._writer.executescript(_SCHEMA)
+            self._writer.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        with self._write_lock:
+            self._writer.close()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # --- Writes ---
+
+    def record(self, activity: str, muscle_groups: Iterable[str] = (),
+               description: str = "", when: Optional[datetime] = None) -> int:
+        """Store one event and update the rollups; returns the event id."""
+        when = when or datetime.now()
+        day = when.date()
+        with self._write_lock, self._writer:
+            cur = self._writer.execute(
+                "INSERT INTO events (ts, date, week, month, activity, description) VALUES (?, ?, ?, ?, ?, ?)",
+                (when.isoformat(), day.isoformat(), week_key(day), month_key(day), activity, description),
+            )
+            event_id = cur.lastrowid
+            self._writer.executemany(
+                "INSERT OR IGNORE INTO event_muscles (event_id, date, muscle_group) VALUES (?, ?, ?)",
+                [(event_id, day.isoformat(), mg) for mg in muscle_groups],
+            )
+        return event_id
+
+    def clear_day(self, day: Optional[date] = None) -> None:
+        """Delete a day's events; the rollups are decremented accordingly."""
+        day_str = (day or date.today()).isoformat()
+        with self._write_lock, self._writer:
+            self._writer.execute("DELETE FROM event_muscles WHERE date = ?", (day_str,))
+            self._writer.execute("DELETE FROM events WHERE date = ?", (day_str,))
+            for table in ("daily_rollup", "weekly_rollup", "monthly_rollup"):
+                self._writer.execute(f"DELETE FROM {table} WHERE count <= 0")
+
+    # --- Reads ---
+
+    def is_empty(self) -> bool:
+        return self._reader().execute("SELECT 1 FROM events LIMIT 1").fetchone() is None
+
+    def muscle_counts(self, day: Optional[date] = None) -> Dict[str, int]:
+        """Work count per muscle group on one day."""
+        day_str = (day or date.today()).isoformat()
+        rows = self._reader().execute(
+            "SELECT muscle_group, count FROM daily_rollup WHERE date = ?", (day_str,))
+        return {mg: count for mg, count in rows if count > 0}
+
+    def activity_counts(self, day: Optional[date] = None) -> Dict[str, int]:
+        """Events per activity type on one day."""
+        day_str = (day or date.today()).isoformat()
+        rows = self._reader().execute(
+            "SELECT activity, count FROM daily_activity WHERE date = ?", (day_str,))
+        return dict(rows)
+
+    def coverage(self, days: int = 90, end: Optional[date] = None) -> Dict[str, Dict[str, int]]:
+        """Per-day muscle group counts for the ``days`` days ending at ``end``."""
+        end = end or date.today()
+        start = end - timedelta(days=days - 1)
+        result: Dict[str, Dict[str, int]] = {}
+        rows = self._reader().execute(
+            "SELECT date, muscle_group, count FROM daily_rollup WHERE date BETWEEN ? AND ? AND count > 0",
+            (start.isoformat(), end.isoformat()))
+        for day_str, mg, count in rows:
+            result.setdefault(day_str, {})[mg] = count
+        return result
+
+    def weekly_counts(self, day: Optional[date] = None) -> Dict[str, int]:
+        rows = self._reader().execute(
+            "SELECT muscle_group, count FROM weekly_rollup WHERE week = ? AND count > 0",
+            (week_key(day or date.today()),))
+        return dict(rows)
+
+    def monthly_counts(self, day: Optional[date] = None) -> Dict[str, int]:
+        rows = self._reader().execute(
+            "SELECT muscle_group, count FROM monthly_rollup WHERE month = ? AND count > 0",
+            (month_key(day or date.today()),))
+        return dict(rows)
+
+    def active_days(self, activity: str = "completed", days: int = 90,
+                    end: Optional[date] = None) -> List[str]:
+        """Dates (ISO) within the range that have at least one ``activity`` event."""
+        end = end or date.today()
+        start = end - timedelta(days=days - 1)
+        rows = self._reader().execute(
+            "SELECT date FROM daily_activity WHERE activity = ? AND date BETWEEN ? AND ? ORDER BY date",
+            (activity, start.isoformat(), end.isoformat()))
+        return [row[0] for row in rows]
+
+    def streak(self, activity: str = "completed", end: Optional[date] = None) -> int:
+        """Consecutive days up to ``end`` with at least one ``activity`` event.
+
+        A day that has no events yet does not break the streak until it is over.
+        """
+        end = end or date.today()
+        rows = self._reader().execute(
+            "SELECT date FROM daily_activity WHERE activity = ? AND date <= ? AND count > 0 ORDER BY date DESC",
+            (activity, end.isoformat()))
+        expected = end
+        streak = 0
+        for (day_str,) in rows:
+            day = date.fromisoformat(day_str)
+            if streak == 0 and day == end - timedelta(days=1):
+                expected = day  # nothing yet on the last day; count from the one before
+            if day != expected:
+                break
+            streak += 1
+            expected = day - timedelta(days=1)
+        return streak
+
+
+_history_store: Optional[HistoryStore] = None
+_history_failed = False
+_history_lock = threading.Lock()
+
+
+def get_history_store() -> Optional[HistoryStore]:
+    """The shared history store, or None if the database cannot be opened."""
+    global _history_store, _history_failed
+    with _history_lock:
+        if _history_store is None and not _history_failed:
+            try:
+                _history_store = HistoryStore()
+            except sqlite3.Error as e:
+                logging.error(f"[History] Cannot open history database: {e}")
+                _history_failed = True
+        return _history_store
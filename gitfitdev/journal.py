@@ -0,0 +1,148 @@
+"""Append-only event journal with snapshot compaction.
+
+State that changes a little at a time (the daily tracker records one event per
+break) is persisted as:
+
+- a snapshot: the full state as JSON, written atomically, tagged with the
+  sequence number of the last event it includes;
+- a journal next to it: one JSON event per line, each appended and fsync'd.
+
+Loading reads the snapshot and replays the journal events with a higher
+sequence number. Compaction writes a new snapshot and truncates the journal;
+if the process dies between the two steps the leftover events are already in
+the snapshot and are skipped on the next load. A line torn by a crash
+mid-append is dropped and cut off so later appends start on a clean line.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .metrics import get_metrics
+from .tracing import traced
+
+
+def _fsync_dir(path: Path) -> None:
+    """Persist a rename on filesystems that need the directory synced (POSIX only)."""
+    if os.name != "posix":
+        return
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class EventJournal:
+    """A JSON snapshot file plus a line-delimited journal of events since it."""
+
+    def __init__(self, snapshot_path: Path, journal_path: Optional[Path] = None):
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = Path(journal_path) if journal_path else self.snapshot_path.with_suffix(".log")
+        self.seq = 0                # last sequence number written or replayed
+        self.pending = 0            # events in the journal that are not in the snapshot
+        self._lock = threading.Lock()
+
+    def load(self) -> Tuple[Optional[Dict], List[Dict]]:
+        """Return (snapshot state or None, events to replay on top of it)."""
+        with self._lock:
+            snapshot = self._read_snapshot()
+            snapshot_seq = int(snapshot.get("seq", 0)) if snapshot else 0
+            events = [e for e in self._read_journal() if e.get("seq", 0) > snapshot_seq]
+            self.seq = max([snapshot_seq] + [e["seq"] for e in events])
+            self.pending = len(events)
+            return snapshot, events
+
+    def _read_snapshot(self) -> Optional[Dict]:
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            # Keep the damaged file for inspection instead of overwriting it later
+            logging.error(f"[Journal] Unreadable snapshot {self.snapshot_path}: {e}")
+            try:
+                os.replace(self.snapshot_path, self.snapshot_path.with_suffix(".corrupt"))
+            except OSError:
+                pass
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _read_journal(self) -> List[Dict]:
+        try:
+            with open(self.journal_path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return []
+        except OSError as e:
+            logging.error(f"[Journal] Cannot read {self.journal_path}: {e}")
+            return []
+
+        events = []
+        good_end = 0
+        offset = 0
+        for line in raw.splitlines(keepends=True):
+            offset += len(line)
+            if not line.endswith(b"\n"):
+                break  # torn final append
+            try:
+                event = json.loads(line)
+            except ValueError:
+                logging.warning(f"[Journal] Skipping damaged line in {self.journal_path.name}")
+                good_end = offset
+                continue
+            if isinstance(event, dict) and isinstance(event.get("seq"), int):
+                events.append(event)
+            good_end = offset
+
+        if good_end < len(raw):
+            logging.warning(f"[Journal] Dropping torn record at the end of {self.journal_path.name}")
+            try:
+                with open(self.journal_path, "r+b") as f:
+                    f.truncate(good_end)
+            except OSError:
+                pass
+        return events
+
+    @traced("journal.append")
+    def append(self, event: Dict) -> int:
+        """Durably append one event; returns its sequence number."""
+        with self._lock:
+            self.seq += 1
+            record = dict(event, seq=self.seq)
+            line = json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self.pending += 1
+            get_metrics().counter("disk.journal_append").inc()
+            return self.seq
+
+    @traced("journal.compact")
+    def compact(self, state: Dict) -> None:
+        """Write ``state`` (which must include every event so far) as the snapshot and empty the journal."""
+        with self._lock:
+            data = dict(state, seq=self.seq)
+            tmp = self.snapshot_path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.snapshot_path)
+            _fsync_dir(self.snapshot_path.parent)
+            # Events up to self.seq are now in the snapshot; a crash before this
+            # truncation only leaves entries that load() will skip
+            with open(self.journal_path, "w", encoding="utf-8"):
+                pass
+            get_metrics().counter("disk.snapshot_write").inc()
+            self.pending = 0
@@ -0,0 +1,294 @@
+"""Precompiled binary language catalogs.
+
+The language packs (lang_<code>.py) are large dict literals. At build time
+they are compiled into one ``catalogs/<code>.gflc`` file per language, which
+LanguageManager memory-maps instead of importing the module. A lookup hashes
+the key, binary-searches the key table and decodes just that one string, so
+resident memory and load time stay flat however big the packs get.
+
+Layout (little endian):
+    header     magic "GFLC", u16 version, u16 reserved, u32 entry count,
+               u32 key table offset, u32 string pool offset
+    key table  entries sorted by (hash, key): u32 CRC-32 of the key,
+               u32 key offset, u32 key length, u32 value offset, u32 value length
+               (offsets relative to the string pool)
+    pool       UTF-8 keys and values
+
+Keys are "<category>\\x1f<key>". List values (dismiss buttons) are joined with
+"\\x1e". A "meta" category records the source files and their digest; a
+catalog whose sources have changed since it was built is ignored and the
+module is imported instead.
+
+Usage:
+    python -m gitfitdev.langpack           # rebuild every catalog
+    python -m gitfitdev.langpack --check   # exit 1 if any catalog is stale
+"""
+
+import importlib
+import logging
+import mmap
+import os
+import re
+import struct
+import sys
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+MAGIC = b"GFLC"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIII")
+ENTRY = struct.Struct("<IIIII")
+_HASH = struct.Struct("<I")
+KEY_SEP = "\x1f"
+LIST_SEP = "\x1e"
+
+CATALOG_DIR = Path(__file__).resolve().parent / "catalogs"
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+# Module attribute -> catalog category
+MODULE_CATEGORIES = {
+    "UI_TRANSLATIONS": "ui",
+    "FITNESS_TRANSLATIONS": "fitness",
+    "EXERCISE_TRANSLATIONS": "exercises",
+    "STRETCH_TRANSLATIONS": "stretches",
+    "MOTIVATION_TRANSLATIONS": "motivations",
+}
+LIST_CATEGORIES = {"DISMISS_BUTTONS": "dismiss_buttons"}
+# Fuzzy-match tables derived from these categories: number-normalized source -> translation
+PATTERN_CATEGORIES = {"exercises": "exercise_patterns", "stretches": "stretch_patterns"}
+
+_NUMBER_RE = re.compile(r"\d+")
+
+
+def key_hash(data: bytes) -> int:
+    return zlib.crc32(data)
+
+
+def number_pattern(text: str) -> str:
+    """Text with every number replaced by a placeholder."""
+    return _NUMBER_RE.sub("NUM", text)
+
+
+# --- Building ---
+
+def source_files(lang_code: str) -> List[Path]:
+    """Python sources a language pack is built from."""
+    files = [PACKAGE_DIR / f"lang_{lang_code}.py"]
+    extra = PACKAGE_DIR / "fitness_translations_complete.py"
+    if lang_code != "en" and extra.exists():
+        files.append(extra)
+    return files
+
+
+def source_digest(files: List[Path]) -> str:
+    import hashlib
+
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def collect_entries(lang_code: str) -> Dict[str, str]:
+    """Flatten a language module into catalog keys and values."""
+    module = importlib.import_module(f"gitfitdev.lang_{lang_code}")
+    entries: Dict[str, str] = {}
+    for attr, category in MODULE_CATEGORIES.items():
+        table = getattr(module, attr, {}) or {}
+        for key, value in table.items():
+            entries[category + KEY_SEP + key] = value
+        pattern_category = PATTERN_CATEGORIES.get(category)
+        if pattern_category:
+            for key, value in table.items():
+                # First source wins when several normalize to the same pattern
+                entries.setdefault(pattern_category + KEY_SEP + number_pattern(key), value)
+    for attr, category in LIST_CATEGORIES.items():
+        entries["lists" + KEY_SEP + category] = LIST_SEP.join(getattr(module, attr, []) or [])
+    files = source_files(lang_code)
+    entries["meta" + KEY_SEP + "sources"] = ",".join(path.name for path in files)
+    entries["meta" + KEY_SEP + "digest"] = source_digest(files)
+    return entries
+
+
+def build_catalog(entries: Dict[str, str]) -> bytes:
+    pool = bytearray()
+    rows = []
+    for key, value in entries.items():
+        key_bytes = key.encode("utf-8")
+        value_bytes = value.encode("utf-8")
+        key_offset = len(pool)
+        pool += key_bytes
+        value_offset = len(pool)
+        pool += value_bytes
+        rows.append((key_hash(key_bytes), key_bytes, key_offset, len(key_bytes), value_offset, len(value_bytes)))
+    rows.sort(key=lambda row: (row[0], row[1]))
+
+    table_offset = HEADER.size
+    pool_offset = table_offset + ENTRY.size * len(rows)
+    out = bytearray(HEADER.pack(MAGIC, VERSION, 0, len(rows), table_offset, pool_offset))
+    for h, _, key_offset, key_length, value_offset, value_length in rows:
+        out += ENTRY.pack(h, key_offset, key_length, value_offset, value_length)
+    out += pool
+    return bytes(out)
+
+
+def catalog_path(lang_code: str) -> Path:
+    return CATALOG_DIR / f"{lang_code}.gflc"
+
+
+def write_catalog(lang_code: str) -> Path:
+    data = build_catalog(collect_entries(lang_code))
+    CATALOG_DIR.mkdir(exist_ok=True)
+    path = catalog_path(lang_code)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return path
+
+
+# --- Loading ---
+
+class Catalog:
+    """A memory-mapped .gflc file."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self.count, self._table, self._pool = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"{self.path.name} is not a version {VERSION} language catalog")
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def _entry(self, index: int) -> Tuple[int, int, int, int, int]:
+        return ENTRY.unpack_from(self._mm, self._table + index * ENTRY.size)
+
+    def lookup(self, key: str) -> Optional[str]:
+        key_bytes = key.encode("utf-8")
+        h = key_hash(key_bytes)
+        low, high = 0, self.count
+        unpack_hash, table, size = _HASH.unpack_from, self._table, ENTRY.size
+        while low < high:
+            mid = (low + high) // 2
+            if unpack_hash(self._mm, table + mid * size)[0] < h:
+                low = mid + 1
+            else:
+                high = mid
+        pool = self._pool
+        for index in range(low, self.count):
+            entry_hash, key_offset, key_length, value_offset, value_length = self._entry(index)
+            if entry_hash != h:
+                break
+            if self._mm[pool + key_offset:pool + key_offset + key_length] == key_bytes:
+                return self._mm[pool + value_offset:pool + value_offset + value_length].decode("utf-8")
+        return None
+
+    def get(self, category: str, key: str, default=None):
+        value = self.lookup(category + KEY_SEP + key)
+        return default if value is None else value
+
+    def get_list(self, category: str) -> List[str]:
+        value = self.lookup("lists" + KEY_SEP + category)
+        return value.split(LIST_SEP) if value else []
+
+    def category(self, name: str, transform: Optional[Callable[[str], object]] = None) -> "CategoryView":
+        return CategoryView(self, name, transform)
+
+    def is_stale(self, verify: bool = False) -> bool:
+        """Whether the sources this catalog was built from have changed since.
+
+        Sources not modified after the catalog are trusted unless ``verify``.
+        """
+        try:
+            built = self.path.stat().st_mtime
+        except OSError:
+            return True
+        names = (self.get("meta", "sources") or "").split(",")
+        files = [PACKAGE_DIR / name for name in names if name]
+        # Frozen builds ship no sources; unchanged mtimes need no digest
+        present = [path for path in files if path.exists()]
+        if not present:
+            return False
+        if not verify and all(path.stat().st_mtime <= built for path in present):
+            return False
+        if len(present) != len(files):
+            return True
+        return source_digest(files) != self.get("meta", "digest")
+
+
+class CategoryView:
+    """Read-only dict-like access to one category of a catalog."""
+
+    def __init__(self, catalog: Catalog, name: str, transform: Optional[Callable[[str], object]] = None):
+        self._catalog = catalog
+        self._name = name
+        self._transform = transform
+
+    def get(self, key, default=None):
+        if not isinstance(key, str):
+            return default
+        value = self._catalog.get(self._name, key)
+        if value is None:
+            return default
+        return self._transform(value) if self._transform else value
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key) -> bool:
+        return self.get(key) is not None
+
+
+def open_catalog(lang_code: str, verify: bool = False) -> Optional[Catalog]:
+    """The language's catalog, or None if it is missing, unreadable or stale."""
+    path = catalog_path(lang_code)
+    if not path.exists():
+        return None
+    try:
+        catalog = Catalog(path)
+    except (OSError, ValueError) as e:
+        logging.warning(f"[Lang] Ignoring catalog {path.name}: {e}")
+        return None
+    if catalog.is_stale(verify):
+        logging.info(f"[Lang] {path.name} is older than its sources; run python -m gitfitdev.langpack")
+        catalog.close()
+        return None
+    return catalog
+
+
+def main(argv=None) -> int:
+    import argparse
+    from .language_manager import LanguageManager
+
+    parser = argparse.ArgumentParser(prog="python -m gitfitdev.langpack", description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="only report stale or missing catalogs")
+    args = parser.parse_args(argv)
+
+    stale = []
+    for lang_code in LanguageManager().languages:
+        if args.check:
+            catalog = open_catalog(lang_code, verify=True)
+            if catalog is None:
+                stale.append(lang_code)
+            else:
+                catalog.close()
+            continue
+        path = write_catalog(lang_code)
+        print(f"{path.relative_to(PACKAGE_DIR.parent)}: {path.stat().st_size} bytes")
+
+    if stale:
+        print(f"Stale or missing catalogs: {', '.join(stale)}; run python -m gitfitdev.langpack")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
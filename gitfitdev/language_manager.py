@@ -3,8 +3,44 @@ Language Manager for GitFit.dev
 Handles loading and switching between language packs
 """
 
-from typing import Dict, List, Optional
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
 import importlib
+import threading
+import re
+
+_NUMBER_RE = re.compile(r'\d+')
+
+
+def _split_numbers(text: str) -> Tuple[str, ...]:
+    return tuple(_NUMBER_RE.split(text))
+
+
+def _number_pattern(text: str) -> str:
+    """Text with every number replaced by a placeholder"""
+    return _NUMBER_RE.sub('NUM', text)
+
+
+def _compile_patterns(translations: Dict[str, str]) -> Dict[str, Tuple[str, ...]]:
+    """Index translations by number-normalized source text.
+
+    Each value is the translation split at its numbers, so filling in the
+    numbers of a description is a join. The first entry wins for sources that
+    normalize to the same pattern, as the linear search used to.
+    """
+    index = {}
+    for original, translation in translations.items():
+        index.setdefault(_number_pattern(original), _split_numbers(translation))
+    return index
+
+
+def _fill_numbers(pieces: Tuple[str, ...], numbers: List[str]) -> str:
+    """Put ``numbers`` into the numeric slots of a split translation, in order"""
+    parts = [pieces[0]]
+    for i, piece in enumerate(pieces[1:]):
+        parts.append(numbers[i] if i < len(numbers) else '')
+        parts.append(piece)
+    return ''.join(parts)
 
 class LanguageManager:
     """Manages language loading and translation lookups"""
@@ -16,6 +52,9 @@ class LanguageManager:
             "sk": "Slovak"
         }
         self.loaded_packs = {}
+        # Lookup outcomes per language and category: hit, pattern (fuzzy hit), fallback (English used)
+        self.stats: Dict[str, Dict[str, Counter]] = {}
+        self._load_lock = threading.RLock()
 
     def load_language(self, lang_code: str):
         """Load a language pack dynamically"""
@@ -23,8 +62,25 @@ class LanguageManager:
             raise ValueError(f"Unknown language code: {lang_code}")
 
         if lang_code not in self.loaded_packs:
+            from .langpack import open_catalog
+
+            catalog = open_catalog(lang_code)
+            if catalog is not None:
+                # Memory-mapped catalog: strings are decoded per lookup
+                self.loaded_packs[lang_code] = {
+                    'ui': catalog.category('ui'),
+                    'fitness': catalog.category('fitness'),
+                    'exercises': catalog.category('exercises'),
+                    'stretches': catalog.category('stretches'),
+                    'motivations': catalog.category('motivations'),
+                    'dismiss_buttons': catalog.get_list('dismiss_buttons'),
+                    'exercise_patterns': catalog.category('exercise_patterns', _split_numbers),
+                    'stretch_patterns': catalog.category('stretch_patterns', _split_numbers),
+                }
+                return self.loaded_packs[lang_code]
+
             try:
-                # Dynamically import the language module
+                # No usable catalog: import the language module
                 module_name = f"gitfitdev.lang_{lang_code}"
                 module = importlib.import_module(module_name)
 
@@ -36,6 +92,9 @@ class LanguageManager:
                     'motivations': getattr(module, 'MOTIVATION_TRANSLATIONS', {}),
                     'dismiss_buttons': getattr(module, 'DISMISS_BUTTONS', []),
                 }
+                pack = self.loaded_packs[lang_code]
+                pack['exercise_patterns'] = _compile_patterns(pack['exercises'])
+                pack['stretch_patterns'] = _compile_patterns(pack['stretches'])
             except ImportError as e:
                 print(f"Failed to load language pack for {lang_code}: {e}")
                 # Fall back to English
@@ -51,25 +110,31 @@ class LanguageManager:
             self.current_language = lang_code
             self.load_language(lang_code)
 
-    def get_translation(self, key: str, category: str = 'ui', fallback: str = None) -> str:
-        """Get a translation for a key"""
-        # Ensure current language is loaded
-        if self.current_language not in self.loaded_packs:
-            self.load_language(self.current_language)
+    def _resolve(self, language: str = None) -> str:
+        """The language to look up in: ``language`` if known, else the current one."""
+        if language and language in self.languages:
+            return language
+        return self.current_language
 
-        pack = self.loaded_packs.get(self.current_language, {})
-        translations = pack.get(category, {})
+    def _pack(self, lang_code: str) -> dict:
+        if lang_code not in self.loaded_packs:
+            with self._load_lock:
+                self.load_language(lang_code)
+        return self.loaded_packs.get(lang_code, {})
+
+    def get_translation(self, key: str, category: str = 'ui', fallback: str = None, language: str = None) -> str:
+        """Get a translation for a key"""
+        lang = self._resolve(language)
+        translations = self._pack(lang).get(category, {})
 
         # Try to get translation
         result = translations.get(key)
+        if lang != "en":
+            self._count(lang, category, 'hit' if result is not None else 'fallback')
 
         # If not found and not English, try English fallback
-        if result is None and self.current_language != "en":
-            if "en" not in self.loaded_packs:
-                self.load_language("en")
-            en_pack = self.loaded_packs.get("en", {})
-            en_translations = en_pack.get(category, {})
-            result = en_translations.get(key)
+        if result is None and lang != "en":
+            result = self._pack("en").get(category, {}).get(key)
 
         # If still not found, use fallback or key
         if result is None:
@@ -77,89 +142,64 @@ class LanguageManager:
 
         return result
 
-    def get_ui_translation(self, key: str, fallback: str = None) -> str:
+    def get_ui_translation(self, key: str, fallback: str = None, language: str = None) -> str:
         """Get a UI translation"""
-        return self.get_translation(key, 'ui', fallback)
+        return self.get_translation(key, 'ui', fallback, language)
 
-    def get_fitness_translation(self, key: str, fallback: str = None) -> str:
+    def get_fitness_translation(self, key: str, fallback: str = None, language: str = None) -> str:
         """Get a fitness-specific translation"""
-        return self.get_translation(key, 'fitness', fallback)
+        return self.get_translation(key, 'fitness', fallback, language)
 
-    def translate_exercise(self, description: str) -> str:
-        """Translate an exercise description"""
-        if self.current_language == "en":
-            return description
+    def _count(self, lang_code: str, category: str, outcome: str):
+        self.stats.setdefault(lang_code, {}).setdefault(category, Counter())[outcome] += 1
 
-        if self.current_language not in self.loaded_packs:
-            self.load_language(self.current_language)
+    def _translate_activity(self, description: str, category: str, patterns_key: str, language: str = None) -> str:
+        lang = self._resolve(language)
+        if lang == "en":
+            return description
 
-        exercises = self.loaded_packs[self.current_language].get('exercises', {})
+        pack = self._pack(lang)
 
         # Try exact match first
-        if description in exercises:
-            return exercises[description]
-
-        # Try pattern matching for dynamic numbers
-        import re
-        base_pattern = re.sub(r'\d+', 'NUM', description)
-
-        for original, translation in exercises.items():
-            if re.sub(r'\d+', 'NUM', original) == base_pattern:
-                # Replace numbers from original with numbers from description
-                original_nums = re.findall(r'\d+', description)
-                translated_with_nums = translation
-                for num in original_nums:
-                    translated_with_nums = re.sub(r'\d+', num, translated_with_nums, count=1)
-                return translated_with_nums
-
+        result = pack.get(category, {}).get(description)
+        if result is not None:
+            self._count(lang, category, 'hit')
+            return result
+
+        # Same text with different numbers (e.g. durations fitted to the break)
+        pieces = pack.get(patterns_key, {}).get(_number_pattern(description))
+        if pieces is not None:
+            self._count(lang, category, 'pattern')
+            return _fill_numbers(pieces, _NUMBER_RE.findall(description))
+
+        self._count(lang, category, 'fallback')
         return description
 
-    def translate_stretch(self, description: str) -> str:
-        """Translate a stretch description"""
-        if self.current_language == "en":
-            return description
-
-        if self.current_language not in self.loaded_packs:
-            self.load_language(self.current_language)
-
-        stretches = self.loaded_packs[self.current_language].get('stretches', {})
+    def translate_exercise(self, description: str, language: str = None) -> str:
+        """Translate an exercise description"""
+        return self._translate_activity(description, 'exercises', 'exercise_patterns', language)
 
-        # Try exact match first
-        if description in stretches:
-            return stretches[description]
-
-        # Try pattern matching for dynamic numbers
-        import re
-        base_pattern = re.sub(r'\d+', 'NUM', description)
-
-        for original, translation in stretches.items():
-            if re.sub(r'\d+', 'NUM', original) == base_pattern:
-                # Replace numbers from original with numbers from description
-                original_nums = re.findall(r'\d+', description)
-                translated_with_nums = translation
-                for num in original_nums:
-                    translated_with_nums = re.sub(r'\d+', num, translated_with_nums, count=1)
-                return translated_with_nums
+    def translate_stretch(self, description: str, language: str = None) -> str:
+        """Translate a stretch description"""
+        return self._translate_activity(description, 'stretches', 'stretch_patterns', language)
 
-        return description
+    def get_translation_stats(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """Lookup outcomes per language and category, e.g. {'sk': {'ui': {'hit': 40, 'fallback': 2}}}"""
+        return {lang: {category: dict(counts) for category, counts in categories.items()}
+                for lang, categories in self.stats.items()}
 
-    def translate_motivation(self, message: str) -> str:
+    def translate_motivation(self, message: str, language: str = None) -> str:
         """Translate a motivational message"""
-        if self.current_language == "en":
+        lang = self._resolve(language)
+        if lang == "en":
             return message
 
-        if self.current_language not in self.loaded_packs:
-            self.load_language(self.current_language)
-
-        motivations = self.loaded_packs[self.current_language].get('motivations', {})
+        motivations = self._pack(lang).get('motivations', {})
         return motivations.get(message, message)
 
-    def get_dismiss_buttons(self) -> List[str]:
-        """Get dismiss button texts for current language"""
-        if self.current_language not in self.loaded_packs:
-            self.load_language(self.current_language)
-
-        return self.loaded_packs[self.current_language].get('dismiss_buttons', [])
+    def get_dismiss_buttons(self, language: str = None) -> List[str]:
+        """Get dismiss button texts for a language (default: the current one)"""
+        return self._pack(self._resolve(language)).get('dismiss_buttons', [])
 
     def get_available_languages(self) -> Dict[str, str]:
         """Get dictionary of available languages"""
@@ -174,66 +214,36 @@ def set_language(lang_code: str):
     """Set the current language"""
     _language_manager.set_language(lang_code)
 
+# Lookups take the language explicitly instead of switching the global one, so
+# they are safe from the break prefetch worker while the UI thread translates.
 def get_translation(key: str, language: str = None, fallback: str = None) -> str:
     """Get a UI translation (backward compatibility)"""
-    if language and language != _language_manager.current_language:
-        old_lang = _language_manager.current_language
-        _language_manager.set_language(language)
-        result = _language_manager.get_ui_translation(key, fallback)
-        _language_manager.set_language(old_lang)
-        return result
-    return _language_manager.get_ui_translation(key, fallback)
+    return _language_manager.get_ui_translation(key, fallback, language)
 
 def get_fitness_translation(key: str, language: str = None, fallback: str = None) -> str:
     """Get a fitness translation (backward compatibility)"""
-    if language and language != _language_manager.current_language:
-        old_lang = _language_manager.current_language
-        _language_manager.set_language(language)
-        result = _language_manager.get_fitness_translation(key, fallback)
-        _language_manager.set_language(old_lang)
-        return result
-    return _language_manager.get_fitness_translation(key, fallback)
+    return _language_manager.get_fitness_translation(key, fallback, language)
 
 def translate_exercise(description: str, language: str = None) -> str:
     """Translate an exercise description"""
-    if language and language != _language_manager.current_language:
-        old_lang = _language_manager.current_language
-        _language_manager.set_language(language)
-        result = _language_manager.translate_exercise(description)
-        _language_manager.set_language(old_lang)
-        return result
-    return _language_manager.translate_exercise(description)
+    return _language_manager.translate_exercise(description, language)
 
 def translate_stretch(description: str, language: str = None) -> str:
     """Translate a stretch description"""
-    if language and language != _language_manager.current_language:
-        old_lang = _language_manager.current_language
-        _language_manager.set_language(language)
-        result = _language_manager.translate_stretch(description)
-        _language_manager.set_language(old_lang)
-        return result
-    return _language_manager.translate_stretch(description)
+    return _language_manager.translate_stretch(description, language)
 
 def translate_motivation(message: str, language: str = None) -> str:
     """Translate a motivational message"""
-    if language and language != _language_manager.current_language:
-        old_lang = _language_manager.current_language
-        _language_manager.set_language(language)
-        result = _language_manager.translate_motivation(message)
-        _language_manager.set_language(old_lang)
-        return result
-    return _language_manager.translate_motivation(message)
+    return _language_manager.translate_motivation(message, language)
 
 def get_dismiss_buttons(language: str = None) -> List[str]:
     """Get dismiss button texts"""
-    if language and language != _language_manager.current_language:
-        old_lang = _language_manager.current_language
-        _language_manager.set_language(language)
-        result = _language_manager.get_dismiss_buttons()
-        _language_manager.set_language(old_lang)
-        return result
-    return _language_manager.get_dismiss_buttons()
+    return _language_manager.get_dismiss_buttons(language)
 
 def get_available_languages() -> Dict[str, str]:
     """Get available languages"""
-    return _language_manager.get_available_languages()
\ No newline at end of file
+    return _language_manager.get_available_languages()
+
+def get_translation_stats() -> Dict[str, Dict[str, Dict[str, int]]]:
+    """Translation hit/pattern/fallback counters per language"""
+    return _language_manager.get_translation_stats()
\ No newline at end of file
@@ -0,0 +1,155 @@
+"""In-process counters and latency histograms.
+
+Metrics are created on first use by name and live for the whole process:
+
+    from .metrics import get_metrics
+    get_metrics().histogram("break.fire_to_mapped_ms").observe(elapsed_ms)
+    get_metrics().counter("prefetch.hit").inc()
+
+``snapshot()`` returns plain dicts, ready to be logged or serialised;
+``prometheus_text()`` renders one in the Prometheus text exposition format.
+"""
+
+import bisect
+import re
+import threading
+from collections import deque
+from typing import Dict, Optional, Sequence
+
+# Upper bounds, in milliseconds, for latency histograms
+DEFAULT_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class Counter:
+    """A monotonically increasing count."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+
+class Histogram:
+    """Bucketed distribution of observed values, plus the most recent samples.
+
+    Bucket counts are cumulative over the process lifetime; quantiles are taken
+    from the last ``window`` samples so they follow the current behaviour.
+    """
+
+    def __init__(self, name: str, buckets: Sequence[float] = DEFAULT_BUCKETS, window: int = 256):
+        self.name = name
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # last slot: above the largest bound
+        self._recent = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._recent.append(value)
+            self.count += 1
+            self.sum += value
+            self.min = value if self.min is None else min(self.min, value)
+            self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """The ``q`` quantile (0..1) of the recent samples, or None if there are none."""
+        with self._lock:
+            samples = sorted(self._recent)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            cumulative, buckets = 0, {}
+            for bound, count in zip(self.buckets, self._counts):
+                cumulative += count
+                buckets[bound] = cumulative
+            snapshot = {
+                "count": self.count,
+                "sum": self.sum,
+                "min": self.min,
+                "max": self.max,
+                "buckets": buckets,
+            }
+        snapshot.update(p50=self.quantile(0.5), p95=self.quantile(0.95), p99=self.quantile(0.99))
+        return snapshot
+
+
+class MetricsRegistry:
+    """Named counters and histograms."""
+
+    def __init__(self):
+        self._counters: Dict[str, Counter] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str) -> Counter:
+        with self._lock:
+            counter = self._counters.get(name)
+            if counter is None:
+                counter = self._counters[name] = Counter(name)
+            return counter
+
+    def histogram(self, name: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram(name, buckets)
+            return histogram
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = dict(self._histograms)
+        return {
+            "counters": {name: counter.value for name, counter in sorted(counters.items())},
+            "histograms": {name: histogram.snapshot() for name, histogram in sorted(histograms.items())},
+        }
+
+
+_metrics = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """The process-wide metrics registry."""
+    return _metrics
+
+
+def _prometheus_name(name: str, prefix: str) -> str:
+    return prefix + re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _prometheus_value(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def prometheus_text(snapshot: Dict[str, Dict], prefix: str = "gitfitdev_") -> str:
+    """A registry snapshot in the Prometheus text exposition format (version 0.0.4)."""
+    lines = []
+    for name, value in snapshot["counters"].items():
+        metric = _prometheus_name(name, prefix) + "_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {value}")
+    for name, histogram in snapshot["histograms"].items():
+        metric = _prometheus_name(name, prefix)
+        lines.append(f"# TYPE {metric} histogram")
+        for bound, count in histogram["buckets"].items():
+            lines.append(f'{metric}_bucket{{le="{_prometheus_value(bound)}"}} {count}')
+        lines.append(f'{metric}_bucket{{le="+Inf"}} {histogram["count"]}')
+        lines.append(f"{metric}_sum {_prometheus_value(histogram['sum'])}")
+        lines.append(f"{metric}_count {histogram['count']}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,336 @@
+"""Monitor layout, cached between breaks.
+
+Overlays cover every monitor, toasts and the Linux control panel sit on the
+primary one. Enumerating monitors is platform specific:
+
+    Windows  EnumDisplayMonitors
+    X11      XRandR monitors via ctypes (libXrandr >= 1.5), or the output of
+             ``xrandr --listmonitors`` when the library is not available
+    other    Tk's screen size, as a single monitor
+
+The result is cached. On X11 the cache is dropped when the X server reports
+a RandR screen, CRTC or output change; otherwise a cheap signature (virtual
+screen metrics on Windows, the xrandr listing or Tk's screen size elsewhere)
+is compared at most every CHECK_INTERVAL seconds.
+
+Rectangles are (x, y, width, height) tuples, the primary monitor first.
+
+Usage:
+    python -m gitfitdev.monitors    # print the current layout
+
+Under Xvfb, virtual monitors can be added with
+``xrandr --setmonitor NAME WIDTH/MMxHEIGHT/MM+X+Y none``.
+"""
+
+import ctypes
+import logging
+import re
+import subprocess
+import sys
+import threading
+from typing import List, Optional, Tuple
+
+from .clock import get_clock
+from .metrics import get_metrics
+
+Rect = Tuple[int, int, int, int]
+
+# Seconds between signature checks where no change events are available
+CHECK_INTERVAL = 30.0
+
+# "0: +*DP-1 1920/530x1080/300+0+0  DP-1"
+_LISTMONITORS_RE = re.compile(r"^\s*\d+:\s+\+?(\*?)\S+\s+(\d+)/\d+x(\d+)/\d+\+(-?\d+)\+(-?\d+)")
+
+
+def _primary_first(monitors: List[Rect], primary: Optional[Rect]) -> List[Rect]:
+    if primary in monitors:
+        monitors.remove(primary)
+        monitors.insert(0, primary)
+    return monitors
+
+
+# --- Windows ---
+
+def _windows_monitors() -> List[Rect]:
+    from ctypes import wintypes
+
+    user32 = ctypes.windll.user32
+    monitors = []
+
+    def enum_monitors_proc(hMonitor, hdcMonitor, lprcMonitor, dwData):
+        rect = lprcMonitor.contents
+        monitors.append((rect.left, rect.top,
+                         rect.right - rect.left,
+                         rect.bottom - rect.top))
+        return 1
+
+    MonitorEnumProc = ctypes.WINFUNCTYPE(
+        ctypes.c_int, wintypes.HMONITOR, wintypes.HDC,
+        ctypes.POINTER(wintypes.RECT), wintypes.LPARAM
+    )
+
+    callback = MonitorEnumProc(enum_monitors_proc)
+    user32.EnumDisplayMonitors(None, None, callback, 0)
+    # The primary monitor has its top-left corner at the origin
+    primary = next((m for m in monitors if m[:2] == (0, 0)), None)
+    return _primary_first(monitors, primary)
+
+
+def _windows_signature() -> tuple:
+    # SM_XVIRTUALSCREEN .. SM_CMONITORS
+    get_metric = ctypes.windll.user32.GetSystemMetrics
+    return tuple(get_metric(index) for index in (76, 77, 78, 79, 80))
+
+
+# --- X11 ---
+
+class XRRMonitorInfo(ctypes.Structure):
+    _fields_ = [
+        ("name", ctypes.c_ulong),  # Atom
+        ("primary", ctypes.c_int),
+        ("automatic", ctypes.c_int),
+        ("noutput", ctypes.c_int),
+        ("x", ctypes.c_int),
+        ("y", ctypes.c_int),
+        ("width", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("mwidth", ctypes.c_int),
+        ("mheight", ctypes.c_int),
+        ("outputs", ctypes.c_void_p),
+    ]
+
+
+class XRandR:
+    """A private X connection that lists RandR monitors and watches for changes."""
+
+    # RRScreenChangeNotifyMask | RRCrtcChangeNotifyMask | RROutputChangeNotifyMask
+    CHANGE_MASK = 0x1 | 0x2 | 0x4
+
+    def __init__(self, display_name: Optional[str] = None):
+        from ctypes.util import find_library
+
+        x11_name, xrandr_name = find_library("X11"), find_library("Xrandr")
+        if not x11_name or not xrandr_name:
+            raise OSError("libX11 or libXrandr not found")
+        x11 = ctypes.CDLL(x11_name)
+        xrandr = ctypes.CDLL(xrandr_name)
+        if not hasattr(xrandr, "XRRGetMonitors"):
+            raise OSError("libXrandr is older than 1.5")
+
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XDefaultScreen.argtypes = [ctypes.c_void_p]
+        x11.XRootWindow.restype = ctypes.c_ulong
+        x11.XRootWindow.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XPending.argtypes = [ctypes.c_void_p]
+        x11.XNextEvent.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        x11.XFlush.argtypes = [ctypes.c_void_p]
+        x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        xrandr.XRRQueryExtension.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int)]
+        xrandr.XRRSelectInput.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_int]
+        info = XRRMonitorInfo
+        xrandr.XRRGetMonitors.restype = ctypes.POINTER(info)
+        xrandr.XRRGetMonitors.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_int, ctypes.POINTER(ctypes.c_int)]
+        xrandr.XRRFreeMonitors.argtypes = [ctypes.POINTER(info)]
+
+        display = x11.XOpenDisplay(display_name.encode() if display_name else None)
+        if not display:
+            raise OSError(f"cannot open display {display_name or ''}")
+        event_base, error_base = ctypes.c_int(), ctypes.c_int()
+        if not xrandr.XRRQueryExtension(display, ctypes.byref(event_base), ctypes.byref(error_base)):
+            x11.XCloseDisplay(display)
+            raise OSError("the X server has no RandR extension")
+
+        self._x11 = x11
+        self._xrandr = xrandr
+        self._display = display
+        self._root = x11.XRootWindow(display, x11.XDefaultScreen(display))
+        self._event = ctypes.create_string_buffer(192)  # sizeof(XEvent)
+        xrandr.XRRSelectInput(display, self._root, self.CHANGE_MASK)
+        x11.XFlush(display)
+
+    def monitors(self) -> List[Rect]:
+        count = ctypes.c_int()
+        info = self._xrandr.XRRGetMonitors(self._display, self._root, 1, ctypes.byref(count))
+        if not info:
+            return []
+        try:
+            monitors, primary = [], None
+            for i in range(count.value):
+                rect = (info[i].x, info[i].y, info[i].width, info[i].height)
+                monitors.append(rect)
+                if info[i].primary:
+                    primary = rect
+        finally:
+            self._xrandr.XRRFreeMonitors(info)
+        return _primary_first(monitors, primary)
+
+    def changed(self) -> bool:
+        """Whether RandR change events arrived since the last call (never blocks)."""
+        changed = False
+        while self._x11.XPending(self._display) > 0:
+            self._x11.XNextEvent(self._display, self._event)
+            changed = True
+        return changed
+
+    def close(self):
+        if self._display:
+            self._x11.XCloseDisplay(self._display)
+            self._display = None
+
+
+def _xrandr_command_monitors(display_name: Optional[str] = None) -> List[Rect]:
+    """Monitors from ``xrandr --listmonitors``; empty if xrandr is missing or fails."""
+    command = ["xrandr", "--listmonitors"]
+    if display_name:
+        command[1:1] = ["--display", display_name]
+    try:
+        output = subprocess.run(command, capture_output=True, text=True, timeout=2).stdout
+    except (OSError, subprocess.SubprocessError):
+        return []
+    monitors, primary = [], None
+    for line in output.splitlines():
+        match = _LISTMONITORS_RE.match(line)
+        if match:
+            rect = tuple(int(value) for value in (match.group(4), match.group(5), match.group(2), match.group(3)))
+            monitors.append(rect)
+            if match.group(1):
+                primary = rect
+    return _primary_first(monitors, primary)
+
+
+def _windowing_system(root) -> str:
+    try:
+        return root.tk.call("tk", "windowingsystem")
+    except Exception:
+        return ""
+
+
+# --- Cache ---
+
+class MonitorTopology:
+    """The monitor layout, enumerated once and reused until it changes."""
+
+    def __init__(self):
+        self._monitors: Optional[List[Rect]] = None
+        self._signature = None
+        self._checked_at = 0.0
+        self._randr: Optional[XRandR] = None
+        self._randr_tried = False
+        self._lock = threading.Lock()
+        self.source = ""
+        self._refreshes = get_metrics().counter("monitors.refresh")
+
+    def get(self, root) -> List[Rect]:
+        """Rectangles of all monitors, primary first."""
+        with self._lock:
+            if self._monitors is None or self._stale(root):
+                self._refresh(root)
+            return list(self._monitors)
+
+    def primary(self, root) -> Rect:
+        return self.get(root)[0]
+
+    def invalidate(self):
+        with self._lock:
+            self._monitors = None
+
+    def close(self):
+        with self._lock:
+            if self._randr is not None:
+                self._randr.close()
+                self._randr = None
+
+    def _x11_randr(self, root) -> Optional[XRandR]:
+        if not self._randr_tried:
+            self._randr_tried = True
+            try:
+                self._randr = XRandR(root.winfo_screen())
+            except (OSError, AttributeError) as e:
+                logging.info(f"[Monitors] XRandR unavailable ({e}); using xrandr --listmonitors")
+        return self._randr
+
+    def _signature_of(self, root):
+        """Cheap value that changes with the layout, for platforms without change events."""
+        if sys.platform.startswith("win"):
+            return _windows_signature()
+        if _windowing_system(root) == "x11":
+            return tuple(_xrandr_command_monitors(root.winfo_screen()))
+        return root.winfo_screenwidth(), root.winfo_screenheight()
+
+    def _stale(self, root) -> bool:
+        if self._randr is not None:
+            return self._randr.changed()
+        now = get_clock().monotonic()
+        if now - self._checked_at < CHECK_INTERVAL:
+            return False
+        self._checked_at = now
+        return self._signature_of(root) != self._signature
+
+    def _refresh(self, root):
+        monitors, source = [], ""
+        try:
+            if sys.platform.startswith("win"):
+                monitors, source = _windows_monitors(), "EnumDisplayMonitors"
+            elif _windowing_system(root) == "x11":
+                randr = self._x11_randr(root)
+                if randr is not None:
+                    randr.changed()  # Events so far are covered by this enumeration
+                    monitors, source = randr.monitors(), "XRandR"
+                if not monitors:
+                    monitors, source = _xrandr_command_monitors(root.winfo_screen()), "xrandr --listmonitors"
+        except Exception as e:
+            logging.error(f"[Monitors] Enumeration failed: {e}")
+            monitors = []
+
+        # Fallback if no monitors found or on other platforms
+        if not monitors:
+            # Just use the primary screen
+            monitors, source = [(0, 0, root.winfo_screenwidth(), root.winfo_screenheight())], "Tk screen"
+
+        if self._randr is None:
+            self._signature = self._signature_of(root) if source != "xrandr --listmonitors" else tuple(monitors)
+        self._checked_at = get_clock().monotonic()
+        if monitors != self._monitors:
+            logging.info(f"[Monitors] {len(monitors)} monitor(s) via {source}: {monitors}")
+        self._monitors = monitors
+        self.source = source
+        self._refreshes.inc()
+
+
+_topology = MonitorTopology()
+
+
+def get_topology() -> MonitorTopology:
+    """The process-wide monitor layout cache."""
+    return _topology
+
+
+def get_monitors(root) -> List[Rect]:
+    """Get dimensions (x, y, width, height) of all monitors, primary first."""
+    return _topology.get(root)
+
+
+def primary_monitor(root) -> Rect:
+    """The primary monitor's (x, y, width, height)."""
+    return _topology.primary(root)
+
+
+def main(argv=None) -> int:
+    import tkinter as tk
+
+    root = tk.Tk()
+    root.withdraw()
+    try:
+        monitors = get_monitors(root)
+        print(f"{len(monitors)} monitor(s) via {_topology.source} on {root.winfo_screen()}:")
+        for i, (x, y, width, height) in enumerate(monitors):
+            print(f"  {i}: {width}x{height}+{x}+{y}{'  (primary)' if i == 0 else ''}")
+    finally:
+        _topology.close()
+        root.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,423 @@
+"""Pillow renderer for the break overlay.
+
+The widget overlay stacks a dozen Labels per monitor and Tk lays them out,
+wraps them and repaints them. With ``Settings.overlay_renderer = "image"``
+the whole static part of a break (title, activities, motivation, body map,
+emoji, ESC hint) is instead laid out here, on a worker thread, into one image
+per monitor resolution. Tk only blits that image and, once a second, a small
+countdown strip with the number, the progress bar and the reminder line.
+
+Layout mirrors the widget overlay: sections are stacked top to bottom with
+the same fonts and padding, and the stack is centred on the screen.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    Image = ImageDraw = ImageFont = None
+
+from .clock import get_clock
+from .metrics import get_metrics
+from .themes import get_theme
+
+# Tk font sizes are points; frames are drawn at 96 dpi
+PX_PER_POINT = 96 / 72
+
+_FONT_FILES = {
+    "regular": ("segoeui.ttf", "DejaVuSans.ttf", "LiberationSans-Regular.ttf", "Arial.ttf", "Helvetica.ttc"),
+    "bold": ("segoeuib.ttf", "DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf", "Arial Bold.ttf", "Helvetica.ttc"),
+    "italic": ("segoeuii.ttf", "DejaVuSans-Oblique.ttf", "LiberationSans-Italic.ttf", "Arial Italic.ttf", "Helvetica.ttc"),
+    "emoji": ("seguiemj.ttf", "NotoColorEmoji.ttf", "Apple Color Emoji.ttc"),
+}
+# Bitmap colour emoji fonts only come in this size; glyphs are scaled afterwards
+_EMOJI_BITMAP_SIZE = 109
+
+
+def available() -> bool:
+    """Whether Pillow is installed."""
+    return Image is not None
+
+
+@lru_cache(maxsize=64)
+def get_font(style: str, points: int):
+    """A TrueType font for a style and point size, or Pillow's default font.
+
+    There is no default for "emoji": None when no emoji font is installed.
+    """
+    size = max(1, round(points * PX_PER_POINT))
+    for name in _FONT_FILES.get(style, _FONT_FILES["regular"]):
+        for candidate_size in ((size, _EMOJI_BITMAP_SIZE) if style == "emoji" else (size,)):
+            try:
+                return ImageFont.truetype(name, candidate_size)
+            except OSError:
+                continue
+    if style == "emoji":
+        return None
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:  # Pillow < 10.1 has a single fixed-size default font
+        return ImageFont.load_default()
+
+
+def _text_size(font, text: str) -> Tuple[int, int]:
+    left, top, right, bottom = font.getbbox(text or " ")
+    return right - left, bottom - top
+
+
+def _line_height(font) -> int:
+    """Ascent + descent (bitmap fonts have no metrics; use a tall glyph)."""
+    if hasattr(font, "getmetrics"):
+        ascent, descent = font.getmetrics()
+        return ascent + descent
+    return _text_size(font, "Ag")[1]
+
+
+def wrap_text(text: str, font, max_width: Optional[int]) -> List[str]:
+    """Greedy word wrap to ``max_width`` pixels (None: no wrapping)."""
+    lines = []
+    for paragraph in text.split("\n"):
+        if max_width is None:
+            lines.append(paragraph)
+            continue
+        line = ""
+        for word in paragraph.split(" "):
+            candidate = f"{line} {word}" if line else word
+            if line and font.getlength(candidate) > max_width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    return lines
+
+
+@dataclass(frozen=True)
+class FrameSpec:
+    """The static content of one break overlay; hashable so frames can be cached."""
+    theme_id: str
+    title: str
+    structured: bool = True
+    single_activity: str = ""
+    stretch_header: str = ""
+    stretch_text: str = ""
+    exercise_header: str = ""
+    exercise_text: str = ""
+    motivation: str = ""
+    progress_text: str = ""
+    top_muscles: Tuple[Tuple[str, int], ...] = ()
+    recommendation: str = ""
+    has_body: bool = False
+    emoji: str = ""
+    esc_message: str = ""
+    flash_mode: bool = False
+
+    @classmethod
+    def from_content(cls, message, body, emoji: str, esc_message: str,
+                     theme_id: str, flash_mode: bool = False) -> "FrameSpec":
+        if not isinstance(message, dict):
+            message = {'title': message}
+            structured = False
+        else:
+            structured = True
+        return cls(
+            theme_id=theme_id,
+            title=message.get('title', ''),
+            structured=structured,
+            single_activity=message.get('single_activity', ''),
+            stretch_header=message.get('stretch_header', ''),
+            stretch_text=message.get('stretch_text', ''),
+            exercise_header=message.get('exercise_header', ''),
+            exercise_text=message.get('exercise_text', ''),
+            motivation=message.get('motivation', ''),
+            progress_text=body.progress_text if body else '',
+            top_muscles=tuple(body.top_muscles) if body else (),
+            recommendation=body.recommendation if body else '',
+            has_body=body is not None,
+            emoji=emoji,
+            esc_message=esc_message,
+            flash_mode=flash_mode,
+        )
+
+
+@dataclass
+class RenderedFrame:
+    """A full-monitor overlay image with the strip that changes every tick left blank."""
+    image: object  # PIL.Image
+    countdown_box: Tuple[int, int, int, int]  # (left, top, right, bottom) of the strip
+    count_center_y: int  # Centre of the countdown number, relative to the strip
+    progress_box: Optional[Tuple[int, int, int, int]]  # Progress bar outline, relative to the strip
+    sub_center_y: int  # Centre of the reminder line, relative to the strip
+    build_ms: float
+
+
+class _Block:
+    """One laid-out section; ``draw(image, canvas, top)`` paints it at a given y."""
+
+    def __init__(self, height: int, draw=None, pad_top: int = 0, pad_bottom: int = 0):
+        self.height = height
+        self.draw = draw
+        self.pad_top = pad_top
+        self.pad_bottom = pad_bottom
+
+    @property
+    def outer_height(self) -> int:
+        return self.pad_top + self.height + self.pad_bottom
+
+
+def _text_block(lines: List[str], font, fill: str, center_x: int, pad=(0, 0), line_gap: int = 4) -> _Block:
+    line_height = _line_height(font) + line_gap
+    height = line_height * len(lines) - line_gap
+
+    def draw(image, canvas, top):
+        for i, line in enumerate(lines):
+            canvas.text((center_x, top + i * line_height), line, font=font, fill=fill, anchor="ma")
+    return _Block(height, draw, *pad)
+
+
+def _emoji_block(emoji: str, points: int, center_x: int, fill: str, pad=(0, 0)) -> Optional[_Block]:
+    font = get_font("emoji", points)
+    if font is None:
+        return None  # Drawn with a text font it would only be a box
+    target = round(points * PX_PER_POINT)
+    try:
+        width, height = _text_size(font, emoji)
+        glyph = Image.new("RGBA", (max(1, width * 2), max(1, height * 2)), (0, 0, 0, 0))
+        ImageDraw.Draw(glyph).text((0, 0), emoji, font=font, fill=fill, embedded_color=True)
+    except Exception:
+        return None
+    bbox = glyph.getbbox()
+    if bbox is None:
+        return None
+    glyph = glyph.crop(bbox)
+    if glyph.height != target:
+        scale = target / glyph.height
+        glyph = glyph.resize((max(1, round(glyph.width * scale)), target), getattr(Image, "Resampling", Image).LANCZOS)
+
+    def draw(image, canvas, top):
+        image.paste(glyph, (center_x - glyph.width // 2, top), glyph)
+    return _Block(glyph.height, draw, *pad)
+
+
+def _activity_box(header: str, text: str, color: str, theme, center_x: int, wrap: int,
+                  header_points: int, text_points: int, box_pad=(15, 10), pad=(10, 10)) -> _Block:
+    """Bordered header + text section, as in the widget overlay."""
+    blocks = []
+    if header:
+        blocks.append(_text_block(wrap_text(header, get_font("bold", header_points), None),
+                                  get_font("bold", header_points), color, center_x))
+    text_font = get_font("regular", text_points)
+    lines = wrap_text(text, text_font, wrap)
+    blocks.append(_text_block(lines, text_font, theme.text_primary, center_x, pad=(5 if header else 0, 0)))
+    inner_height = sum(block.outer_height for block in blocks)
+    inner_width = max(int(text_font.getlength(line)) for line in lines) if lines else 0
+    if header:
+        inner_width = max(inner_width, int(get_font("bold", header_points).getlength(header)))
+    border = 4  # highlightthickness + bd
+    width = inner_width + 2 * (box_pad[0] + border)
+    height = inner_height + 2 * (box_pad[1] + border)
+
+    def draw(image, canvas, top):
+        left = center_x - width // 2
+        canvas.rectangle([left, top, left + width, top + height], outline=color, width=border)
+        y = top + border + box_pad[1]
+        for block in blocks:
+            y += block.pad_top
+            block.draw(image, canvas, y)
+            y += block.height + block.pad_bottom
+    return _Block(height, draw, *pad)
+
+
+def _muscle_rows_block(rows: Tuple[Tuple[str, int], ...], theme, center_x: int) -> _Block:
+    font = get_font("regular", 11)
+    row_height = _line_height(font) + 4
+
+    def draw(image, canvas, top):
+        # Names right-aligned against the bars, like the fixed-width name labels
+        for i, (name, count) in enumerate(rows):
+            y = top + i * row_height
+            canvas.text((center_x - 5, y), f"{name}:", font=font, fill=theme.text_secondary, anchor="ra")
+            canvas.text((center_x, y), f"{'■' * min(count * 2, 20)} ({count}x)", font=font,
+                        fill=theme.accent_secondary, anchor="la")
+    return _Block(row_height * len(rows), draw, 5, 5)
+
+
+def _countdown_layout(flash_mode: bool, screen_width: int):
+    """Heights of the per-tick strip: (count block, progress block or None, reminder block)."""
+    count = (_line_height(get_font("bold", 48 if flash_mode else 72)), 10, 10)
+    progress = None if flash_mode else (30, 10, 20)
+    sub = (_line_height(get_font("regular", 18)), 10, 10)
+    return count, progress, sub, min(600, int(screen_width * 0.5))
+
+
+def render_frame(spec: FrameSpec, size: Tuple[int, int]) -> RenderedFrame:
+    """Lay out and draw the static part of an overlay for one monitor size."""
+    start = get_clock().monotonic()
+    width, height = size
+    theme = get_theme(spec.theme_id)
+    center_x = width // 2
+    blocks: List[_Block] = []
+
+    if spec.structured:
+        blocks.append(_text_block([spec.title], get_font("bold", 32), theme.text_primary, center_x, pad=(20, 30)))
+        if spec.single_activity:
+            blocks.append(_activity_box("", spec.single_activity, theme.accent, theme, center_x,
+                                        int(width * 0.6), 24, 24, box_pad=(20, 15), pad=(20, 20)))
+        else:
+            blocks.append(_activity_box(spec.stretch_header, spec.stretch_text, theme.accent, theme,
+                                        center_x, int(width * 0.6), 24, 20))
+            blocks.append(_activity_box(spec.exercise_header, spec.exercise_text, theme.accent_secondary,
+                                        theme, center_x, int(width * 0.6), 24, 20))
+        italic = get_font("italic", 18)
+        blocks.append(_text_block(wrap_text(spec.motivation, italic, int(width * 0.7)), italic,
+                                  theme.text_secondary, center_x, pad=(15, 20)))
+    else:
+        bold = get_font("bold", 28)
+        blocks.append(_text_block(wrap_text(spec.title, bold, int(width * 0.8)), bold,
+                                  theme.text_primary, center_x, pad=(20, 20)))
+
+    if spec.has_body:
+        blocks.append(_text_block([spec.progress_text], get_font("bold", 16), theme.accent, center_x, pad=(10, 0)))
+        if spec.top_muscles:
+            blocks.append(_muscle_rows_block(spec.top_muscles, theme, center_x))
+        blocks[-1].pad_bottom += 5
+        if spec.recommendation:
+            italic = get_font("italic", 12)
+            blocks.append(_text_block(wrap_text(spec.recommendation, italic, int(width * 0.7)), italic,
+                                      theme.accent, center_x, pad=(0, 10)))
+
+    if spec.emoji:
+        emoji = _emoji_block(spec.emoji, 72, center_x, theme.text_primary, pad=(10, 10))
+        if emoji is not None:
+            blocks.append(emoji)
+
+    # The per-tick strip: countdown number, progress bar, reminder line
+    count, progress, sub, bar_width = _countdown_layout(spec.flash_mode, width)
+    strip_parts = [count] + ([progress] if progress else []) + [sub]
+    strip = _Block(sum(h + top + bottom for h, top, bottom in strip_parts))
+    blocks.append(strip)
+
+    italic = get_font("italic", 14)
+    blocks.append(_text_block(wrap_text(spec.esc_message, italic, int(width * 0.6)), italic,
+                              theme.text_secondary, center_x, pad=(40, 40)))
+
+    # Centre the stack vertically, like the packed container
+    total = sum(block.outer_height for block in blocks)
+    y = max(0, (height - total) // 2)
+    image = Image.new("RGB", (width, height), theme.background)
+    canvas = ImageDraw.Draw(image)
+    strip_top = 0
+    for block in blocks:
+        y += block.pad_top
+        if block is strip:
+            strip_top = y
+        elif block.draw is not None:
+            block.draw(image, canvas, y)
+        y += block.height + block.pad_bottom
+
+    strip_width = max(bar_width + 40, int(width * 0.6))
+    box = (center_x - strip_width // 2, strip_top, center_x + strip_width // 2, strip_top + strip.height)
+    count_h, count_top, count_bottom = count
+    count_center = count_top + count_h // 2
+    y = count_top + count_h + count_bottom
+    progress_box = None
+    if progress:
+        progress_h, progress_top, progress_bottom = progress
+        left = strip_width // 2 - bar_width // 2
+        progress_box = (left, y + progress_top, left + bar_width, y + progress_top + progress_h)
+        y += progress_top + progress_h + progress_bottom
+    sub_h, sub_top, _ = sub
+    build_ms = (get_clock().monotonic() - start) * 1000
+    return RenderedFrame(image, box, count_center, progress_box, y + sub_top + sub_h // 2, build_ms)
+
+
+def _darken(color: str) -> str:
+    color = color.lstrip("#")
+    if len(color) == 3:
+        color = "".join(c * 2 for c in color)
+    try:
+        r, g, b = (int(color[i:i + 2], 16) for i in (0, 2, 4))
+    except ValueError:
+        return "#2d3748"
+    return f"#{int(r * 0.8):02x}{int(g * 0.8):02x}{int(b * 0.8):02x}"
+
+
+def render_countdown(frame: RenderedFrame, spec: FrameSpec, text: str, fraction: float,
+                     color: str, sub_text: str = ""):
+    """The per-tick strip: number, progress bar and reminder line on the frame's background."""
+    theme = get_theme(spec.theme_id)
+    strip = frame.image.crop(frame.countdown_box)
+    canvas = ImageDraw.Draw(strip)
+    center_x = strip.width // 2
+    canvas.text((center_x, frame.count_center_y), text,
+                font=get_font("bold", 48 if spec.flash_mode else 72), fill=color, anchor="mm")
+    if frame.progress_box is not None:
+        left, top, right, bottom = frame.progress_box
+        canvas.rectangle([left, top, right - 1, bottom - 1], fill=_darken(theme.background))
+        inner = right - left - 2
+        canvas.rectangle([left + 1, top + 1, left + 1 + max(1, int(inner * fraction)) - 1, bottom - 2], fill=color)
+    if sub_text:
+        canvas.text((center_x, frame.sub_center_y), sub_text, font=get_font("regular", 18),
+                    fill=theme.text_secondary, anchor="mm")
+    return strip
+
+
+class FrameRenderer:
+    """Renders frames on worker threads, once per (spec, monitor size)."""
+
+    CACHE_SIZE = 8
+
+    def __init__(self, max_workers: int = 2):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="OverlayRender")
+        self._frames: "OrderedDict[Tuple[FrameSpec, Tuple[int, int]], Future]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_ms = get_metrics().histogram("overlay.frame_build_ms")
+
+    def _render(self, spec: FrameSpec, size: Tuple[int, int]) -> RenderedFrame:
+        frame = render_frame(spec, size)
+        self._build_ms.observe(frame.build_ms)
+        return frame
+
+    def submit(self, spec: FrameSpec, size: Tuple[int, int]) -> Future:
+        """The frame for ``spec`` at ``size``, rendering it if it is not cached."""
+        key = (spec, tuple(size))
+        with self._lock:
+            future = self._frames.get(key)
+            if future is None:
+                future = self._executor.submit(self._render, spec, tuple(size))
+                self._frames[key] = future
+                while len(self._frames) > self.CACHE_SIZE:
+                    self._frames.popitem(last=False)
+            else:
+                self._frames.move_to_end(key)
+            return future
+
+    def prerender(self, spec: FrameSpec, sizes: Iterable[Tuple[int, int]]) -> Dict[Tuple[int, int], Future]:
+        """Start rendering a frame for each distinct monitor size."""
+        return {tuple(size): self.submit(spec, size) for size in set(map(tuple, sizes))}
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+_renderer: Optional[FrameRenderer] = None
+_renderer_lock = threading.Lock()
+
+
+def get_frame_renderer() -> Optional[FrameRenderer]:
+    """The shared renderer, or None if Pillow is not installed."""
+    global _renderer
+    if not available():
+        return None
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = FrameRenderer()
+            logging.info("[Overlay] Image renderer started")
+        return _renderer
@@ -0,0 +1,342 @@
+"""Next-break content prepared ahead of time.
+
+When the scheduler fires, everything the overlay shows has to be ready: the
+activities chosen for today's least-worked muscles, their translated and
+duration-fitted text, the emoji, the body-map summary and the frequency
+recommendation. BreakPrefetcher builds that on a background thread during the
+pre-warning window and right after the previous break, so trigger_overlay only
+commits the prepared choice and creates the windows.
+
+Prepared content remembers what it was built from (content-relevant settings,
+the tracker revision, the date). A settings change drops it and starts a new
+build; anything still stale when the break fires is rebuilt on the spot.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Callable, List, Optional, Tuple
+
+from .clock import get_clock
+from .events import TrackerChanged, get_event_bus
+from .metrics import get_metrics
+from .tracing import traced
+
+# Settings that change what the overlay shows
+CONTENT_FIELDS = frozenset({
+    'language', 'lock_seconds', 'activity_type', 'position_preference',
+    'interval_minutes', 'active_from', 'active_to', 'theme',
+})
+
+# Scheduler fire to the first overlay window being mapped on screen
+FIRE_TO_MAPPED = "break.fire_to_mapped_ms"
+FIRE_TO_MAPPED_BUDGET_MS = 250.0
+
+
+@dataclass
+class BodySnapshot:
+    """Today's progress as shown under the break activities"""
+    progress_text: str
+    top_muscles: List[Tuple[str, int]]  # (translated name, count), most worked first
+    recommendation: str
+    hour: int  # The recommendation depends on the hour of the day
+
+
+@dataclass
+class BreakContent:
+    """Everything the break overlay displays, ready to show"""
+    key: tuple
+    composed: object  # tiny_lm.ComposedMessage
+    dismiss_text: str
+    emoji: str
+    esc_message: str
+    body: Optional[BodySnapshot]
+    prepared_at: float  # Clock monotonic time
+    build_ms: float
+
+    @property
+    def message(self):
+        return self.composed.message
+
+
+def exercise_emoji(message: str) -> str:
+    """Return an emoji based on the exercise message."""
+    msg_lower = message.lower()
+
+    # Map keywords to emojis
+    if any(word in msg_lower for word in ['stretch', 'yoga', 'bend']):
+        return "🧘"
+    elif any(word in msg_lower for word in ['walk', 'step', 'pace']):
+        return "🚶"
+    elif any(word in msg_lower for word in ['run', 'jog', 'sprint']):
+        return "🏃"
+    elif any(word in msg_lower for word in ['squat', 'lunge', 'leg']):
+        return "🦵"
+    elif any(word in msg_lower for word in ['push', 'pushup', 'press']):
+        return "💪"
+    elif any(word in msg_lower for word in ['jump', 'hop', 'leap']):
+        return "🤸"
+    elif any(word in msg_lower for word in ['dance', 'move', 'groove']):
+        return "💃"
+    elif any(word in msg_lower for word in ['arm', 'shoulder', 'rotate']):
+        return "🤷"
+    elif any(word in msg_lower for word in ['plank', 'core', 'abs']):
+        return "🏋️"
+    elif any(word in msg_lower for word in ['breathe', 'breath', 'inhale']):
+        return "🫁"
+    elif any(word in msg_lower for word in ['neck', 'head', 'roll']):
+        return "🙆"
+    elif any(word in msg_lower for word in ['sit', 'stand', 'posture']):
+        return "🪑"
+    else:
+        # Default exercise emoji
+        return "💪"
+
+
+def message_emoji(message) -> str:
+    """Emoji for a structured (dict) or plain break message"""
+    if isinstance(message, dict):
+        return exercise_emoji(message.get('stretch_text', '') + ' ' + message.get('exercise_text', ''))
+    return exercise_emoji(message)
+
+
+def funny_esc_message(language: str) -> str:
+    """Generate a funny ESC message."""
+    import random
+    from .translations import get_translation
+
+    # Get translated ESC completion messages
+    completions = []
+    for i in range(1, 13):  # We have 12 completion messages
+        comp = get_translation(f"esc_completion_{i}", language)
+        if comp and comp != f"esc_completion_{i}":  # Check if translation exists
+            completions.append(comp)
+
+    # Fallback to minimal hardcoded messages if no translations found
+    if not completions:
+        completions = [
+            "you'll achieve peak couch potato status",
+            "your muscles will file for unemployment"
+        ]
+
+    esc_msg = get_translation("press_esc_msg", language)
+    completion = random.choice(completions)
+    return f"{esc_msg} {completion}"
+
+
+def body_snapshot(language: str, interval_minutes: int) -> BodySnapshot:
+    """Summarise today's body-map data for the overlay"""
+    from .body_map import BodyMapVisualizer
+    from .tiny_lm import get_body_visualization_data
+    from .translations import get_translation
+
+    body_data = get_body_visualization_data()
+    muscle_counts = body_data['muscle_work_counts']
+    stats = body_data['coverage_stats']
+
+    # Progress title showing what's been accomplished
+    exercises = stats.get('exercises_done', 0)
+    stretches = stats.get('stretches_done', 0)
+    breaks = stats.get('breaks_completed', 0)
+
+    if breaks > 0:
+        parts = [f"{breaks} {get_translation('break' if breaks == 1 else 'breaks', language)}"]
+        if exercises > 0:
+            parts.append(f"{exercises} {get_translation('exercise' if exercises == 1 else 'exercises', language)}")
+        if stretches > 0:
+            parts.append(f"{stretches} {get_translation('stretch' if stretches == 1 else 'stretches', language)}")
+        progress_text = f"{get_translation('accomplished_today', language)}: {', '.join(parts)}"
+    else:
+        progress_text = get_translation("journey_begins", language)
+
+    # Top 5 worked muscles
+    top_muscles = []
+    for muscle, count in sorted(muscle_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
+        muscle_key = f"muscle_{muscle.lower()}"
+        translated_name = get_translation(muscle_key, language)
+        # Fallback to formatted English name if no translation
+        if translated_name == muscle_key:
+            translated_name = muscle.replace('_', ' ').title()
+        top_muscles.append((translated_name, count))
+
+    hour = datetime.now().hour
+    recommendation = BodyMapVisualizer().get_frequency_recommendation(
+        stats['coverage_percentage'],
+        stats['total_breaks'],
+        interval_minutes,
+        test_hour=hour
+    )
+    return BodySnapshot(progress_text, top_muscles, recommendation, hour)
+
+
+class BreakPrefetcher:
+    """Builds the next break's content on a background thread"""
+
+    def __init__(self, lm, get_settings: Callable[[], object]):
+        self._lm = lm
+        self._get_settings = get_settings
+        self._clock = get_clock()
+        self._cond = threading.Condition()
+        self._compose_lock = threading.Lock()  # The message generator is not thread-safe
+        self._ready: Optional[BreakContent] = None
+        self._wanted = False
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self._unsubscribe = None
+        self._unsubscribe_tracker = None
+        self._frame_sizes: Tuple[Tuple[int, int], ...] = ()
+        metrics = get_metrics()
+        self._hits = metrics.counter("prefetch.hit")
+        self._misses = metrics.counter("prefetch.miss")
+        self._invalidations = metrics.counter("prefetch.invalidated")
+        self._build_ms = metrics.histogram("prefetch.build_ms")
+
+    def start(self):
+        from .config import get_settings_store
+
+        if self._thread is None:
+            self._unsubscribe = get_settings_store().subscribe(self._on_settings_changed)
+            self._unsubscribe_tracker = get_event_bus().subscribe(TrackerChanged, self._on_tracker_changed)
+            self._thread = threading.Thread(target=self._run, name="BreakPrefetch", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self._unsubscribe_tracker:
+            self._unsubscribe_tracker()
+            self._unsubscribe_tracker = None
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def request(self):
+        """Prepare the next break's content soon (no-op if it is already prepared)"""
+        with self._cond:
+            self._wanted = True
+            self._cond.notify()
+
+    def invalidate(self):
+        """Drop prepared content and build it again"""
+        with self._cond:
+            if self._ready is not None:
+                self._ready = None
+                self._invalidations.inc()
+            self._wanted = True
+            self._cond.notify()
+
+    def set_frame_sizes(self, sizes):
+        """Monitor sizes to pre-render image overlay frames for"""
+        self._frame_sizes = tuple(sorted(set(tuple(size) for size in sizes)))
+        with self._cond:
+            content = self._ready
+        if content is not None:
+            self._prerender(content)
+
+    def _prerender(self, content: BreakContent):
+        """Start rendering the image overlay for prepared content (image renderer only)"""
+        settings = self._get_settings()
+        if getattr(settings, 'overlay_renderer', 'widgets') != 'image' or not self._frame_sizes:
+            return
+        from .overlay_render import FrameSpec, get_frame_renderer
+
+        renderer = get_frame_renderer()
+        if renderer is not None:
+            spec = FrameSpec.from_content(content.message, content.body, content.emoji,
+                                          content.esc_message, settings.theme)
+            renderer.prerender(spec, self._frame_sizes)
+
+    def _on_settings_changed(self, settings, changed):
+        if CONTENT_FIELDS.intersection(changed):
+            self.invalidate()
+
+    def _on_tracker_changed(self, event: TrackerChanged):
+        # A shown break changes nothing the next one displays
+        if event.kind != 'shown':
+            self.request()
+
+    def _key(self) -> tuple:
+        settings = self._get_settings()
+        generator = self._lm._get_generator()
+        return (
+            tuple(getattr(settings, name, None) for name in sorted(CONTENT_FIELDS)),
+            self._lm.language,
+            getattr(self._lm, '_last_activity', None),
+            generator.tracker.revision,
+            date.today(),
+        )
+
+    @traced("prefetch.build")
+    def _build(self) -> BreakContent:
+        with self._compose_lock:
+            start = self._clock.monotonic()
+            settings = self._get_settings()
+            key = self._key()
+            composed = self._lm.compose_message(break_seconds=settings.lock_seconds)
+            dismiss_text = self._lm.get_dismiss_button_text()
+            esc_message = funny_esc_message(settings.language)
+            try:
+                body = body_snapshot(settings.language, settings.interval_minutes)
+            except Exception as e:
+                # The overlay shows no body map rather than no break
+                logging.error(f"[Prefetch] Body map summary failed: {e}")
+                body = None
+            now = self._clock.monotonic()
+            build_ms = (now - start) * 1000
+            self._build_ms.observe(build_ms)
+            return BreakContent(key, composed, dismiss_text, message_emoji(composed.message), esc_message,
+                                body, now, build_ms)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._wanted and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                self._wanted = False
+                ready = self._ready
+            # The key is computed outside the lock: the first call builds the
+            # message generator, and request()/invalidate() on the Tk thread must not wait for it
+            try:
+                if ready is not None and ready.key == self._key():
+                    continue
+                content = self._build()
+                key = self._key()
+            except Exception as e:
+                logging.error(f"[Prefetch] Failed to prepare the next break: {e}")
+                continue
+            with self._cond:
+                # Settings may have changed while building; the next request rebuilds
+                if content.key != key:
+                    continue
+                self._ready = content
+            logging.info(f"[Prefetch] Next break prepared in {content.build_ms:.1f} ms")
+            try:
+                self._prerender(content)
+            except Exception as e:
+                logging.error(f"[Prefetch] Failed to start the overlay frame render: {e}")
+
+    @traced("prefetch.take")
+    def take(self) -> BreakContent:
+        """The prepared content if still current, otherwise content built now"""
+        with self._cond:
+            content, self._ready = self._ready, None
+        if content is not None and content.key == self._key():
+            self._hits.inc()
+            if content.body is not None and content.body.hour != datetime.now().hour:
+                settings = self._get_settings()
+                try:
+                    content.body = body_snapshot(settings.language, settings.interval_minutes)
+                except Exception:
+                    content.body = None
+            return content
+        self._misses.inc()
+        if content is not None:
+            self._invalidations.inc()
+        return self._build()
@@ -0,0 +1,318 @@
+"""Virtual-time simulator and accuracy benchmark for the break scheduler.
+
+Runs the real SchedulingEngine against a VirtualClock over many Settings
+combinations and multi-day spans, optionally disturbed by snoozes, suspends
+and wall-clock steps, and checks every break it fires against the
+BreakCalendar. One run of three virtual days takes roughly 50-100 ms; the
+default suite (200 combinations per scenario) takes about a minute.
+
+Usage:
+    python -m gitfitdev.sim                     # compare against the stored baseline
+    python -m gitfitdev.sim --update-baseline   # record a new baseline
+    python -m gitfitdev.sim --combos 0 --days 7 # every combination, a week each
+
+Exit status is 1 when any metric regressed against the baseline.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time as _time
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from .break_calendar import get_break_calendar
+from .clock import MISSED_BREAK_POLICIES, VirtualClock
+from .config import get_default_settings, Settings
+from .core import BreakDue, PreWarning, SchedulingEngine
+
+SCENARIOS = ("steady", "snooze", "suspend", "clock_step")
+
+ACTIVE_WINDOWS = [("09:00", "17:00"), ("08:30", "12:15"), ("22:00", "06:00"), ("00:00", "23:59")]
+INTERVALS = [10, 15, 20, 25, 30, 45, 60, 90, 120]
+PRE_WARNINGS = [(False, 30), (True, 10), (True, 30), (True, 60)]
+
+SNOOZE_MINUTES = 5
+SNOOZE_PROBABILITY = 0.3
+# A fire this close to its expected time counts as on time
+MATCH_TOLERANCE_SECONDS = 5.0
+# Polls in a row that ask for a zero-length sleep before we call it a busy loop
+MAX_SPIN = 1000
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sim_baseline.json")
+
+# Per-metric allowance before a change counts as a regression (all metrics: lower is better)
+TOLERANCES = {
+    "missed": 0,
+    "duplicates": 0,
+    "max_error_s": 0.5,
+    "mean_error_s": 0.05,
+    "max_lead_error_s": 0.5,
+    "warnings_missing": 0,
+    "wakeups_per_hour": 0.05,  # relative
+}
+
+
+def settings_combinations() -> List[Settings]:
+    """Every schedule combination the simulator knows about."""
+    base = get_default_settings()
+    combos = []
+    for active_from, active_to in ACTIVE_WINDOWS:
+        for interval in INTERVALS:
+            if interval < 60:
+                minutes = range(0, interval, max(1, interval // 3))
+            else:
+                minutes = (0, 15, 30, 45)
+            for minute in minutes:
+                for pre_warning, pre_warning_seconds in PRE_WARNINGS:
+                    combos.append(replace(
+                        base,
+                        active_from=active_from,
+                        active_to=active_to,
+                        interval_minutes=interval,
+                        trigger_at_minute=minute,
+                        pre_warning=pre_warning,
+                        pre_warning_seconds=pre_warning_seconds,
+                        disclaimer_accepted=True,
+                    ))
+    return combos
+
+
+@dataclass
+class RunResult:
+    """Outcome of simulating one Settings combination under one scenario."""
+    expected: int = 0
+    fired: int = 0
+    missed: int = 0
+    duplicates: int = 0
+    errors: List[float] = field(default_factory=list)
+    lead_errors: List[float] = field(default_factory=list)
+    warnings_missing: int = 0
+    wakeups: int = 0
+    hours: float = 0.0
+
+
+def _plan_disruptions(scenario: str, start: datetime, days: int, rng: random.Random) -> List[Tuple[datetime, str, float]]:
+    disruptions = []
+    for day in range(days):
+        day_start = start + timedelta(days=day)
+        if scenario == "suspend":
+            for _ in range(2):
+                when = day_start + timedelta(seconds=rng.uniform(0, 86400))
+                disruptions.append((when, "suspend", rng.uniform(5 * 60, 3 * 3600)))
+        elif scenario == "clock_step":
+            when = day_start + timedelta(seconds=rng.uniform(0, 86400))
+            disruptions.append((when, "step", rng.choice((-1, 1)) * rng.uniform(5 * 60, 90 * 60)))
+    disruptions.sort()
+    return disruptions
+
+
+def simulate(settings: Settings, scenario: str = "steady", start: Optional[datetime] = None,
+             days: int = 3, seed: int = 0) -> RunResult:
+    """Drive one SchedulingEngine through ``days`` of virtual time and score it against the calendar."""
+    rng = random.Random(seed)
+    if start is None:
+        start = datetime(2026, 3, 2) + timedelta(minutes=rng.randrange(24 * 60))
+    clock = VirtualClock(start)
+    calendar = get_break_calendar(settings)
+
+    fires: List[datetime] = []
+    warnings: List[Tuple[datetime, Optional[datetime]]] = []
+    snoozed: Dict[datetime, datetime] = {}
+    excused: List[Tuple[datetime, datetime]] = []
+
+    def on_break_due(event):
+        fires.append(clock.now())
+
+    def on_pre_warning(event):
+        target = event.break_at
+        warnings.append((clock.now(), target))
+        # Only snooze real calendar breaks, not the re-warning for a break that is already snoozed
+        on_calendar = target is not None and target in calendar.breaks_on(target.date())
+        if scenario == "snooze" and on_calendar and rng.random() < SNOOZE_PROBABILITY:
+            # The break comes back when the snooze runs out, plus the scheduler's 5s grace
+            snoozed[target] = clock.now() + timedelta(minutes=SNOOZE_MINUTES, seconds=5)
+            scheduler.snooze(SNOOZE_MINUTES)
+
+    scheduler = SchedulingEngine(lambda: settings, clock=clock)
+    scheduler.subscribe(BreakDue, on_break_due)
+    scheduler.subscribe(PreWarning, on_pre_warning)
+    disruptions = _plan_disruptions(scenario, start, days, rng)
+    end = start + timedelta(days=days)
+
+    scheduler.prime()
+    spin = 0
+    while clock.now() < end:
+        timeout = scheduler.poll()
+        spin = spin + 1 if timeout <= 0 else 0
+        if spin > MAX_SPIN:
+            raise RuntimeError(f"scheduler keeps asking for a zero sleep at {clock.now()}")
+        wake_at = clock.now() + timedelta(seconds=timeout)
+        if disruptions and disruptions[0][0] <= wake_at:
+            when, kind, seconds = disruptions.pop(0)
+            clock.advance_to(when)
+            # Disruptions planned inside an earlier suspend happen right after it
+            when = clock.now()
+            if kind == "suspend":
+                clock.suspend(seconds)
+            else:
+                clock.step_wall(seconds)
+            if seconds > 0:
+                excused.append((when, when + timedelta(seconds=seconds)))
+        else:
+            clock.advance(timeout)
+        scheduler.after_wake(timeout)
+
+    result = RunResult(fired=len(fires), wakeups=scheduler.wakeups, hours=clock.monotonic() / 3600.0)
+    # Breaks that would only come due after the run ends (e.g. snoozed past it) are not expected
+    expected = [e for e in calendar.breaks_between(start, end) if snoozed.get(e, e) < end]
+    _score(result, settings, scheduler, expected, fires, warnings, snoozed, excused)
+    return result
+
+
+def _score(result: RunResult, settings: Settings, scheduler: SchedulingEngine, expected: List[datetime],
+           fires: List[datetime], warnings, snoozed, excused):
+    # Missed breaks may legitimately be made up for (coalesce/defer) this long after a disruption
+    grace = timedelta(seconds=scheduler.MISSED_GRACE_SECONDS + scheduler.DEFER_SECONDS + MATCH_TOLERANCE_SECONDS)
+    tolerance = timedelta(seconds=MATCH_TOLERANCE_SECONDS)
+    unmatched = sorted(fires)
+    warned = {target for _, target in warnings}
+    expected_set = set(expected)
+
+    for instant in expected:
+        due = snoozed.get(instant, instant)
+        excuse_end = next((e for s, e in excused if s - tolerance <= instant <= e), None)
+        latest = (excuse_end + grace) if excuse_end else (due + tolerance)
+        match = next((f for f in unmatched if due - timedelta(seconds=1) <= f <= latest
+                      and (f == due or f not in expected_set)), None)
+        if excuse_end:
+            # Missing or late is acceptable for breaks that fell into a suspend/jump
+            if match is not None:
+                unmatched.remove(match)
+            continue
+        result.expected += 1
+        if match is None:
+            result.missed += 1
+            continue
+        unmatched.remove(match)
+        result.errors.append((match - due).total_seconds())
+        if settings.pre_warning and instant not in warned:
+            result.warnings_missing += 1
+
+    result.duplicates = len(unmatched)
+    for warned_at, target in warnings:
+        lead_start = target - timedelta(seconds=settings.pre_warning_seconds) if target else None
+        disturbed = any(s <= target and lead_start <= e for s, e in excused) if target else True
+        if target in expected_set and not disturbed:
+            lead = (target - warned_at).total_seconds()
+            result.lead_errors.append(abs(lead - settings.pre_warning_seconds))
+
+
+def run_suite(days: int = 3, combos: int = 200, seed: int = 1, scenarios=SCENARIOS,
+              policy: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+    """Simulate a (seeded) sample of combinations under each scenario and aggregate the metrics."""
+    all_settings = settings_combinations()
+    if policy:
+        all_settings = [replace(s, missed_break_policy=policy) for s in all_settings]
+    if combos and combos < len(all_settings):
+        all_settings = random.Random(seed).sample(all_settings, combos)
+
+    report = {}
+    for scenario in scenarios:
+        started = _time.perf_counter()
+        total = RunResult()
+        for index, settings in enumerate(all_settings):
+            r = simulate(settings, scenario, days=days, seed=seed * 100003 + index)
+            total.expected += r.expected
+            total.fired += r.fired
+            total.missed += r.missed
+            total.duplicates += r.duplicates
+            total.errors.extend(r.errors)
+            total.lead_errors.extend(r.lead_errors)
+            total.warnings_missing += r.warnings_missing
+            total.wakeups += r.wakeups
+            total.hours += r.hours
+        report[scenario] = {
+            "runs": len(all_settings),
+            "expected": total.expected,
+            "fired": total.fired,
+            "missed": total.missed,
+            "duplicates": total.duplicates,
+            "max_error_s": round(max(total.errors, default=0.0), 3),
+            "mean_error_s": round(sum(total.errors) / len(total.errors), 3) if total.errors else 0.0,
+            "max_lead_error_s": round(max(total.lead_errors, default=0.0), 3),
+            "warnings_missing": total.warnings_missing,
+            "wakeups_per_hour": round(total.wakeups / total.hours, 2) if total.hours else 0.0,
+            "runtime_s": round(_time.perf_counter() - started, 2),
+        }
+    return report
+
+
+def compare(current: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]]) -> List[Tuple[str, str, float, float, bool]]:
+    """Rows of (scenario, metric, baseline, current, regressed)."""
+    rows = []
+    for scenario, metrics in current.items():
+        base = baseline.get(scenario, {})
+        for metric, allowance in TOLERANCES.items():
+            if metric not in base:
+                continue
+            old, new = base[metric], metrics[metric]
+            limit = old * (1 + allowance) if metric == "wakeups_per_hour" else old + allowance
+            rows.append((scenario, metric, old, new, new > limit))
+    return rows
+
+
+def _print_table(rows):
+    print(f"{'scenario':<12} {'metric':<18} {'baseline':>12} {'current':>12}  status")
+    print("-" * 66)
+    for scenario, metric, old, new, regressed in rows:
+        status = "REGRESSION" if regressed else "ok"
+        print(f"{scenario:<12} {metric:<18} {old:>12} {new:>12}  {status}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m gitfitdev.sim", description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=3, help="virtual days per run (default 3)")
+    parser.add_argument("--combos", type=int, default=200, help="settings combinations to sample, 0 for all (default 200)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS, help="limit to a scenario (repeatable)")
+    parser.add_argument("--policy", choices=MISSED_BREAK_POLICIES, help="missed_break_policy to simulate (default: settings default)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.days, args.combos, args.seed, tuple(args.scenario or SCENARIOS), args.policy)
+    params = {"days": args.days, "combos": args.combos, "seed": args.seed, "policy": args.policy}
+
+    if args.json:
+        print(json.dumps({"params": params, "results": report}, indent=2))
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"params": params, "results": report}, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"No usable baseline ({e}); run with --update-baseline first")
+        return 0
+    if baseline.get("params") != params:
+        print(f"Note: baseline was recorded with {baseline.get('params')}, this run used {params}")
+
+    rows = compare(report, baseline.get("results", {}))
+    _print_table(rows)
+    for scenario, metrics in report.items():
+        print(f"{scenario}: {metrics['runs']} runs, {metrics['expected']} breaks checked in {metrics['runtime_s']}s")
+    return 1 if any(row[-1] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""Opt-in localhost HTTP endpoint for monitoring.
+
+With ``metrics_endpoint`` enabled in the settings, the single-instance lock
+socket (127.0.0.1:52847) also answers plain HTTP GET requests:
+
+    /status   JSON: next break, pause and skip state, today's coverage stats
+    /metrics  the metrics registry in the Prometheus text format
+
+Connections are served by a non-blocking selector loop on a background
+thread, so a slow or stuck client never holds up the Tk thread. Every
+response closes its connection.
+
+    curl -s http://127.0.0.1:52847/metrics
+"""
+
+import json
+import logging
+import selectors
+import socket
+import threading
+from typing import Callable, Dict, Optional
+
+from .clock import get_clock
+from .metrics import get_metrics, prometheus_text
+
+# Requests larger than this, or idle longer than this, are dropped
+MAX_REQUEST_BYTES = 8192
+CLIENT_TIMEOUT = 5.0
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            500: "Internal Server Error"}
+
+
+class _Client:
+    def __init__(self, conn: socket.socket, now: float):
+        self.conn = conn
+        self.request = b""
+        self.response = b""
+        self.started = now
+
+
+class StatusEndpoint:
+    """Serves /status and /metrics on an already bound, listening socket."""
+
+    def __init__(self, sock: socket.socket, get_status: Callable[[], Dict]):
+        self._sock = sock
+        self._get_status = get_status
+        self._clock = get_clock()
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._thread: Optional[threading.Thread] = None
+        self._wake_r = self._wake_w = None
+        self._stopped = threading.Event()
+        self._requests = get_metrics().counter("endpoint.requests")
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._sock.setblocking(False)
+        self._selector.register(self._sock, selectors.EVENT_READ)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        self._thread = threading.Thread(target=self._run, name="StatusEndpoint", daemon=True)
+        self._thread.start()
+        host, port = self._sock.getsockname()[:2]
+        logging.info(f"[Endpoint] Serving /status and /metrics on http://{host}:{port}")
+
+    def stop(self):
+        """Stop serving; the socket itself stays open (it is the single-instance lock)."""
+        if self._thread is None:
+            return
+        self._stopped.set()
+        try:
+            self._wake_w.send(b"x")
+        except OSError:
+            pass
+        self._thread.join(timeout=2.0)
+        self._thread = None
+        logging.info("[Endpoint] Stopped")
+
+    def _run(self):
+        clients: Dict[socket.socket, _Client] = {}
+        try:
+            while not self._stopped.is_set():
+                for key, events in self._selector.select(timeout=1.0):
+                    if key.fileobj is self._wake_r:
+                        continue
+                    if key.fileobj is self._sock:
+                        self._accept(clients)
+                    elif events & selectors.EVENT_READ:
+                        self._read(clients, clients[key.fileobj])
+                    elif events & selectors.EVENT_WRITE:
+                        self._write(clients, clients[key.fileobj])
+                now = self._clock.monotonic()
+                for client in [c for c in clients.values() if now - c.started > CLIENT_TIMEOUT]:
+                    self._close(clients, client)
+        finally:
+            for client in list(clients.values()):
+                self._close(clients, client)
+            self._selector.close()
+            self._wake_r.close()
+            self._wake_w.close()
+            self._sock.setblocking(True)
+
+    def _accept(self, clients):
+        try:
+            conn, _ = self._sock.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            logging.warning(f"[Endpoint] Accept failed: {e}")
+            return
+        conn.setblocking(False)
+        clients[conn] = _Client(conn, self._clock.monotonic())
+        self._selector.register(conn, selectors.EVENT_READ)
+
+    def _read(self, clients, client: _Client):
+        try:
+            data = client.conn.recv(4096)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._close(clients, client)
+            return
+        client.request += data
+        if b"\r\n\r\n" in client.request or b"\n\n" in client.request:
+            client.response = self._respond(client.request)
+        elif len(client.request) > MAX_REQUEST_BYTES:
+            client.response = self._response(400, "text/plain", b"Request too large\n")
+        else:
+            return
+        self._selector.modify(client.conn, selectors.EVENT_WRITE)
+
+    def _write(self, clients, client: _Client):
+        try:
+            sent = client.conn.send(client.response)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            sent = len(client.response)
+        client.response = client.response[sent:]
+        if not client.response:
+            self._close(clients, client)
+
+    def _close(self, clients, client: _Client):
+        clients.pop(client.conn, None)
+        try:
+            self._selector.unregister(client.conn)
+        except (KeyError, ValueError):
+            pass
+        client.conn.close()
+
+    def _respond(self, request: bytes) -> bytes:
+        self._requests.inc()
+        try:
+            method, target = request.split(b"\r\n", 1)[0].split(b"\n", 1)[0].decode("latin-1").split()[:2]
+        except ValueError:
+            return self._response(400, "text/plain", b"Bad request\n")
+        if method not in ("GET", "HEAD"):
+            return self._response(405, "text/plain", b"Only GET is supported\n")
+        path = target.split("?", 1)[0]
+        try:
+            if path == "/status":
+                body = json.dumps(self._get_status(), default=str, indent=2).encode("utf-8") + b"\n"
+                response = self._response(200, "application/json", body)
+            elif path == "/metrics":
+                body = prometheus_text(get_metrics().snapshot()).encode("utf-8")
+                response = self._response(200, "text/plain; version=0.0.4; charset=utf-8", body)
+            else:
+                return self._response(404, "text/plain", b"Try /status or /metrics\n")
+        except Exception as e:
+            logging.error(f"[Endpoint] {path} failed: {e}")
+            return self._response(500, "text/plain", b"Internal error\n")
+        if method == "HEAD":
+            response = response.split(b"\r\n\r\n", 1)[0] + b"\r\n\r\n"
+        return response
+
+    @staticmethod
+    def _response(status: int, content_type: str, body: bytes) -> bytes:
+        head = (f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n")
+        return head.encode("latin-1") + body
@@ -0,0 +1,181 @@
+"""Next-break status for status bars (polybar, waybar, i3blocks, ...).
+
+The app keeps two small fixed-size files up to date, rewriting them in place
+through mmap whenever the schedule or today's tracker data changes:
+
+    $XDG_RUNTIME_DIR/gitfitdev/status       one line of text
+    $XDG_RUNTIME_DIR/gitfitdev/status.bin   a little-endian struct
+
+(``~/.gitfitdev/run/`` when XDG_RUNTIME_DIR is not set.) Both are removed
+when the app exits.
+
+Text format, always TEXT_SIZE bytes, fields separated by single spaces:
+
+    seq=0000000042 next=1760709600 paused=0 until=0000000000 completed=0003 coverage=040 end=0000000042
+
+    seq, end    update counter, see below
+    next        Unix time of the next break, 0 if none is scheduled
+    paused      1 while breaks are paused
+    until       Unix time a timed pause ends, 0 if none
+    completed   breaks completed today
+    coverage    percentage of muscle groups worked today
+
+Binary format (``BINARY``), BINARY.size bytes:
+
+    u32 seq, u32 layout (LAYOUT), i64 next, i64 until, u32 completed,
+    u32 coverage, u8 paused, 3 pad bytes, u32 end
+
+A reader takes the whole file with a single read() and uses it only if
+``seq == end`` and ``seq`` is even; otherwise it reads again. The writer
+sets ``end`` to an odd value, writes the fields, then sets ``seq`` and
+finally ``end`` to the new even value, so a read that overlaps an update
+never passes that check.
+
+Usage:
+    python -m gitfitdev.status_file    # print the current status
+"""
+
+import logging
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+LAYOUT = 1
+BINARY = struct.Struct("<IIqqIIB3xI")
+_BINARY_END = BINARY.size - 4
+
+_TEXT = ("seq={seq:010d} next={next:010d} paused={paused:d} until={until:010d} "
+         "completed={completed:04d} coverage={coverage:03d} end={seq:010d}\n")
+TEXT_SIZE = len(_TEXT.format(seq=0, next=0, paused=0, until=0, completed=0, coverage=0))
+_TEXT_END = TEXT_SIZE - len("0000000000\n")
+
+
+class Status(NamedTuple):
+    next: int = 0
+    paused: bool = False
+    until: int = 0
+    completed: int = 0
+    coverage: int = 0
+
+
+def status_dir() -> Path:
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return Path(runtime) / "gitfitdev"
+    return Path.home() / ".gitfitdev" / "run"
+
+
+def _text(seq: int, status: Status) -> bytes:
+    return _TEXT.format(seq=seq, next=max(0, status.next), paused=status.paused, until=max(0, status.until),
+                        completed=min(status.completed, 9999), coverage=min(status.coverage, 999)).encode("ascii")
+
+
+def _binary(seq: int, status: Status) -> bytes:
+    return BINARY.pack(seq, LAYOUT, status.next, status.until, status.completed, status.coverage,
+                       status.paused, seq)
+
+
+def _open_mapped(path: Path, size: int) -> mmap.mmap:
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        os.ftruncate(fd, size)
+        return mmap.mmap(fd, size)
+    finally:
+        os.close(fd)
+
+
+class StatusFile:
+    """Writes the status files in place; one writer (the Tk thread) at a time."""
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory) if directory else status_dir()
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.text_path = self.directory / "status"
+        self.binary_path = self.directory / "status.bin"
+        self._text = _open_mapped(self.text_path, TEXT_SIZE)
+        self._binary = _open_mapped(self.binary_path, BINARY.size)
+        self._seq = 0
+        self._status = Status()
+        self._text[:] = _text(0, self._status)
+        self._binary[:] = _binary(0, self._status)
+        self.writes = 0
+
+    def update(self, status: Status) -> bool:
+        """Publish ``status`` if it differs from what the files hold; returns whether it wrote."""
+        if status == self._status or self._text is None:
+            return False
+        seq = (self._seq + 2) % 2 ** 32
+        odd = self._seq + 1
+        self._publish(self._text, _text(seq, status), len("seq=0000000000"), _TEXT_END, TEXT_SIZE - 1,
+                      b"%010d" % odd)
+        self._publish(self._binary, _binary(seq, status), 4, _BINARY_END, BINARY.size, struct.pack("<I", odd))
+        self._seq = seq
+        self._status = status
+        self.writes += 1
+        return True
+
+    @staticmethod
+    def _publish(mapped: mmap.mmap, data: bytes, seq_stop: int, end_start: int, end_stop: int, odd_end: bytes):
+        # end (odd), fields, seq, end: a read overlapping this never sees seq == end, both even
+        mapped[end_start:end_stop] = odd_end
+        mapped[seq_stop:end_start] = data[seq_stop:end_start]
+        mapped[:seq_stop] = data[:seq_stop]
+        mapped[end_start:end_stop] = data[end_start:end_stop]
+
+    def close(self, remove: bool = True):
+        for mapped in (self._text, self._binary):
+            if mapped is not None:
+                mapped.close()
+        self._text = self._binary = None
+        if remove:
+            for path in (self.text_path, self.binary_path):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+
+def parse_text(data: bytes) -> Optional[Dict[str, int]]:
+    """Fields of a text status read, or None if it overlapped an update."""
+    try:
+        fields = dict(item.split("=", 1) for item in data.decode("ascii").split())
+        values = {key: int(value) for key, value in fields.items()}
+    except ValueError:
+        return None
+    if values.get("seq") != values.get("end") or values["seq"] % 2:
+        return None
+    return values
+
+
+def parse_binary(data: bytes) -> Optional[Dict[str, int]]:
+    """Fields of a binary status read, or None if it overlapped an update."""
+    if len(data) != BINARY.size:
+        return None
+    seq, layout, next_fire, until, completed, coverage, paused, end = BINARY.unpack(data)
+    if seq != end or seq % 2 or layout != LAYOUT:
+        return None
+    return {"seq": seq, "next": next_fire, "paused": paused, "until": until,
+            "completed": completed, "coverage": coverage}
+
+
+def main(argv=None) -> int:
+    path = status_dir() / "status"
+    for _ in range(10):
+        try:
+            values = parse_text(path.read_bytes())
+        except OSError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 1
+        if values is not None:
+            for key, value in values.items():
+                print(f"{key}: {value}")
+            return 0
+    logging.warning(f"[Status] {path} kept changing while being read")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,125 +2,220 @@
 Enhanced message generation with intelligent exercise distribution and body tracking
 """
 import random
+from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, date
-import json
+import logging
 import os
+import threading
 from pathlib import Path
 
+from .catalog_index import MuscleRanking, get_catalog_index
+from .events import TrackerChanged, get_event_bus
+from .metrics import get_metrics
+from .tracing import traced
 from .fitness_data import (
     STRETCHES, EXERCISES,
     MuscleGroup, Exercise, Stretch,
-    get_benefits_for_muscle_groups,
-    filter_exercises_by_position,
-    filter_stretches_by_position
+    get_benefits_for_muscle_groups
 )
 
 class DailyTracker:
-    """Track daily exercise coverage for balanced workouts"""
+    """Track daily exercise coverage for balanced workouts
+
+    Every change is appended to a journal (``daily_tracker.log``) and the
+    state is periodically compacted into ``daily_tracker.json``, so recording
+    a break costs one small append instead of rewriting the whole day.
+    """
+
+    # Journal entries to accumulate before folding them into the snapshot
+    COMPACT_EVERY = 50
 
     def __init__(self):
+        from .journal import EventJournal
+
         self.data_dir = Path.home() / '.gitfitdev'
         self.data_dir.mkdir(exist_ok=True)
         self.tracker_file = self.data_dir / 'daily_tracker.json'
+        self.journal = EventJournal(self.tracker_file, self.data_dir / 'daily_tracker.log')
+        self._lock = threading.Lock()
+        # Bumped whenever something other than a shown break changes today's data
+        self.revision = 0
+        # Bumped after every change, history included; derived stats are cached per value
+        self._change_seq = 0
+        self._derived: Dict[str, Tuple[int, object]] = {}
+        self.ranking = MuscleRanking()
         self.load_daily_data()
+        self.history = self._open_history()
 
-    def load_daily_data(self):
-        """Load or initialize daily tracking data"""
-        today = date.today().isoformat()
+    def _open_history(self):
+        """Open the multi-day history, importing today's data on first use"""
+        from .history import get_history_store
 
-        if self.tracker_file.exists():
+        history = get_history_store()
+        if history is None or not history.is_empty():
+            return history
+        try:
+            with self._lock:
+                data = dict(self.data)
+            for key, kind in (('exercises_done', 'exercise'), ('stretches_done', 'stretch')):
+                for item in data.get(key, []):
+                    history.record(kind, description=item.get('description', ''))
+            # Snapshots written before the history existed only kept totals per muscle group
+            for mg_name, count in data.get('muscle_groups_worked', {}).items():
+                for _ in range(count):
+                    history.record('imported', [mg_name])
+            for key, kind in (('breaks_shown', 'shown'), ('breaks_completed', 'completed'),
+                              ('breaks_escaped', 'escaped')):
+                for _ in range(data.get(key, 0)):
+                    history.record(kind)
+        except Exception as e:
+            logging.error(f"[Tracker] Failed to import today's data into history: {e}")
+        return history
+
+    @staticmethod
+    def _empty_day(day: str) -> Dict:
+        return {
+            'date': day,
+            'muscle_groups_worked': {},
+            'exercises_done': [],
+            'stretches_done': [],
+            'total_breaks': 0,
+            'breaks_completed': 0,
+            'breaks_escaped': 0,
+            'breaks_shown': 0
+        }
+
+    def _set_data(self, data: Dict):
+        self.data = data
+        self.ranking.reset(data.get('muscle_groups_worked'))
+        self.revision += 1
+
+    def load_daily_data(self):
+        """Rebuild today's data from the snapshot and the journal"""
+        with self._lock:
+            snapshot, events = self.journal.load()
+            data = self._empty_day(date.today().isoformat())
+            if snapshot and 'date' in snapshot:
+                data = self._empty_day(snapshot['date'])
+                data.update({k: v for k, v in snapshot.items() if k != 'seq'})
+            self._set_data(data)
+            for event in events:
+                self._apply(event)
+
+            rolled_over = self.data['date'] != date.today().isoformat()
+            if rolled_over:
+                self._set_data(self._empty_day(date.today().isoformat()))
+            if rolled_over or snapshot is None or self.journal.pending >= self.COMPACT_EVERY:
+                self._compact()
+
+    def _apply(self, event: Dict):
+        """Apply one journal event to the in-memory state"""
+        if event.get('date') != self.data['date']:
+            self._set_data(self._empty_day(event.get('date', date.today().isoformat())))
+
+        kind = event.get('type')
+        if kind != 'shown':
+            self.revision += 1
+        if kind in ('exercise', 'stretch'):
+            key = 'exercises_done' if kind == 'exercise' else 'stretches_done'
+            self.data.setdefault(key, []).append({
+                'description': event.get('description', ''),
+                'time': event.get('time', '')
+            })
+            worked = self.data.setdefault('muscle_groups_worked', {})
+            for mg_name in event.get('muscles', []):
+                worked[mg_name] = worked.get(mg_name, 0) + 1
+                self.ranking.add(mg_name)
+        elif kind == 'shown':
+            self.data['breaks_shown'] = self.data.get('breaks_shown', 0) + 1
+            self.data['total_breaks'] = self.data.get('total_breaks', 0) + 1  # Keep for backward compatibility
+        elif kind == 'completed':
+            self.data['breaks_completed'] = self.data.get('breaks_completed', 0) + 1
+        elif kind == 'escaped':
+            self.data['breaks_escaped'] = self.data.get('breaks_escaped', 0) + 1
+        elif kind == 'reset':
+            self._set_data(self._empty_day(self.data['date']))
+
+    @traced("tracker.record")
+    def _record(self, kind: str, **fields):
+        """Journal an event and apply it"""
+        now = datetime.now()
+        event = dict(fields, type=kind, date=now.date().isoformat(), time=now.isoformat())
+        with self._lock:
             try:
-                with open(self.tracker_file, 'r') as f:
-                    self.data = json.load(f)
-                    # Check if it's a new day and reset if needed
-                    if self.data.get('date') != today:
-                        self.data = {
-                            'date': today,
-                            'muscle_groups_worked': {},
-                            'exercises_done': [],
-                            'stretches_done': [],
-                            'total_breaks': 0,
-                            'breaks_completed': 0,
-                            'breaks_escaped': 0,
-                            'breaks_shown': 0
-                        }
-                        self.save()
-            except:
-                self.data = {}
-        else:
-            self.data = {}
-
-        # Initialize if empty
-        if not self.data or 'date' not in self.data:
-            self.data = {
-                'date': today,
-                'muscle_groups_worked': {},
-                'exercises_done': [],
-                'stretches_done': [],
-                'total_breaks': 0,
-                'breaks_completed': 0,
-                'breaks_escaped': 0,
-                'breaks_shown': 0
-            }
-            self.save()
+                self.journal.append(event)
+            except OSError as e:
+                logging.error(f"[Tracker] Failed to journal {kind}: {e}")
+            rolled_over = event['date'] != self.data['date']
+            self._apply(event)
+            if rolled_over or self.journal.pending >= self.COMPACT_EVERY:
+                self._compact()
+
+        history = getattr(self, 'history', None)
+        if history is not None:
+            try:
+                if kind == 'reset':
+                    history.clear_day(now.date())
+                else:
+                    history.record(kind, fields.get('muscles', ()), fields.get('description', ''), now)
+            except Exception as e:
+                logging.error(f"[Tracker] Failed to record {kind} in history: {e}")
+        self._changed(kind)
+
+    def _changed(self, kind: str):
+        """Drop cached derived data and tell subscribers"""
+        self._change_seq += 1
+        get_event_bus().publish(TrackerChanged(kind, self.revision))
+
+    def _cached(self, name: str, compute):
+        """Derived data, recomputed only after the tracker changed"""
+        seq = self._change_seq
+        cached = self._derived.get(name)
+        if cached is not None and cached[0] == seq:
+            return cached[1]
+        get_metrics().counter(f"recompute.{name}").inc()
+        value = compute()
+        self._derived[name] = (seq, value)
+        return value
+
+    def _compact(self):
+        try:
+            self.journal.compact(self.data)
+        except OSError as e:
+            logging.error(f"[Tracker] Failed to write snapshot: {e}")
 
     def save(self):
-        """Save tracking data"""
-        with open(self.tracker_file, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        """Fold the journal into the snapshot file"""
+        with self._lock:
+            self._compact()
 
     def record_exercise(self, exercise: Exercise):
         """Record an exercise and update muscle group counts"""
-        self.data['exercises_done'].append({
-            'description': exercise.description,
-            'time': datetime.now().isoformat()
-        })
-
-        for muscle_group in exercise.muscle_groups:
-            mg_name = muscle_group.value
-            self.data['muscle_groups_worked'][mg_name] = \
-                self.data['muscle_groups_worked'].get(mg_name, 0) + 1
-
         # Don't increment total_breaks here - it's done in record_break()
-        self.save()
+        self._record('exercise', description=exercise.description,
+                     muscles=[mg.value for mg in exercise.muscle_groups])
 
     def record_stretch(self, stretch: Stretch):
         """Record a stretch and update muscle group counts"""
-        self.data['stretches_done'].append({
-            'description': stretch.description,
-            'time': datetime.now().isoformat()
-        })
-
-        for muscle_group in stretch.muscle_groups:
-            mg_name = muscle_group.value
-            self.data['muscle_groups_worked'][mg_name] = \
-                self.data['muscle_groups_worked'].get(mg_name, 0) + 1
-
         # Don't increment total_breaks here - it's done in record_break()
-        self.save()
+        self._record('stretch', description=stretch.description,
+                     muscles=[mg.value for mg in stretch.muscle_groups])
 
     def record_break_shown(self):
         """Record that a break was shown to the user"""
-        self.load_daily_data()  # Check if it's a new day
-        self.data.setdefault('breaks_shown', 0)
-        self.data['breaks_shown'] += 1
-        self.data['total_breaks'] += 1  # Keep for backward compatibility
-        self.save()
+        get_metrics().counter("break.shown").inc()
+        self._record('shown')
 
     def record_break_completed(self):
         """Record that a break was completed (user stayed for full duration)"""
-        self.load_daily_data()
-        self.data.setdefault('breaks_completed', 0)
-        self.data['breaks_completed'] += 1
-        self.save()
+        get_metrics().counter("break.completed").inc()
+        self._record('completed')
 
     def record_break_escaped(self):
         """Record that a break was escaped early"""
-        self.load_daily_data()
-        self.data.setdefault('breaks_escaped', 0)
-        self.data['breaks_escaped'] += 1
-        self.save()
+        get_metrics().counter("break.escaped").inc()
+        self._record('escaped')
 
     def record_break(self):
         """Legacy method - now just records shown"""
@@ -128,39 +223,50 @@ class DailyTracker:
 
     def reset_daily_data(self):
         """Manually reset daily tracking data"""
+        self._record('reset')
+
+    def _ensure_today(self):
+        """Start a fresh day in memory once the date has changed"""
         today = date.today().isoformat()
-        self.data = {
-            'date': today,
-            'muscle_groups_worked': {},
-            'exercises_done': [],
-            'stretches_done': [],
-            'total_breaks': 0,
-            'breaks_completed': 0,
-            'breaks_escaped': 0,
-            'breaks_shown': 0
-        }
-        self.save()
+        if self.data['date'] != today:
+            with self._lock:
+                if self.data['date'] != today:
+                    self._set_data(self._empty_day(today))
+                    self._compact()
+                    rolled_over = True
+                else:
+                    rolled_over = False
+            if rolled_over:
+                self._changed('day')
 
     def get_least_worked_muscles(self) -> List[MuscleGroup]:
         """Get muscle groups that need more attention"""
-        all_muscles = list(MuscleGroup)
-        worked = self.data['muscle_groups_worked']
-
-        # Sort by work count (ascending)
-        sorted_muscles = sorted(
-            all_muscles,
-            key=lambda mg: worked.get(mg.value, 0)
-        )
-
-        # Return least worked (bottom 50%)
-        return sorted_muscles[:len(sorted_muscles)//2]
+        self._ensure_today()
+        # Least worked (bottom 50%), ties in MuscleGroup order
+        return list(self.ranking.least_worked())
 
     def get_coverage_stats(self) -> Dict:
         """Get statistics about today's coverage"""
+        self._ensure_today()
+        return dict(self._cached('coverage_stats', self._compute_coverage_stats))
+
+    def _compute_coverage_stats(self) -> Dict:
         total_muscle_groups = len(MuscleGroup)
 
+        history = getattr(self, 'history', None)
+        if history is not None:
+            counts = history.activity_counts()
+        else:
+            counts = {
+                'shown': self.data.get('breaks_shown', self.data.get('total_breaks', 0)),
+                'completed': self.data.get('breaks_completed', 0),
+                'escaped': self.data.get('breaks_escaped', 0),
+                'exercise': len(self.data.get('exercises_done', [])),
+                'stretch': len(self.data.get('stretches_done', [])),
+            }
+
         # Only count muscle groups based on COMPLETED breaks
-        completed = self.data.get('breaks_completed', 0)
+        completed = counts.get('completed', 0)
 
         # Clear logic: no completed breaks = no muscle work
         if completed == 0:
@@ -173,20 +279,27 @@ class DailyTracker:
 
         return {
             'total_breaks': completed,  # Show completed count as total
-            'breaks_shown': self.data.get('breaks_shown', self.data.get('total_breaks', 0)),
+            'breaks_shown': counts.get('shown', 0),
             'breaks_completed': completed,
-            'breaks_escaped': self.data.get('breaks_escaped', 0),
+            'breaks_escaped': counts.get('escaped', 0),
             'muscle_groups_covered': worked_groups,
             'total_muscle_groups': total_muscle_groups,
             'coverage_percentage': (worked_groups / total_muscle_groups) * 100 if total_muscle_groups > 0 else 0,
-            'exercises_done': len(self.data.get('exercises_done', [])),  # Actual exercise count
-            'stretches_done': len(self.data.get('stretches_done', []))   # Actual stretch count
+            'exercises_done': counts.get('exercise', 0),  # Actual exercise count
+            'stretches_done': counts.get('stretch', 0)    # Actual stretch count
         }
 
     def get_body_map_data(self) -> Dict[str, int]:
         """Get muscle group work counts for visualization"""
+        self._ensure_today()
+        return dict(self._cached('body_map_data', self._compute_body_map_data))
+
+    def _compute_body_map_data(self) -> Dict[str, int]:
+        history = getattr(self, 'history', None)
+        if history is not None:
+            return history.muscle_counts()
         # Return the actual muscle groups worked data
-        return self.data.get('muscle_groups_worked', {})
+        return dict(self.data.get('muscle_groups_worked', {}))
 
 
 class SmartMessageGenerator:
@@ -199,16 +312,24 @@ class SmartMessageGenerator:
         self.last_stretch = None   # Store last generated stretch
         self.initialize_pools()
 
+        from .config import get_settings_store
+        get_settings_store().subscribe(self._on_settings_changed)
+
+    def _on_settings_changed(self, settings, changed):
+        """Refresh the pools when the position preference changes"""
+        if 'position_preference' in changed:
+            self.initialize_pools()
+
     def initialize_pools(self):
         """Initialize exercise and stretch pools with position filtering"""
-        from .config import load_settings
+        from .config import get_settings
 
-        settings = load_settings()
+        settings = get_settings()
         position_preference = getattr(settings, 'position_preference', 'sitting_standing')
 
         # Apply position filtering
-        self.exercise_pool = filter_exercises_by_position(EXERCISES.copy(), position_preference)
-        self.stretch_pool = filter_stretches_by_position(STRETCHES.copy(), position_preference)
+        self.exercise_index = get_catalog_index("exercise", position_preference)
+        self.stretch_index = get_catalog_index("stretch", position_preference)
         # Simple default motivations
         self.motivation_pool = [
             "Nice break! Posture reset complete.",
@@ -217,8 +338,6 @@ class SmartMessageGenerator:
             "Back thanks you."
         ]
 
-        random.shuffle(self.exercise_pool)
-        random.shuffle(self.stretch_pool)
         random.shuffle(self.motivation_pool)
 
     def record_last_activity_completion(self):
@@ -235,15 +354,8 @@ class SmartMessageGenerator:
         """Get exercise targeting least-worked muscle groups"""
         least_worked = self.tracker.get_least_worked_muscles()
 
-        # Try to find exercise targeting least-worked muscles
-        candidates = [e for e in self.exercise_pool
-                     if any(mg in least_worked for mg in e.muscle_groups)]
-
-        if candidates:
-            exercise = random.choice(candidates)
-        else:
-            # Fallback to random if no match
-            exercise = random.choice(self.exercise_pool)
+        # Exercise targeting least-worked muscles, or any exercise if none does
+        exercise = self.exercise_index.choose(least_worked)
 
         # Only record if explicitly requested (when break is completed)
         if record_now:
@@ -254,15 +366,8 @@ class SmartMessageGenerator:
         """Get stretch targeting least-worked muscle groups"""
         least_worked = self.tracker.get_least_worked_muscles()
 
-        # Try to find stretch targeting least-worked muscles
-        candidates = [s for s in self.stretch_pool
-                     if any(mg in least_worked for mg in s.muscle_groups)]
-
-        if candidates:
-            stretch = random.choice(candidates)
-        else:
-            # Fallback to random if no match
-            stretch = random.choice(self.stretch_pool)
+        # Stretch targeting least-worked muscles, or any stretch if none does
+        stretch = self.stretch_index.choose(least_worked)
 
         # Only record if explicitly requested (when break is completed)
         if record_now:
@@ -345,6 +450,15 @@ class SmartMessageGenerator:
         return summary
 
 
+@dataclass
+class ComposedMessage:
+    """A break message and the activities behind it, not yet committed"""
+    message: Dict[str, str]
+    stretch: Optional[Stretch] = None
+    exercise: Optional[Exercise] = None
+    alternation: Optional[str] = None  # Activity shown by a short "both" break, for alternating
+
+
 # Legacy TinyPhraseLM class for backwards compatibility
 class TinyPhraseLM:
     """
@@ -403,104 +517,36 @@ class TinyPhraseLM:
 
         return selected
 
-    def _adjust_duration_in_text(self, text: str, max_duration: int) -> str:
-        """Adjust duration in exercise/stretch text based on break duration."""
-        import re
-
-        # Handle "X sec each" patterns - divide by 2 for each side
-        def replace_each_sec(match):
-            seconds = int(match.group(1))
-            adjusted = min(seconds, max_duration // 2)
-            adjusted = max(3, adjusted)  # Minimum 3 seconds
-            return f"{adjusted} sec each"
-
-        text = re.sub(r'(\d+) sec each', replace_each_sec, text)
-
-        # Handle "X seconds each" patterns - divide by 2
-        def replace_each_seconds(match):
-            seconds = int(match.group(1))
-            adjusted = min(seconds, max_duration // 2)
-            adjusted = max(3, adjusted)  # Minimum 3 seconds
-            return f"{adjusted} seconds each"
-
-        text = re.sub(r'(\d+) seconds each', replace_each_seconds, text)
-
-        # Handle regular "X seconds" patterns
-        def replace_seconds(match):
-            seconds = int(match.group(1))
-            adjusted = min(seconds, max_duration)
-            adjusted = max(3, adjusted)  # Minimum 3 seconds
-            return f"{adjusted} seconds"
-
-        text = re.sub(r'(\d+) seconds(?! each)', replace_seconds, text)
-
-        # Handle "X-Y seconds" patterns
-        def replace_range_seconds(match):
-            low = int(match.group(1))
-            high = int(match.group(2))
-            adj_high = min(high, max_duration)
-            adj_low = min(low, adj_high - 5, max_duration - 10)
-            adj_low = max(3, adj_low)
-            adj_high = max(adj_low + 5, adj_high)
-            return f"{adj_low}-{adj_high} seconds"
-
-        text = re.sub(r'(\d+)-(\d+) seconds', replace_range_seconds, text)
-
-        # Handle "X times each" patterns - divide by 2
-        def replace_each_times(match):
-            times = int(match.group(1))
-            # Calculate time per rep (assume 2 seconds per rep)
-            total_time = times * 2
-            if total_time > max_duration // 2:
-                adjusted_times = max(3, max_duration // 4)  # 2 seconds per rep, divided by 2 for each side
-                return f"{adjusted_times} times each"
-            return match.group(0)
-
-        text = re.sub(r'(\d+) times each', replace_each_times, text)
-
-        # Handle regular "X times" patterns
-        def replace_times(match):
-            times = int(match.group(1))
-            # Calculate time per rep (assume 2 seconds per rep)
-            total_time = times * 2
-            if total_time > max_duration:
-                adjusted_times = max(3, max_duration // 2)
-                return f"{adjusted_times} times"
-            return match.group(0)
-
-        text = re.sub(r'(\d+) times(?! each)', replace_times, text)
-
-        # Handle "hold X sec" patterns (both with and without 'onds')
-        text = re.sub(r'hold (\d+) sec(?:onds?)?(?:\b|,)',
-                     lambda m: f'hold {min(int(m.group(1)), max_duration)} sec,', text)
+    def _pick_stretch(self, max_duration: int) -> Tuple[Stretch, str]:
+        """Choose a stretch and render its text, without remembering the choice"""
+        from .content_templates import render_activity
 
-        return text
+        stretch = self._get_generator().get_smart_stretch()
+        # Translated text with durations fitted to the break
+        return stretch, render_activity("stretch", stretch.description, max_duration, self.language)
+
+    def _pick_exercise(self, max_duration: int) -> Tuple[Exercise, str]:
+        """Choose an exercise and render its text, without remembering the choice"""
+        from .content_templates import render_activity
+
+        exercise = self._get_generator().get_smart_exercise()
+        return exercise, render_activity("exercise", exercise.description, max_duration, self.language)
 
     def get_unique_stretch(self, max_duration: int = 20):
         """Get a stretch using smart distribution"""
-        generator = self._get_generator()
-        stretch = generator.get_smart_stretch()
+        stretch, text = self._pick_stretch(max_duration)
         # Store for later recording when break completes
-        generator.last_stretch = stretch
         # Don't clear last_exercise here - we might have both
-
-        # Translate first, then adjust duration
-        from .fitness_translations import translate_stretch
-        translated = translate_stretch(stretch.description, self.language)
-        return self._adjust_duration_in_text(translated, max_duration)
+        self._get_generator().last_stretch = stretch
+        return text
 
     def get_unique_exercise(self, max_duration: int = 20):
         """Get an exercise using smart distribution"""
-        generator = self._get_generator()
-        exercise = generator.get_smart_exercise()
+        exercise, text = self._pick_exercise(max_duration)
         # Store for later recording when break completes
-        generator.last_exercise = exercise
         # Don't clear last_stretch here - we might have both
-
-        # Translate first, then adjust duration
-        from .fitness_translations import translate_exercise
-        translated = translate_exercise(exercise.description, self.language)
-        return self._adjust_duration_in_text(translated, max_duration)
+        self._get_generator().last_exercise = exercise
+        return text
 
     def generate_stretch_message(self, count_break: bool = False, break_seconds: int = 30) -> str:
         """Generate a stretching-focused message."""
@@ -536,21 +582,28 @@ class TinyPhraseLM:
 
     def generate_combined_message(self, break_seconds: int = 60, count_break: bool = True) -> str:
         """Generate a message based on user's activity type preference and break duration."""
-        from .config import load_settings
+        composed = self.compose_message(break_seconds)
+        self.commit_message(composed, count_break)
+        return composed.message
+
+    @traced("lm.compose")
+    def compose_message(self, break_seconds: int = 60) -> ComposedMessage:
+        """Choose and render a break message without recording anything.
+
+        Safe to run ahead of time (see prefetch.py); nothing changes until the
+        result is passed to commit_message when the break is shown.
+        """
+        from .config import get_settings
         from .fitness_translations import translate_motivation, get_fitness_translation
 
-        settings = load_settings()
+        settings = get_settings()
         activity_type = getattr(settings, 'activity_type', 'both')
 
-        # Track break if needed (this also generates and stores the activity)
-        if count_break:
-            generator = self._get_generator()
-            generator.tracker.record_break_shown()
-
         # Get a random motivation and translate it
         motivation = self.choice(self.MOTIVATIONS)
         motivation = translate_motivation(motivation, self.language)
 
+        alternation = None
         if break_seconds < 60:
             # For breaks under 1 minute, alternate between stretch and exercise (don't show both)
             if activity_type == "both":
@@ -559,76 +612,57 @@ class TinyPhraseLM:
                     next_activity = "exercise" if self._last_activity == "stretch" else "stretch"
                 else:
                     next_activity = "stretch"  # Start with stretch
-                self._last_activity = next_activity
+                alternation = next_activity
             elif activity_type == "stretch":
                 next_activity = "stretch"
             elif activity_type == "exercise":
                 next_activity = "exercise"
             else:
                 next_activity = "stretch"  # Default fallback
-
-            if next_activity == "stretch":
-                stretch = self.get_unique_stretch(break_seconds)
-                # Clear exercise since we're only showing stretch
-                generator = self._get_generator()
-                generator.last_exercise = None
-                # Translation already done in get_unique_stretch
-                return {
-                    'title': get_fitness_translation('time_to_stretch', self.language),
-                    'single_activity': stretch,
-                    'motivation': motivation
-                }
-            else:
-                exercise = self.get_unique_exercise(break_seconds)
-                # Clear stretch since we're only showing exercise
-                generator = self._get_generator()
-                generator.last_stretch = None
-                # Translation already done in get_unique_exercise
-                return {
-                    'title': get_fitness_translation('movement_time', self.language),
-                    'single_activity': exercise,
-                    'motivation': motivation
-                }
         else:
             # For breaks 1+ minutes, split time between activities based on preference
-            if activity_type == "stretch":
-                stretch = self.get_unique_stretch(break_seconds)
-                # Clear exercise since we're only showing stretch
-                generator = self._get_generator()
-                generator.last_exercise = None
-                # Translation already done in get_unique_stretch
-                return {
-                    'title': get_fitness_translation('time_to_stretch', self.language),
-                    'single_activity': stretch,
-                    'motivation': motivation
-                }
-            elif activity_type == "exercise":
-                exercise = self.get_unique_exercise(break_seconds)
-                # Clear stretch since we're only showing exercise
-                generator = self._get_generator()
-                generator.last_stretch = None
-                # Translation already done in get_unique_exercise
-                return {
-                    'title': get_fitness_translation('movement_time', self.language),
-                    'single_activity': exercise,
-                    'motivation': motivation
-                }
-            else:  # activity_type == "both"
-                # Split time between both activities
-                half_time = break_seconds // 2
-                stretch = self.get_unique_stretch(half_time)
-                exercise = self.get_unique_exercise(half_time)
-
-                # Translation already done in get_unique_stretch and get_unique_exercise
-
-                return {
-                    'title': get_fitness_translation('wellness_break', self.language),
-                    'stretch_header': get_fitness_translation('stretch_header', self.language),
-                    'stretch_text': stretch,
-                    'exercise_header': get_fitness_translation('exercise_header', self.language),
-                    'exercise_text': exercise,
-                    'motivation': motivation
-                }
+            next_activity = activity_type if activity_type in ("stretch", "exercise") else "both"
+
+        if next_activity == "stretch":
+            # Only the stretch is shown, so no exercise gets recorded
+            stretch, text = self._pick_stretch(break_seconds)
+            return ComposedMessage({
+                'title': get_fitness_translation('time_to_stretch', self.language),
+                'single_activity': text,
+                'motivation': motivation
+            }, stretch=stretch, alternation=alternation)
+        if next_activity == "exercise":
+            exercise, text = self._pick_exercise(break_seconds)
+            return ComposedMessage({
+                'title': get_fitness_translation('movement_time', self.language),
+                'single_activity': text,
+                'motivation': motivation
+            }, exercise=exercise, alternation=alternation)
+
+        # Split time between both activities
+        half_time = break_seconds // 2
+        stretch, stretch_text = self._pick_stretch(half_time)
+        exercise, exercise_text = self._pick_exercise(half_time)
+        return ComposedMessage({
+            'title': get_fitness_translation('wellness_break', self.language),
+            'stretch_header': get_fitness_translation('stretch_header', self.language),
+            'stretch_text': stretch_text,
+            'exercise_header': get_fitness_translation('exercise_header', self.language),
+            'exercise_text': exercise_text,
+            'motivation': motivation
+        }, stretch=stretch, exercise=exercise)
+
+    @traced("lm.commit")
+    def commit_message(self, composed: ComposedMessage, count_break: bool = True) -> None:
+        """Record a composed message as the one being shown"""
+        generator = self._get_generator()
+        if count_break:
+            generator.tracker.record_break_shown()
+        # Stored for recording when the break completes
+        generator.last_stretch = composed.stretch
+        generator.last_exercise = composed.exercise
+        if composed.alternation:
+            self._last_activity = composed.alternation
 
     def sentence(self, count_break: bool = True) -> str:
         """Generate a random break message with smart distribution."""
@@ -656,12 +690,15 @@ class TinyPhraseLM:
 
 # Module-level instance for easy access
 _default_generator = None
+_default_generator_lock = threading.Lock()  # The break prefetch worker may get here first
 
 def get_generator() -> SmartMessageGenerator:
     """Get the default message generator instance"""
     global _default_generator
     if _default_generator is None:
-        _default_generator = SmartMessageGenerator()
+        with _default_generator_lock:
+            if _default_generator is None:
+                _default_generator = SmartMessageGenerator()
     return _default_generator
 
 def generate_message(include_emojis: bool = True, count_break: bool = True) -> str:
@@ -5,85 +5,88 @@ from typing import Callable, Optional
 import logging
 from .themes import THEMES, Theme
 from .translations import get_translation
-from .config import load_settings
+from .config import get_settings
+from .monitors import primary_monitor
 
 
-class ToastNotification:
-    """A themed toast notification that appears in the corner."""
+def _lighten_color(color: str) -> str:
+    """Lighten a hex color by 20%."""
+    if color.startswith("#"):
+        color = color[1:]
 
-    def __init__(self, root: tk.Tk, message: str, countdown: int,
-                 on_break_now: Optional[Callable] = None,
-                 on_snooze: Optional[Callable] = None,
-                 on_timeout: Optional[Callable] = None,
-                 theme_id: str = "dark",
-                 flash_mode: bool = False,
-                 flash_duration: int = 3,
-                 language: str = None):
-        self.root = root
-        self.message = message
-        self.countdown = countdown
-        self.on_break_now = on_break_now
-        self.on_snooze = on_snooze
-        self.on_timeout = on_timeout
-        self.remaining = countdown
-        self.dismissed = False
-        self.theme = THEMES.get(theme_id, THEMES["dark"])
-        self.flash_mode = flash_mode
-        self.flash_duration = flash_duration
+    # Handle 3-char hex codes
+    if len(color) == 3:
+        color = ''.join([c*2 for c in color])
 
-        # Get language for translations
-        if language is None:
-            settings = load_settings()
-            self.language = settings.language
-        else:
-            self.language = language
+    try:
+        r, g, b = int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
+        r = min(255, int(r + (255 - r) * 0.2))
+        g = min(255, int(g + (255 - g) * 0.2))
+        b = min(255, int(b + (255 - b) * 0.2))
+        return f"#{r:02x}{g:02x}{b:02x}"
+    except:
+        return color
+
+
+def _darken_color(color: str) -> str:
+    """Darken a hex color by 20%."""
+    if color.startswith("#"):
+        color = color[1:]
+
+    # Handle 3-char hex codes
+    if len(color) == 3:
+        color = ''.join([c*2 for c in color])
+
+    try:
+        r, g, b = int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
+        r = max(0, int(r * 0.8))
+        g = max(0, int(g * 0.8))
+        b = max(0, int(b * 0.8))
+        return f"#{r:02x}{g:02x}{b:02x}"
+    except:
+        return color
+
+
+class _ToastShell:
+    """A withdrawn toast window and its widgets, reused across pre-warnings.
+
+    Buttons act on whichever ToastNotification currently owns the shell.
+    """
+
+    def __init__(self, root: tk.Tk, theme_id: str, flash_mode: bool):
+        self.theme_id = theme_id
+        self.flash_mode = flash_mode
+        self.theme = THEMES.get(theme_id, THEMES["dark"])
+        self.owner: Optional["ToastNotification"] = None
+        theme = self.theme
 
         # Create toast window
         self.win = tk.Toplevel(root)
-        self.win.title(get_translation("app_name", self.language))
+        self.win.withdraw()
         self.win.overrideredirect(True)  # No title bar
         self.win.attributes("-topmost", True)
 
-        # Set transparency
-        self.win.attributes("-alpha", 0.0)  # Start invisible for fade-in
-
-        # Configure window size and position
-        if flash_mode:
-            width = 350  # Increased from 280 for better text fit
-            height = 90  # Slightly taller
-        else:
-            width = 320
-            height = 120
-
-        # Get screen dimensions
-        screen_width = root.winfo_screenwidth()
-        screen_height = root.winfo_screenheight()
-
-        # Position in bottom-right corner with padding
+        # Configure window size
         if flash_mode:
-            # Center horizontally, slightly above center vertically
-            x = (screen_width - width) // 2
-            y = (screen_height - height) // 2 - 100
+            self.width = 350  # Increased from 280 for better text fit
+            self.height = 90  # Slightly taller
         else:
-            padding = 20
-            x = screen_width - width - padding
-            y = screen_height - height - padding - 50  # Extra padding for taskbar
-
-        self.win.geometry(f"{width}x{height}+{x}+{y}")
+            self.width = 320
+            self.height = 120
 
         # Apply theme colors
-        self.win.configure(bg=self.theme.background)
+        self.win.configure(bg=theme.background)
 
         # Create rounded corner effect with frame
-        main_frame = tk.Frame(self.win, bg=self.theme.background, padx=15, pady=10)
+        main_frame = tk.Frame(self.win, bg=theme.background, padx=15, pady=10)
         main_frame.pack(fill="both", expand=True)
 
         # Header with app branding and close button
-        header_frame = tk.Frame(main_frame, bg=self.theme.background)
+        header_frame = tk.Frame(main_frame, bg=theme.background)
         header_frame.pack(fill="x", pady=(0, 5))
 
         # App icon and title (more compact)
-        title_frame = tk.Frame(header_frame, bg=self.theme.background)
+        title_frame = tk.Frame(header_frame, bg=theme.background)
         title_frame.pack(side="left")
 
         # Fitness emoji icon (smaller)
@@ -91,109 +94,90 @@ class ToastNotification:
             title_frame,
             text="🏃",
             font=("Segoe UI Emoji", 16),
-            fg=self.theme.accent,
-            bg=self.theme.background
+            fg=theme.accent,
+            bg=theme.background
         )
         icon_label.pack(side="left", padx=(0, 8))
 
         # Title and message in one line
-        title_label = tk.Label(
+        self.title_label = tk.Label(
             title_frame,
-            text=get_translation("app_name", self.language),
             font=("Segoe UI", 11, "bold"),
-            fg=self.theme.text_primary,
-            bg=self.theme.background
+            fg=theme.text_primary,
+            bg=theme.background
         )
-        title_label.pack(side="left")
+        self.title_label.pack(side="left")
 
-        if flash_mode:
-            tk.Label(
-                title_frame,
-                text=get_translation("toast_subtitle_reminder", self.language),
-                font=("Segoe UI", 10),
-                fg=self.theme.accent,
-                bg=self.theme.background
-            ).pack(side="left")
-        else:
-            tk.Label(
-                title_frame,
-                text=get_translation("toast_subtitle_coming", self.language),
-                font=("Segoe UI", 10),
-                fg=self.theme.text_secondary,
-                bg=self.theme.background
-            ).pack(side="left")
+        self.subtitle_label = tk.Label(
+            title_frame,
+            font=("Segoe UI", 10),
+            fg=theme.accent if flash_mode else theme.text_secondary,
+            bg=theme.background
+        )
+        self.subtitle_label.pack(side="left")
 
         # Close button - hide in flash mode
         if not flash_mode:
-            close_frame = tk.Frame(header_frame, bg=self.theme.background)
+            close_frame = tk.Frame(header_frame, bg=theme.background)
             close_frame.pack(side="right", fill="y")
 
             close_btn = tk.Button(
                 close_frame,
                 text="✕",
                 font=("Segoe UI", 10),
-                fg=self.theme.text_secondary,
-                bg=self.theme.background,
+                fg=theme.text_secondary,
+                bg=theme.background,
                 bd=0,
                 padx=5,
                 pady=2,
                 cursor="hand2",
-                command=self._dismiss,
-                activebackground=self.theme.background
+                command=lambda: self._owner_call("_dismiss"),
+                activebackground=theme.background
             )
             close_btn.pack()
 
         # Countdown section (more compact)
-        self.countdown_frame = tk.Frame(main_frame, bg=self.theme.background)
-        self.countdown_frame.pack(fill="x", pady=(5, 5))
+        countdown_frame = tk.Frame(main_frame, bg=theme.background)
+        countdown_frame.pack(fill="x", pady=(5, 5))
 
         # Inline countdown with message
-        countdown_container = tk.Frame(self.countdown_frame, bg=self.theme.background)
+        countdown_container = tk.Frame(countdown_frame, bg=theme.background)
         countdown_container.pack()
 
         if flash_mode:
-            # For flash mode, show message with static time info (no countdown)
-            # Use the initial countdown value, not the remaining time
-            if countdown <= 60:
-                time_text = f"{countdown} seconds"
-            else:
-                minutes = countdown // 60
-                time_text = f"{minutes} minute{'s' if minutes != 1 else ''}"
-
-            flash_msg = f"Break coming in {time_text}!"
+            # Message with static time info (no countdown)
             self.msg_label = tk.Label(
                 countdown_container,
-                text=flash_msg,
                 font=("Segoe UI", 12, "bold"),  # Slightly larger for readability
-                fg=self.theme.accent,
-                bg=self.theme.background,
+                fg=theme.accent,
+                bg=theme.background,
                 wraplength=320  # Wrap text if needed
             )
             self.msg_label.pack()
+            self.countdown_label = None
         else:
             # Normal mode with countdown
             self.msg_label = tk.Label(
                 countdown_container,
-                text=message,
                 font=("Segoe UI", 10),
-                fg=self.theme.text_primary,
-                bg=self.theme.background
+                fg=theme.text_primary,
+                bg=theme.background
             )
             self.msg_label.pack(side="left")
 
             # Countdown display for normal mode only
             self.countdown_label = tk.Label(
                 countdown_container,
-                text=f" {self.remaining}s",
                 font=("Segoe UI", 14, "bold"),
-                fg=self.theme.accent,
-                bg=self.theme.background
+                fg=theme.accent,
+                bg=theme.background
             )
             self.countdown_label.pack(side="left")
 
-        # Action buttons - hide in flash mode
+        # Action buttons - hide in flash mode; packed per toast
+        self.break_btn = self.snooze_btn = None
         if not flash_mode:
-            btn_frame = tk.Frame(main_frame, bg=self.theme.background)
+            btn_frame = tk.Frame(main_frame, bg=theme.background)
             btn_frame.pack(fill="x", pady=(3, 0))
 
             # Simplified button creation
@@ -202,27 +186,161 @@ class ToastNotification:
                     parent,
                     text=text,
                     font=("Segoe UI", 9, "bold" if is_primary else "normal"),
-                    fg=self.theme.background if is_primary else self.theme.text_primary,
-                    bg=self.theme.accent if is_primary else self._darken_color(self.theme.background),
+                    fg=theme.background if is_primary else theme.text_primary,
+                    bg=theme.accent if is_primary else _darken_color(theme.background),
                     bd=0,
                     padx=12,
                     pady=4,
                     cursor="hand2",
                     command=command,
-                    activebackground=self._lighten_color(
-                        self.theme.accent if is_primary else self._darken_color(self.theme.background)
+                    activebackground=_lighten_color(
+                        theme.accent if is_primary else _darken_color(theme.background)
                     )
                 )
                 return btn
 
-            # Create buttons
-            if on_break_now:
-                break_btn = create_button(btn_frame, "Start now", self._break_now, is_primary=True)
-                break_btn.pack(side="left", padx=(0, 8))
+            self.break_btn = create_button(btn_frame, "Start now", lambda: self._owner_call("_break_now"),
+                                           is_primary=True)
+            self.snooze_btn = create_button(btn_frame, "Snooze", lambda: self._owner_call("_snooze"))
+
+    def _owner_call(self, method: str):
+        if self.owner is not None:
+            getattr(self.owner, method)()
+
+    def show_buttons(self, break_now: bool, snooze: bool):
+        for btn, visible, pack_args in ((self.break_btn, break_now, {"padx": (0, 8)}),
+                                        (self.snooze_btn, snooze, {})):
+            if btn is None:
+                continue
+            btn.pack_forget()
+            if visible:
+                btn.pack(side="left", **pack_args)
+
+    def place(self, monitor):
+        """Position the window for this kind of toast on a monitor (x, y, width, height)."""
+        left, top, screen_width, screen_height = monitor
+        if self.flash_mode:
+            # Center horizontally, slightly above center vertically
+            x = left + (screen_width - self.width) // 2
+            y = top + (screen_height - self.height) // 2 - 100
+        else:
+            # Bottom-right corner with padding
+            padding = 20
+            x = left + screen_width - self.width - padding
+            y = top + screen_height - self.height - padding - 50  # Extra padding for taskbar
+        self.win.geometry(f"{self.width}x{self.height}+{x}+{y}")
+
+    def destroy(self):
+        try:
+            self.win.destroy()
+        except tk.TclError:
+            pass
+
 
-            if on_snooze:
-                snooze_btn = create_button(btn_frame, "Snooze", self._snooze)
-                snooze_btn.pack(side="left")
+class ToastPool:
+    """Toast windows kept withdrawn between pre-warnings.
+
+    One idle shell per theme and mode is normally all there is; a second is
+    built only while the previous toast is still fading out. Idle shells of a
+    theme that is no longer in use are destroyed.
+    """
+
+    def __init__(self, root: tk.Tk):
+        self.root = root
+        self._shells = []
+
+    def acquire(self, owner: "ToastNotification", theme_id: str, flash_mode: bool) -> _ToastShell:
+        for shell in [s for s in self._shells if s.owner is None and s.theme_id != theme_id]:
+            shell.destroy()
+            self._shells.remove(shell)
+
+        for shell in self._shells:
+            if shell.owner is None and shell.flash_mode == flash_mode:
+                break
+        else:
+            shell = _ToastShell(self.root, theme_id, flash_mode)
+            self._shells.append(shell)
+        shell.owner = owner
+        return shell
+
+    def release(self, shell: _ToastShell):
+        shell.owner = None
+        try:
+            shell.win.withdraw()
+        except tk.TclError:
+            # Window is gone (e.g. the app is shutting down)
+            if shell in self._shells:
+                self._shells.remove(shell)
+
+
+_pools = {}
+
+
+def get_toast_pool(root: tk.Tk) -> ToastPool:
+    """The toast pool for a Tk root."""
+    pool = _pools.get(id(root))
+    if pool is None or pool.root is not root:
+        pool = _pools[id(root)] = ToastPool(root)
+    return pool
+
+
+class ToastNotification:
+    """A themed toast notification that appears in the corner."""
+
+    def __init__(self, root: tk.Tk, message: str, countdown: int,
+                 on_break_now: Optional[Callable] = None,
+                 on_snooze: Optional[Callable] = None,
+                 on_timeout: Optional[Callable] = None,
+                 theme_id: str = "dark",
+                 flash_mode: bool = False,
+                 flash_duration: int = 3,
+                 language: str = None):
+        self.root = root
+        self.message = message
+        self.countdown = countdown
+        self.on_break_now = on_break_now
+        self.on_snooze = on_snooze
+        self.on_timeout = on_timeout
+        self.remaining = countdown
+        self.dismissed = False
+        self.theme = THEMES.get(theme_id, THEMES["dark"])
+        self.flash_mode = flash_mode
+        self.flash_duration = flash_duration
+
+        # Get language for translations
+        if language is None:
+            settings = get_settings()
+            self.language = settings.language
+        else:
+            self.language = language
+
+        # Take a pooled toast window and fill it in
+        self._pool = get_toast_pool(root)
+        self._shell = self._pool.acquire(self, theme_id, flash_mode)
+        self.win = self._shell.win
+        app_name = get_translation("app_name", self.language)
+        self.win.title(app_name)
+        self.win.attributes("-alpha", 0.0)  # Start invisible for fade-in
+        self._shell.place(primary_monitor(root))
+        self._shell.title_label.configure(text=app_name)
+
+        if flash_mode:
+            self._shell.subtitle_label.configure(text=get_translation("toast_subtitle_reminder", self.language))
+            # Show message with static time info (no countdown)
+            # Use the initial countdown value, not the remaining time
+            if countdown <= 60:
+                time_text = f"{countdown} seconds"
+            else:
+                minutes = countdown // 60
+                time_text = f"{minutes} minute{'s' if minutes != 1 else ''}"
+            self._shell.msg_label.configure(text=f"Break coming in {time_text}!")
+        else:
+            self._shell.subtitle_label.configure(text=get_translation("toast_subtitle_coming", self.language))
+            self._shell.msg_label.configure(text=message)
+            self.countdown_label = self._shell.countdown_label
+            self.countdown_label.configure(text=f" {self.remaining}s", font=("Segoe UI", 14, "bold"))
+        self._shell.show_buttons(bool(on_break_now), bool(on_snooze))
+        self.win.deiconify()
 
         # Start countdown
         if flash_mode:
@@ -234,41 +352,16 @@ class ToastNotification:
         # Fade in animation
         self._fade_in()
 
+    def _owns_window(self) -> bool:
+        return self._shell.owner is self
+
     def _lighten_color(self, color: str) -> str:
         """Lighten a hex color by 20%."""
-        if color.startswith("#"):
-            color = color[1:]
-
-        # Handle 3-char hex codes
-        if len(color) == 3:
-            color = ''.join([c*2 for c in color])
-
-        try:
-            r, g, b = int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
-            r = min(255, int(r + (255 - r) * 0.2))
-            g = min(255, int(g + (255 - g) * 0.2))
-            b = min(255, int(b + (255 - b) * 0.2))
-            return f"#{r:02x}{g:02x}{b:02x}"
-        except:
-            return color
+        return _lighten_color(color)
 
     def _darken_color(self, color: str) -> str:
         """Darken a hex color by 20%."""
-        if color.startswith("#"):
-            color = color[1:]
-
-        # Handle 3-char hex codes
-        if len(color) == 3:
-            color = ''.join([c*2 for c in color])
-
-        try:
-            r, g, b = int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
-            r = max(0, int(r * 0.8))
-            g = max(0, int(g * 0.8))
-            b = max(0, int(b * 0.8))
-            return f"#{r:02x}{g:02x}{b:02x}"
-        except:
-            return color
+        return _darken_color(color)
 
     def _fade_in(self):
         """Animate the toast appearing with slide and fade."""
@@ -284,7 +377,7 @@ class ToastNotification:
         size = geometry[:plus_index]
 
         def animate():
-            if self.alpha < 0.95 and not self.dismissed:
+            if self.alpha < 0.95 and not self.dismissed and self._owns_window():
                 self.alpha += 0.05
                 self.slide_offset = max(0, self.slide_offset - 3)
 
@@ -312,10 +405,8 @@ class ToastNotification:
                 except:
                     pass  # Window might be destroyed
             else:
-                try:
-                    self.win.destroy()
-                except:
-                    pass
+                # Back to the pool for the next pre-warning
+                self._pool.release(self._shell)
                 if callback:
                     callback()
 
@@ -333,7 +424,7 @@ class ToastNotification:
 
         # Update countdown display with new format
         try:
-            if hasattr(self, 'countdown_label'):  # Only if countdown label exists
+            if getattr(self, 'countdown_label', None) is not None:  # Only if countdown label exists
                 self.countdown_label.configure(text=f" {self.remaining}s")
 
                 # Add pulsing effect for last 5 seconds (adjusted for smaller size)
@@ -344,7 +435,7 @@ class ToastNotification:
                     self.countdown_label.configure(font=("Segoe UI", pulse_size, "bold"))
                     self.win.after(100, lambda: self.countdown_label.configure(
                         font=("Segoe UI", original_size, "bold")
-                    ) if not self.dismissed else None)
+                    ) if not self.dismissed and self._owns_window() else None)
         except:
             pass  # Widget might be destroyed
 
@@ -0,0 +1,198 @@
+"""Span tracing for the break lifecycle, exported as Chrome trace events.
+
+Code marks the stages worth timing:
+
+    from .tracing import span, traced
+
+    with span("overlay.init", monitors=2):
+        ...
+
+    @traced("settings.save")
+    def save_settings(settings): ...
+
+Tracing is off by default; a span then costs one attribute check. Turn it on
+with GITFITDEV_TRACE=1 in the environment or at runtime with
+``gitfitdev ctl trace on``.
+
+Spans are buffered in memory (the newest MAX_EVENTS) and written to
+``~/.gitfitdev/traces/trace-<time>-<label>.json`` after each break has run
+its first countdown tick, on ``ctl trace flush``, when tracing is turned off
+and at exit. The newest MAX_FILES files are kept. They are in the Chrome
+trace_event format: open them at https://ui.perfetto.dev or chrome://tracing.
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+MAX_EVENTS = 20000
+MAX_FILES = 20
+ENV_VAR = "GITFITDEV_TRACE"
+
+
+def _now_us() -> float:
+    return time.perf_counter_ns() / 1000.0
+
+
+class _NullSpan:
+    """Stands in for a span while tracing is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_tracer", "name", "args", "_start")
+
+    def __init__(self, tracer: "Tracer", name: str, args: Dict):
+        self._tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self._start = _now_us()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = _now_us()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self._tracer._add({"name": self.name, "cat": self.name.split(".", 1)[0], "ph": "X",
+                           "ts": self._start, "dur": end - self._start, "args": self.args})
+        return False
+
+
+class Tracer:
+    """Collects spans from every thread and writes them as trace files."""
+
+    def __init__(self, directory: Optional[Path] = None, max_events: int = MAX_EVENTS,
+                 max_files: int = MAX_FILES):
+        self.directory = Path(directory) if directory else Path.home() / ".gitfitdev" / "traces"
+        self.max_files = max_files
+        self.enabled = False
+        self.last_file: Optional[Path] = None
+        self._events = deque(maxlen=max_events)
+        self._threads: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def enable(self):
+        if not self.enabled:
+            self.enabled = True
+            logging.info(f"[Trace] Tracing on; files go to {self.directory}")
+
+    def disable(self):
+        if self.enabled:
+            self.enabled = False
+            self.flush("off")
+            logging.info("[Trace] Tracing off")
+
+    def span(self, name: str, **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def instant(self, name: str, **args):
+        if self.enabled:
+            self._add({"name": name, "cat": name.split(".", 1)[0], "ph": "i", "s": "p",
+                       "ts": _now_us(), "args": args})
+
+    def _add(self, event: Dict):
+        thread = threading.current_thread()
+        event["pid"] = self._pid
+        event["tid"] = thread.ident
+        with self._lock:
+            self._events.append(event)
+            if thread.ident not in self._threads:
+                self._threads[thread.ident] = thread.name
+
+    def flush(self, label: str = "", wait: bool = False) -> Optional[Path]:
+        """Write the buffered events to a new trace file; returns its path (None if nothing to write)."""
+        with self._lock:
+            if not self._events:
+                return None
+            events = list(self._events)
+            self._events.clear()
+            threads = dict(self._threads)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        path = self.directory / f"trace-{stamp}{'-' + label if label else ''}.json"
+        self.last_file = path
+        if wait:
+            self._write(path, events, threads)
+        else:
+            # Serialising a few thousand events is left off the caller's (usually the Tk) thread
+            threading.Thread(target=self._write, args=(path, events, threads), name="TraceWriter",
+                             daemon=True).start()
+        return path
+
+    def _write(self, path: Path, events: List[Dict], threads: Dict[int, str]):
+        metadata = [{"name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": "GitFit.dev"}}]
+        metadata += [{"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+                     for tid, name in threads.items()]
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f, default=str)
+            os.replace(tmp, path)
+            for old in sorted(self.directory.glob("trace-*.json"))[:-self.max_files]:
+                old.unlink()
+        except OSError as e:
+            logging.error(f"[Trace] Failed to write {path.name}: {e}")
+            return
+        logging.info(f"[Trace] Wrote {len(events)} events to {path}")
+
+
+_tracer = Tracer()
+if os.environ.get(ENV_VAR, "") not in ("", "0"):
+    _tracer.enable()
+
+
+def get_tracer() -> Tracer:
+    """The process-wide tracer."""
+    return _tracer
+
+
+def span(name: str, **args):
+    """Context manager timing a block as ``name`` (no-op while tracing is off)."""
+    if not _tracer.enabled:
+        return _NULL_SPAN
+    return _Span(_tracer, name, args)
+
+
+def traced(name: str):
+    """Decorator timing every call of a function as ``name``."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return fn(*args, **kwargs)
+            with _Span(_tracer, name, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+@contextmanager
+def locked(lock, name: str):
+    """Hold ``lock`` for the block, tracing the wait to acquire it as ``name``."""
+    with span(name):
+        lock.acquire()
+    try:
+        yield
+    finally:
+        lock.release()
@@ -1,7 +1,10 @@
 """Utilities for calculating trigger minutes."""
 
+from functools import lru_cache
 from typing import List, Tuple
 
+from .break_calendar import BreakCalendar
+
 
 def get_valid_trigger_minutes(interval_minutes: int) -> List[Tuple[int, str]]:
     """
@@ -54,72 +57,17 @@ def get_valid_trigger_minutes(interval_minutes: int) -> List[Tuple[int, str]]:
 def get_trigger_times_preview(interval_minutes: int, trigger_minute: int,
                              start_hour: int = 9, count: int = 6) -> List[str]:
     """
-    Get a preview of when breaks would occur.
+    Get a preview of when breaks would occur from start_hour until midnight.
     Returns list of time strings (HH:MM format).
     """
-    times = []
-
-    if interval_minutes >= 60:
-        # Hourly or longer intervals
-        hours_per_trigger = interval_minutes // 60
-        current_hour = start_hour
-
-        # Find first valid hour
-        while len(times) < count:
-            times.append(f"{current_hour:02d}:{trigger_minute:02d}")
-            current_hour += hours_per_trigger
-            if current_hour >= 24:
-                break
-    else:
-        # Sub-hourly intervals
-        total_minutes = start_hour * 60 + trigger_minute
-
-        while len(times) < count:
-            hour = total_minutes // 60
-            minute = total_minutes % 60
-            if hour >= 24:
-                break
-            times.append(f"{hour:02d}:{minute:02d}")
-            total_minutes += interval_minutes
-
-    return times
-
-
-def calculate_next_trigger_time(interval_minutes: int, trigger_minute: int,
-                               from_hour: int, from_minute: int) -> Tuple[int, int]:
-    """
-    Calculate the next trigger time based on interval and trigger minute.
-    Returns (hour, minute) tuple.
-    """
-    current_total = from_hour * 60 + from_minute
-
-    if interval_minutes >= 60:
-        # For hourly+ intervals, find next hour that matches
-        hours_per_interval = interval_minutes // 60
+    return list(_preview_times(start_hour, interval_minutes, trigger_minute)[:count])
 
-        # Find the next matching hour
-        if from_minute <= trigger_minute:
-            # Can trigger this hour
-            next_hour = from_hour
-        else:
-            # Need to wait for next interval hour
-            next_hour = from_hour + hours_per_interval
-
-        # Align to interval pattern
-        hours_since_midnight = next_hour
-        while hours_since_midnight % hours_per_interval != 0:
-            next_hour += 1
-            hours_since_midnight = next_hour
-
-        return (next_hour % 24, trigger_minute)
-    else:
-        # For sub-hourly intervals
-        # Find next occurrence of trigger_minute pattern
-        target = trigger_minute
-        while target <= current_total:
-            target += interval_minutes
 
-        return (target // 60, target % 60)
+@lru_cache(maxsize=256)
+def _preview_times(start_hour: int, interval_minutes: int, trigger_minute: int) -> Tuple[str, ...]:
+    # One calendar per option; the dropdowns ask for the same options on every rebuild
+    calendar = BreakCalendar(f"{start_hour:02d}:00", "23:59", interval_minutes, trigger_minute)
+    return tuple(f"{m // 60:02d}:{m % 60:02d}" for m in calendar.minutes)
 
 
 def format_trigger_description(interval_minutes: int, trigger_minute: int) -> str:
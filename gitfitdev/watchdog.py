@@ -0,0 +1,159 @@
+"""Detects stalls of the Tk main loop.
+
+The Tk thread posts a heartbeat every HEARTBEAT_MS with ``after``; a sidecar
+thread watches the heartbeats. A gap of STALL_MS or more beyond the expected
+interval is a stall: its length goes into the ``tk.stall_ms`` histogram and
+the log. While a stall passes DUMP_MS the sidecar writes the stacks of every
+thread (from ``sys._current_frames``) to ``~/.gitfitdev/stalls/``, so the
+report shows what the Tk thread was stuck in. The newest MAX_REPORTS reports
+are kept; entry.py's crash log includes the latest ones.
+
+Time the whole machine was suspended is not counted: when the sidecar itself
+wakes far too late, the next heartbeat gap is ignored.
+"""
+
+import logging
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from .metrics import get_metrics
+
+HEARTBEAT_MS = 50
+STALL_MS = 100
+DUMP_MS = 1000
+MAX_REPORTS = 20
+
+STALL_BUCKETS = (100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+def stalls_dir() -> Path:
+    return Path.home() / ".gitfitdev" / "stalls"
+
+
+def format_stacks(main_ident: Optional[int] = None) -> str:
+    """Stacks of all threads, the main (Tk) thread first."""
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    frames = sys._current_frames()
+    order = sorted(frames, key=lambda ident: (ident != main_ident, names.get(ident, "")))
+    parts = []
+    for ident in order:
+        parts.append(f'Thread "{names.get(ident, "?")}" ({ident}):')
+        parts.append("".join(traceback.format_stack(frames[ident])).rstrip())
+        parts.append("")
+    return "\n".join(parts)
+
+
+def recent_reports(limit: int = 3) -> List[str]:
+    """The newest stall reports, oldest first."""
+    try:
+        paths = sorted(stalls_dir().glob("stall-*.txt"))[-limit:]
+    except OSError:
+        return []
+    reports = []
+    for path in paths:
+        try:
+            reports.append(path.read_text(encoding="utf-8"))
+        except OSError:
+            pass
+    return reports
+
+
+class StallWatchdog:
+    """Heartbeats on the Tk loop, checked from a sidecar thread."""
+
+    def __init__(self, root, heartbeat_ms: int = HEARTBEAT_MS, stall_ms: float = STALL_MS,
+                 dump_ms: float = DUMP_MS):
+        self.root = root
+        self.heartbeat_ms = heartbeat_ms
+        self.stall_ms = stall_ms
+        self.dump_ms = dump_ms
+        self._last_beat = time.monotonic()
+        self._after_id = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._tk_ident = threading.get_ident()
+        metrics = get_metrics()
+        self._stalls = metrics.histogram("tk.stall_ms", STALL_BUCKETS)
+        self._dumps = metrics.counter("tk.stall_dumps")
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._tk_ident = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._after_id = self.root.after(self.heartbeat_ms, self._beat)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="StallWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _beat(self):
+        # Only a timestamp on the Tk thread; everything else happens on the sidecar
+        self._last_beat = time.monotonic()
+        self._after_id = self.root.after(self.heartbeat_ms, self._beat)
+
+    def _run(self):
+        interval = self.heartbeat_ms / 1000
+        check = interval / 2
+        previous_beat = self._last_beat
+        woke = time.monotonic()
+        dumped_for = None
+        while not self._stop.wait(check):
+            now = time.monotonic()
+            suspended = now - woke > max(1.0, 20 * check)
+            woke = now
+            beat = self._last_beat
+            if suspended:
+                previous_beat = beat
+                dumped_for = None
+                continue
+
+            if beat != previous_beat:
+                # The loop ran again: how late was this heartbeat?
+                stall_ms = (beat - previous_beat - interval) * 1000
+                previous_beat = beat
+                if stall_ms >= self.stall_ms:
+                    self._stalls.observe(stall_ms)
+                    logging.warning(f"[Watchdog] Tk main loop stalled for {stall_ms:.0f} ms")
+                continue
+
+            # Still waiting for the heartbeat
+            late_ms = (now - beat - interval) * 1000
+            if late_ms >= self.dump_ms and dumped_for != beat:
+                dumped_for = beat
+                self._dump(late_ms)
+
+    def _dump(self, late_ms: float):
+        self._dumps.inc()
+        now = datetime.now()
+        report = (f"GitFit.dev Tk main loop stall\n"
+                  f"Time: {now.isoformat(timespec='milliseconds')}\n"
+                  f"Stalled for: {late_ms:.0f} ms so far\n\n"
+                  f"{format_stacks(self._tk_ident)}\n")
+        directory = stalls_dir()
+        path = directory / f"stall-{now.strftime('%Y%m%d-%H%M%S-%f')}.txt"
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            path.write_text(report, encoding="utf-8")
+            for old in sorted(directory.glob("stall-*.txt"))[:-MAX_REPORTS]:
+                old.unlink()
+        except OSError as e:
+            logging.error(f"[Watchdog] Failed to write stall report: {e}")
+            return
+        logging.warning(f"[Watchdog] Tk main loop stuck for {late_ms:.0f} ms; stacks in {path}")
@@ -34,11 +34,11 @@ echo "2. COMMAND LINE:"
 echo "   • ./GitFitDev --show-settings"
 echo "   • ./GitFitDev --toggle-pause"
 echo
-echo "3. FILE-BASED CONTROLS:"
-echo "   • touch ~/.gitfitdev/control/show_settings"
-echo "   • touch ~/.gitfitdev/control/toggle_pause"
-echo "   • touch ~/.gitfitdev/control/trigger_break"
-echo "   • touch ~/.gitfitdev/control/quit"
+echo "3. CONTROL COMMANDS:"
+echo "   • ./GitFitDev ctl status"
+echo "   • ./GitFitDev ctl pause | resume | snooze 10"
+echo "   • ./GitFitDev ctl trigger | skip"
+echo "   • ./GitFitDev ctl settings | quit"
 echo
 echo "4. OPTIONAL MINI CONTROL WINDOW:"
 echo "   • touch ~/.gitfitdev/show_mini_control"
@@ -55,11 +55,11 @@ echo "   • Suggested shortcuts:"
 echo "     - Cmd+Option+G: Settings"
 echo "     - Cmd+Option+Shift+G: Pause Toggle"
 echo
-echo "5. FILE-BASED CONTROLS:"
-echo "   • touch ~/.gitfitdev/control/show_settings"
-echo "   • touch ~/.gitfitdev/control/toggle_pause"
-echo "   • touch ~/.gitfitdev/control/trigger_break"
-echo "   • touch ~/.gitfitdev/control/quit"
+echo "5. CONTROL COMMANDS:"
+echo "   • ./GitFitDev ctl status"
+echo "   • ./GitFitDev ctl pause | resume | snooze 10"
+echo "   • ./GitFitDev ctl trigger | skip"
+echo "   • ./GitFitDev ctl settings | quit"
 echo
 echo "6. APPLESCRIPT INTEGRATION:"
 echo "   • Scripts created in ~/Library/Application Scripts/"
@@ -134,9 +134,9 @@ echo "     Menu Title: 'Open Settings'"
 echo "     Keyboard Shortcut: Cmd+Option+G"
 echo "     Script: ~/.gitfitdev/scripts/open_settings.sh"
 echo
-echo "ALTERNATIVE: Use command line or file controls"
+echo "ALTERNATIVE: Use the command line"
 echo "  • Command: ./GitFitDev --show-settings"
-echo "  • Touch file: touch ~/.gitfitdev/control/show_settings"
+echo "  • Control: ./GitFitDev ctl settings"
 echo
 echo "TROUBLESHOOTING:"
 echo
@@ -58,6 +58,9 @@ if [ ! -f "assets/icon.icns" ]; then
     echo -e "${GREEN}✓ Icon created${NC}"
 fi
 
+# Compile the language catalogs
+python3 -m gitfitdev.langpack
+
 # Build with PyInstaller
 echo -e "${YELLOW}Building application...${NC}"
 python3 -m PyInstaller \
@@ -68,6 +71,7 @@ python3 -m PyInstaller \
     --osx-bundle-identifier="${BUNDLE_ID}" \
     --add-data "gitfitdev/lang_en.py:gitfitdev" \
     --add-data "gitfitdev/lang_sk.py:gitfitdev" \
+    --add-data "gitfitdev/catalogs:gitfitdev/catalogs" \
     --hidden-import="gitfitdev.lang_en" \
     --hidden-import="gitfitdev.lang_sk" \
     --hidden-import="pystray._darwin" \